@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""Measure the signature check strict mocks run on every call.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/binder_bench.py
+"""
+from __future__ import annotations
+
+import timeit
+
+from mockito.signature import match_signature, signature
+
+
+NUMBER = 100_000
+
+
+def method(a, b=None, *args, c=None, **kwargs):
+    pass
+
+
+CALLS = [
+    ("positional", (1, 2), {}),
+    ("keywords", (1,), {"b": 2, "c": 3}),
+    ("**kwargs", (1,), {"x": 1, "y": 2}),
+]
+
+
+def bench(args: tuple, kwargs: dict) -> float:
+    sig = signature(method)
+    seconds = min(timeit.repeat(
+        lambda: match_signature(sig, args, kwargs), number=NUMBER, repeat=5
+    ))
+    return seconds / NUMBER * 1e9
+
+
+def main() -> None:
+    print("%-12s  %20s" % ("call", "match_signature (ns)"))
+    for name, args, kwargs in CALLS:
+        print("%-12s  %20.1f" % (name, bench(args, kwargs)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""Measure setting up many chained stubs on the same method.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/chain_setup_bench.py
+
+Each fixture stubs `client.get(<url>).json()` and `client.get(<url>).status`
+for a number of urls, and `cache.get(<n>)` directly.  Every segment looks up
+the continuations of the same-named stubs before it; with the fingerprint
+index the time per stub should not depend on the number of stubs anymore.
+"""
+from __future__ import annotations
+
+import time
+
+from mockito import mock, unstub, when
+
+
+SIZES = (100, 1_000, 5_000)
+
+
+def bench(size: int) -> tuple[float, float]:
+    client = mock()
+    start = time.perf_counter()
+    for n in range(size):
+        url = "https://example.com/%d" % n
+        when(client).get(url).json().thenReturn({"n": n})
+        when(client).get(url).status.thenReturn(200)
+    chained = time.perf_counter() - start
+
+    cache = mock()
+    start = time.perf_counter()
+    for n in range(size):
+        when(cache).get(n).thenReturn(n)
+    direct = time.perf_counter() - start
+
+    unstub()
+    return chained / size * 1e6, direct / size * 1e6
+
+
+def main() -> None:
+    print("%10s  %16s  %16s" % ("stubs", "chained (us)", "direct (us)"))
+    for size in SIZES:
+        print("%10d  %16.1f  %16.1f" % ((size,) + bench(size)))
+
+
+if __name__ == "__main__":
+    main()
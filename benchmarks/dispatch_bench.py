@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""Measure a call to a stubbed method against the number of literal stubs.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/dispatch_bench.py
+
+All stubs are of the form `when(cache).get('user:<n>').thenReturn(n)`.  The
+call hits the oldest stub, the worst case for trying the stubs newest first.
+With a matcher stub registered on top, the cost should stay flat as well.
+"""
+from __future__ import annotations
+
+import timeit
+
+from mockito import mock, unstub, when
+from mockito.matchers import arg_that
+
+
+SIZES = (1, 10, 100, 1_000, 10_000)
+CALLS = 10_000
+
+
+def bench(size: int, with_matcher: bool) -> float:
+    cache = mock()
+    for n in range(size):
+        when(cache).get("user:%d" % n).thenReturn(n)
+    if with_matcher:
+        when(cache).get(arg_that(lambda key: key == "admin")).thenReturn(-1)
+
+    seconds = min(timeit.repeat(
+        lambda: cache.get("user:0"), number=CALLS, repeat=5
+    ))
+    unstub(cache)
+    return seconds / CALLS * 1e9
+
+
+def main() -> None:
+    print("%10s  %14s  %20s" % ("stubs", "call (ns)", "+ matcher stub (ns)"))
+    for size in SIZES:
+        print("%10d  %14.1f  %20.1f" % (
+            size, bench(size, False), bench(size, True)
+        ))
+
+
+if __name__ == "__main__":
+    main()
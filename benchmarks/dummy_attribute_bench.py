@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""Measure calling an unstubbed method of a non-strict `mock()`.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/dummy_attribute_bench.py
+
+This is `m.send(x)` in a hot loop, for a plain and for a specced mock.  The
+attribute lookup alone is shown separately.
+"""
+from __future__ import annotations
+
+import timeit
+
+from mockito import forget_invocations, mock
+
+
+CALLS = 100_000
+
+
+class Channel:
+    def send(self, message):
+        """Send `message`."""
+
+
+def bench(dummy: object) -> tuple[float, float]:
+    lookup = min(timeit.repeat(
+        lambda: dummy.send, number=CALLS, repeat=5  # type: ignore[attr-defined]
+    ))
+    call = min(timeit.repeat(
+        lambda: dummy.send(1), number=CALLS, repeat=5  # type: ignore[attr-defined]
+    ))
+    forget_invocations(dummy)
+    return lookup / CALLS * 1e9, call / CALLS * 1e9
+
+
+def main() -> None:
+    print("%22s  %12s  %12s" % ("", "lookup (ns)", "call (ns)"))
+    for name, dummy in (
+        ("mock()", mock()),
+        ("mock(Channel, False)", mock(Channel, strict=False)),
+    ):
+        print("%22s  %12.1f  %12.1f" % ((name,) + bench(dummy)))
+
+
+if __name__ == "__main__":
+    main()
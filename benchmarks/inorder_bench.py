@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""Measure creating an `InOrder` for several objects.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/inorder_bench.py
+
+The call site is only parsed for error messages, so creating and closing an
+`InOrder` should cost about as much for two objects as for one.
+"""
+from __future__ import annotations
+
+import timeit
+
+from mockito import InOrder, mock
+
+
+ROUNDS = 2_000
+
+
+def main() -> None:
+    mocks = [mock() for _ in range(4)]
+    print("%10s  %14s" % ("objects", "InOrder (us)"))
+    for count in (1, 2, 4):
+        observed = mocks[:count]
+
+        def create() -> None:
+            with InOrder(*observed):
+                pass
+
+        seconds = min(timeit.repeat(create, number=ROUNDS, repeat=3))
+        print("%10d  %14.1f" % (count, seconds / ROUNDS * 1e6))
+
+
+if __name__ == "__main__":
+    main()
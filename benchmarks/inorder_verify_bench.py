@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Measure verifying a long protocol in order, step by step.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/inorder_verify_bench.py
+
+Two mocks take turns, and we verify each call with `InOrder`.  We also
+verify a single mock with the legacy `verify(obj, inorder=True)`.  Both
+should grow linearly with the number of steps.
+"""
+from __future__ import annotations
+
+import time
+import warnings
+
+from mockito import InOrder, mock, verify
+
+
+SIZES = (1_000, 5_000, 10_000)
+
+
+def bench_inorder(size: int) -> float:
+    client, server = mock(), mock()
+    in_order = InOrder(client, server)
+    for step in range(size):
+        client.send(step)
+        server.ack(step)
+
+    start = time.perf_counter()
+    for step in range(size):
+        in_order.verify(client).send(step)
+        in_order.verify(server).ack(step)
+    return time.perf_counter() - start
+
+
+def bench_legacy(size: int) -> float:
+    client = mock()
+    for step in range(size):
+        client.send(step)
+
+    start = time.perf_counter()
+    for step in range(size):
+        verify(client, inorder=True).send(step)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    warnings.simplefilter("ignore", DeprecationWarning)
+    print("%10s  %14s  %14s" % ("steps", "InOrder (ms)", "legacy (ms)"))
+    for size in SIZES:
+        print("%10d  %14.1f  %14.1f" % (
+            size, bench_inorder(size) * 1e3, bench_legacy(size) * 1e3
+        ))
+
+
+if __name__ == "__main__":
+    main()
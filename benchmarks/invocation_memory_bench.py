@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Measure the memory held by one million recorded calls.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/invocation_memory_bench.py
+"""
+from __future__ import annotations
+
+import tracemalloc
+
+from mockito import unstub, when
+
+
+CALLS = 1_000_000
+
+
+class Target:
+    def method(self, *args, **kwargs):
+        pass
+
+
+def bench(call) -> float:
+    target = Target()
+    when(target).method(...).thenReturn(None)
+
+    tracemalloc.start()
+    call(target)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    unstub(target)
+    return current / 2**20
+
+
+def positional(target):
+    for _ in range(CALLS):
+        target.method(1)
+
+
+def keywords(target):
+    for _ in range(CALLS):
+        target.method(1, key=2)
+
+
+def main() -> None:
+    print("%-12s  %12s  %10s" % ("calls", "held (MiB)", "per call"))
+    for name, call in [("f(1)", positional), ("f(1, key=2)", keywords)]:
+        mib = bench(call)
+        print("%-12s  %12.1f  %8.0f B" % (name, mib, mib * 2**20 / CALLS))
+
+
+if __name__ == "__main__":
+    main()
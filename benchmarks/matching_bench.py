@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Measure `MatchingInvocation.matches` per call for typical stub shapes.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/matching_bench.py
+"""
+from __future__ import annotations
+
+import timeit
+
+from mockito import invocation
+from mockito.matchers import ARGS, KWARGS, any_
+from mockito.mocking import Mock
+
+
+NUMBER = 100_000
+
+SHAPES = [
+    ("literals", (1, "two", 3.0), {}, (1, "two", 3.0), {}),
+    ("literals + kwargs", (1, 2), {"a": "x"}, (1, 2), {"a": "x"}),
+    ("matchers", (any_(int), any_(str)), {}, (1, "two"), {}),
+    ("trailing ...", (1, ...), {}, (1, 2, 3), {"a": 1}),
+    ("*args, **kwargs", (1, *ARGS), {**KWARGS}, (1, 2, 3), {"a": 1}),
+    ("mismatch", (1, 2, 3), {}, (1, 2, 4), {}),
+]
+
+
+class Target:
+    pass
+
+
+def bench(params, named_params, call_params, call_named_params) -> float:
+    theMock = Mock(Target, strict=False)
+    stub = invocation.StubbedInvocation(theMock, "method")
+    stub._remember_params(params, named_params)
+    call = invocation.RememberedInvocation(theMock, "method")
+    call._remember_params(call_params, call_named_params)
+
+    seconds = min(timeit.repeat(
+        lambda: stub.matches(call), number=NUMBER, repeat=5
+    ))
+    return seconds / NUMBER * 1e9
+
+
+def main() -> None:
+    print("%-20s  %12s" % ("shape", "matches (ns)"))
+    for name, *shape in SHAPES:
+        print("%-20s  %12.1f" % (name, bench(*shape)))
+
+
+if __name__ == "__main__":
+    main()
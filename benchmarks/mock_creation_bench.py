@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""Measure how fast `mock()` and `spy()` create their objects.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/mock_creation_bench.py
+
+Prints the time per created object and the memory each one keeps alive.
+Stubbing gives a dummy a class of its own, so the last row shows the cost of
+that on top.
+"""
+from __future__ import annotations
+
+import gc
+import timeit
+import tracemalloc
+from typing import Callable
+
+from mockito import mock, spy, unstub, when
+
+
+COUNT = 10_000
+
+
+class Spec:
+    def get(self, key):
+        pass
+
+
+def stubbed() -> object:
+    dummy = mock()
+    when(dummy).get(1).thenReturn(2)
+    return dummy
+
+
+FACTORIES: dict[str, Callable[[], object]] = {
+    "mock()": mock,
+    "mock(strict=True)": lambda: mock(strict=True),
+    "mock(Spec)": lambda: mock(Spec),
+    "mock({...})": lambda: mock({"status": 200}),
+    "spy(obj)": lambda: spy(Spec()),
+    "mock() + when()": stubbed,
+}
+
+
+def bench(factory: Callable[[], object]) -> tuple[float, float]:
+    seconds = min(timeit.repeat(factory, number=COUNT, repeat=3))
+    unstub()
+    gc.collect()
+
+    tracemalloc.start()
+    objects = [factory() for _ in range(COUNT)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    unstub()
+    gc.collect()
+    return seconds / COUNT * 1e6, size / COUNT
+
+
+def main() -> None:
+    print("%20s  %10s  %10s" % ("", "us/object", "B/object"))
+    for name, factory in FACTORIES.items():
+        print("%20s  %10.2f  %10.0f" % ((name,) + bench(factory)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""Measure patching two keys of a large mapping and restoring it.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/patch_dict_bench.py
+
+Small mappings are still snapshotted as a whole.  Above that, the cost
+should not depend on the size of the mapping anymore.
+"""
+from __future__ import annotations
+
+import timeit
+
+from mockito import patch_dict
+
+
+SIZES = (100, 10_000, 200_000)
+ROUNDS = 200
+
+
+def bench(size: int) -> float:
+    registry = {"key%d" % n: n for n in range(size)}
+
+    def patch_and_restore() -> None:
+        with patch_dict(registry, {"key1": "patched", "new": "added"}):
+            pass
+
+    seconds = min(timeit.repeat(patch_and_restore, number=ROUNDS, repeat=3))
+    return seconds / ROUNDS * 1e6
+
+
+def main() -> None:
+    print("%10s  %20s" % ("entries", "patch + restore (us)"))
+    for size in SIZES:
+        print("%10d  %20.1f" % (size, bench(size)))
+
+
+if __name__ == "__main__":
+    main()
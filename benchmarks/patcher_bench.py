@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""Measure patching and tearing down many attribute patches.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/patcher_bench.py
+
+Each round patches one attribute on each of N objects and then restores all
+of them with `unstub()`, or object by object with `unstub(obj)`.  Both should
+grow linearly with N.
+"""
+from __future__ import annotations
+
+import time
+
+from mockito import patch_attr, unstub
+
+
+SIZES = (500, 1_000, 5_000)
+
+
+class Holder:
+    value = "original"
+
+
+def bench(size: int, one_by_one: bool) -> tuple[float, float]:
+    holders = [Holder() for _ in range(size)]
+
+    start = time.perf_counter()
+    for holder in holders:
+        patch_attr(holder, "value", "patched")
+    patching = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if one_by_one:
+        for holder in holders:
+            unstub(holder)
+    else:
+        unstub()
+    restoring = time.perf_counter() - start
+    return patching * 1e3, restoring * 1e3
+
+
+def main() -> None:
+    print("%10s  %12s  %14s  %16s" % (
+        "patches", "patch (ms)", "unstub() (ms)", "unstub(obj) (ms)"
+    ))
+    for size in SIZES:
+        patching, all_at_once = bench(size, False)
+        _, one_by_one = bench(size, True)
+        print("%10d  %12.1f  %14.1f  %16.1f" % (
+            size, patching, all_at_once, one_by_one
+        ))
+
+
+if __name__ == "__main__":
+    main()
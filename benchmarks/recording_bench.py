@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""Measure the memory a mock holds after many calls, per recording policy.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/recording_bench.py
+"""
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+from mockito import mock, set_recording, unstub
+
+
+CALLS = 200_000
+POLICIES = ("full", 1_000, "counts", "off")
+
+
+def bench(policy) -> tuple[float, float]:
+    m = mock()
+    set_recording(m, policy=policy)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(CALLS):
+        m.get("user:%d" % (i % 100))
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    unstub(m)
+    return current / 2**20, elapsed / CALLS * 1e6
+
+
+def main() -> None:
+    print("%-8s  %12s  %14s" % ("policy", "held (MiB)", "per call (us)"))
+    for policy in POLICIES:
+        print("%-8s  %12.1f  %14.2f" % (str(policy), *bench(policy)))
+
+
+if __name__ == "__main__":
+    main()
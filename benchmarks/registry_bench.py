@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""Measure `mock_registry.mock_for` against the number of registered mocks.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/registry_bench.py
+
+The lookup should stay flat regardless of how many mocks are registered.
+"""
+from __future__ import annotations
+
+import timeit
+
+from mockito.mock_registry import MockRegistry
+from mockito.mocking import Mock
+
+
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+LOOKUPS = 10_000
+
+
+class Target:
+    pass
+
+
+def bench(size: int) -> float:
+    registry = MockRegistry()
+    objs = [Target() for _ in range(size)]
+    for obj in objs:
+        registry.register(obj, Mock(obj, strict=False))
+
+    # Look up the object registered last, the worst case for a linear scan
+    # which appends new entries at the end.
+    probe = objs[-1]
+    seconds = min(timeit.repeat(
+        lambda: registry.mock_for(probe), number=LOOKUPS, repeat=5
+    ))
+    return seconds / LOOKUPS * 1e9
+
+
+def main() -> None:
+    print("%10s  %14s" % ("mocks", "mock_for (ns)"))
+    for size in SIZES:
+        print("%10d  %14.1f" % (size, bench(size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""Measure calls to methods stubbed within a `scope()`.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/scope_bench.py
+
+We time calls to a stubbed class method, stubbed globally and within a
+scope, and calls to the real method while another scope has stubbed it.
+Then a number of "tests", each stubbing the same method in its own scope,
+run one after the other and all at once via `asyncio.gather`.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import timeit
+
+from mockito import scope, unstub, verify, when
+
+
+CALLS = 100_000
+TESTS = (10, 100, 1_000)
+
+
+class Service:
+    def get(self, n):
+        return n
+
+
+def per_call(fn) -> float:
+    return min(timeit.repeat(fn, number=CALLS, repeat=5)) / CALLS * 1e6
+
+
+def call_costs() -> tuple[float, float, float, float]:
+    service = Service()
+    real = per_call(lambda: service.get(1))
+
+    when(Service).get(1).thenReturn(2)
+    stubbed = per_call(lambda: service.get(1))
+    unstub()
+
+    with scope():
+        when(Service).get(1).thenReturn(2)
+        scoped = per_call(lambda: service.get(1))
+
+        # Another thread, outside of the scope, gets the real method
+        results: list[float] = []
+        thread = threading.Thread(
+            target=lambda: results.append(per_call(lambda: service.get(1)))
+        )
+        thread.start()
+        thread.join()
+
+    return real, stubbed, scoped, results[0]
+
+
+async def a_test(n: int) -> None:
+    with scope():
+        when(Service).get(...).thenReturn(n)
+        service = Service()
+        for _ in range(10):
+            assert service.get(1) == n
+            await asyncio.sleep(0)
+        verify(Service, times=10).get(1)
+
+
+def run_tests(tests: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    for n in range(tests):
+        asyncio.run(a_test(n))
+    sequential = time.perf_counter() - start
+
+    async def gather() -> None:
+        await asyncio.gather(*(a_test(n) for n in range(tests)))
+
+    start = time.perf_counter()
+    asyncio.run(gather())
+    concurrent = time.perf_counter() - start
+    return sequential * 1e3, concurrent * 1e3
+
+
+def main() -> None:
+    real, stubbed, scoped, passed_through = call_costs()
+    print("%28s  %8.2f us" % ("real method", real))
+    print("%28s  %8.2f us" % ("stubbed globally", stubbed))
+    print("%28s  %8.2f us" % ("stubbed within the scope", scoped))
+    print("%28s  %8.2f us" % ("real method, other scope", passed_through))
+    print()
+    print("%8s  %16s  %16s" % ("tests", "one by one (ms)", "gathered (ms)"))
+    for tests in TESTS:
+        print("%8d  %16.1f  %16.1f" % ((tests,) + run_tests(tests)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""Measure the teardown of a test with many other mocks registered.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/session_bench.py
+
+Each "test" stubs two methods, calls them, and is torn down either by the
+module wide checks, `verifyExpectedInteractions` and
+`verifyStubbedInvocationsAreUsed`, followed by `unstub()`, or by
+finishing a `MockitoSession`.  Meanwhile a number of other mocks stay
+registered, as if leaked by earlier tests.
+"""
+from __future__ import annotations
+
+import timeit
+import warnings
+
+from mockito import (
+    MockitoSession,
+    mock,
+    unstub,
+    verifyExpectedInteractions,
+    verifyStubbedInvocationsAreUsed,
+    when,
+)
+from mockito.mock_registry import mock_registry
+from mockito.session import LeakWarning
+
+
+TESTS = 1_000
+OTHERS = (0, 100, 1_000, 10_000)
+
+
+class Service:
+    def get(self, n):
+        return n
+
+    def put(self, n):
+        return n
+
+
+def a_test() -> None:
+    service = Service()
+    when(service).get(1).thenReturn(2)
+    when(service).put(2).thenReturn(3)
+    service.put(service.get(1))
+
+
+def leak(others: int) -> None:
+    for _ in range(others):
+        other = mock()
+        when(other).foo().thenReturn(1)
+        other.foo()
+
+
+def with_global_checks() -> None:
+    a_test()
+    verifyExpectedInteractions()
+    verifyStubbedInvocationsAreUsed()
+    # `unstub()` would also remove the others; unstub what the test made
+    for m in mock_registry.get_registered_mocks()[-1:]:
+        mock_registry.unstub_mock(m)
+
+
+def with_session() -> None:
+    with MockitoSession():
+        a_test()
+
+
+def per_test(fn) -> float:
+    return min(timeit.repeat(fn, number=TESTS, repeat=3)) / TESTS * 1e6
+
+
+def main() -> None:
+    warnings.simplefilter("ignore", LeakWarning)
+    print("%8s  %18s  %18s" % ("others", "global checks (us)", "session (us)"))
+    for others in OTHERS:
+        leak(others)
+        row = (others, per_test(with_global_checks), per_test(with_session))
+        print("%8d  %18.1f  %18.1f" % row)
+        unstub()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""Measure the first `Mock.get_signature` on fresh mocks of the same class.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/signature_bench.py
+
+Fixtures often create many instance mocks of the same few classes.  Only
+the very first of them should actually inspect the method.
+"""
+from __future__ import annotations
+
+import timeit
+
+from mockito import signature
+from mockito.mocking import Mock
+
+
+NUMBER = 20_000
+
+
+class Target:
+    def method(self, a, b=None, *args, c, **kwargs):
+        pass
+
+    @classmethod
+    def factory(cls, a, b):
+        pass
+
+
+def bench(method_name: str) -> float:
+    def first_lookup():
+        obj = Target()
+        Mock(obj, spec=obj).get_signature(method_name)
+
+    seconds = min(timeit.repeat(first_lookup, number=NUMBER, repeat=5))
+    return seconds / NUMBER * 1e9
+
+
+def main() -> None:
+    print("%-16s  %14s" % ("method", "per mock (ns)"))
+    for method_name in ("method", "factory"):
+        print("%-16s  %14.1f" % (method_name, bench(method_name)))
+    print(signature.cache_info())
+
+
+if __name__ == "__main__":
+    main()
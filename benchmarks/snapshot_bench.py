@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""Measure setting up many stubs per test, via `when` and via a snapshot.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/snapshot_bench.py
+
+Each "test" sets up the same stubs on a class, spread over a few methods,
+and unstubs them again.  Either by running the ``when(...)`` calls, or by
+applying a `StubTemplate` taken once up front.
+"""
+from __future__ import annotations
+
+import timeit
+
+from mockito import snapshot, unstub, when
+
+
+STUBS = (10, 100, 300, 1_000)
+METHODS = 10
+
+
+class Api:
+    def get(self, path, params=None):
+        return None
+
+    def post(self, path, data=None):
+        return None
+
+    def put(self, path, data=None):
+        return None
+
+    def delete(self, path):
+        return None
+
+    def head(self, path):
+        return None
+
+    def options(self, path):
+        return None
+
+    def patch(self, path, data=None):
+        return None
+
+    def fetch(self, path):
+        return None
+
+    def stream(self, path):
+        return None
+
+    def close(self, path):
+        return None
+
+
+NAMES = [
+    'get', 'post', 'put', 'delete', 'head',
+    'options', 'patch', 'fetch', 'stream', 'close',
+]
+
+
+def stub_all(stubs: int) -> None:
+    for n in range(stubs):
+        method = getattr(when(Api), NAMES[n % METHODS])
+        method('/items/%d' % n).thenReturn(n)
+
+
+def per_test(fn) -> float:
+    number = 20
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e3
+
+
+def main() -> None:
+    print("%8s  %12s  %12s" % ("stubs", "when (ms)", "apply (ms)"))
+    for stubs in STUBS:
+        stub_all(stubs)
+        template = snapshot(Api)
+        unstub()
+
+        def with_when() -> None:
+            stub_all(stubs)
+            unstub()
+
+        def with_template() -> None:
+            template.apply()
+            unstub()
+
+        print("%8d  %12.3f  %12.3f"
+              % (stubs, per_test(with_when), per_test(with_template)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Measure the strict signature validation of `when(...).method(...)`.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/stub_validation_bench.py
+
+Parametrized tests set up the same stub shapes with different values over
+and over again.
+"""
+from __future__ import annotations
+
+import timeit
+
+from mockito import args, kwargs
+from mockito.signature import (
+    match_signature_allowing_placeholders,
+    signature,
+)
+
+
+NUMBER = 50_000
+
+
+def method(a, b=None, *rest, c=None, **options):
+    pass
+
+
+SHAPES = [
+    ("values", (1, 2), {"c": 3}),
+    ("trailing ...", (1, Ellipsis), {}),
+    ("*args", (1, *args), {}),
+    ("**kwargs", (1,), {"c": 3, **kwargs}),
+]
+
+
+def bench(params: tuple, named_params: dict) -> float:
+    sig = signature(method)
+    seconds = min(timeit.repeat(
+        lambda: match_signature_allowing_placeholders(
+            sig, params, named_params
+        ),
+        number=NUMBER,
+        repeat=5,
+    ))
+    return seconds / NUMBER * 1e9
+
+
+def main() -> None:
+    print("%-14s  %16s" % ("shape", "validation (ns)"))
+    for name, params, named_params in SHAPES:
+        print("%-14s  %16.1f" % (name, bench(params, named_params)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Measure the checks typically run after each test.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/teardown_checks_bench.py
+
+A number of mocks get a few hundred stubs each, all of them used, and
+record a lot of calls which are then verified.  Then we time
+`verifyStubbedInvocationsAreUsed`, `verifyExpectedInteractions` and
+`ensureNoUnverifiedInteractions`, as an autouse fixture would call them.
+Without any violations these should not depend on the number of stubs and
+calls anymore.  Called without arguments, the first two should not depend
+on the number of registered mocks either.
+"""
+from __future__ import annotations
+
+import time
+
+from mockito import (
+    ensureNoUnverifiedInteractions,
+    mock,
+    unstub,
+    verify,
+    verifyExpectedInteractions,
+    verifyStubbedInvocationsAreUsed,
+    when,
+)
+
+
+MOCKS = 20
+SIZES = (1_000, 10_000, 50_000)
+STUBS = 200
+REGISTERED = (100, 10_000)
+
+
+def bench(calls: int) -> float:
+    mocks = [mock() for _ in range(MOCKS)]
+    for m in mocks:
+        for n in range(STUBS):
+            when(m).get(n).thenReturn(n)
+        for n in range(calls):
+            m.get(n % STUBS)
+        verify(m, times=calls).get(...)
+
+    start = time.perf_counter()
+    verifyStubbedInvocationsAreUsed()
+    verifyExpectedInteractions()
+    ensureNoUnverifiedInteractions(*mocks)
+    elapsed = time.perf_counter() - start
+    unstub()
+    return elapsed * 1e3
+
+
+def bench_registered(count: int) -> float:
+    mocks = [mock() for _ in range(count)]
+    for m in mocks:
+        when(m).get(1).thenReturn(1)
+        m.get(1)
+
+    start = time.perf_counter()
+    verifyStubbedInvocationsAreUsed()
+    verifyExpectedInteractions()
+    elapsed = time.perf_counter() - start
+    unstub()
+    return elapsed * 1e3
+
+
+def main() -> None:
+    print("%10s  %14s" % ("calls/mock", "checks (ms)"))
+    for size in SIZES:
+        print("%10d  %14.3f" % (size, bench(size)))
+
+    print("%10s  %14s" % ("mocks", "checks (ms)"))
+    for count in REGISTERED:
+        print("%10d  %14.3f" % (count, bench_registered(count)))
+
+
+if __name__ == "__main__":
+    main()
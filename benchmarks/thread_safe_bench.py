@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""Stress a mock from many threads at once.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/thread_safe_bench.py
+
+For each thread count, the threads call a stubbed method as fast as they
+can, first on a plain mock, then on one in thread-safe mode (see
+`set_thread_safe`).  We print the calls per second, and how many calls and
+answers went missing.  The plain mock may lose some under load, depending
+on the interpreter; the thread-safe one must not.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from mockito import mock, set_thread_safe, unstub, when
+from mockito.mock_registry import mock_registry
+
+
+THREADS = (1, 2, 4, 8, 16, 32)
+CALLS = 20_000
+
+
+def bench(threads: int, thread_safe: bool) -> tuple[float, int, int]:
+    m = mock()
+    total = threads * CALLS
+    when(m).next_id().thenReturn(*range(total))
+    if thread_safe:
+        set_thread_safe(m)
+
+    barrier = threading.Barrier(threads + 1)
+    results: list[list[int]] = [[] for _ in range(threads)]
+
+    def run(n: int) -> None:
+        append = results[n].append
+        barrier.wait()
+        for _ in range(CALLS):
+            append(m.next_id())
+
+    workers = [
+        threading.Thread(target=run, args=(n,)) for n in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    answers = set()
+    for result in results:
+        answers.update(result)
+    recorded = len(mock_registry.mock_for(m).invocations)
+    unstub()
+    return total / elapsed, total - recorded, total - len(answers)
+
+
+def main() -> None:
+    print(
+        "%8s  %14s  %14s  %8s  %8s"
+        % ("threads", "mode", "calls/s", "lost", "repeated")
+    )
+    for threads in THREADS:
+        for thread_safe in (False, True):
+            print(
+                "%8d  %14s  %14.0f  %8d  %8d"
+                % (
+                    (threads, "thread-safe" if thread_safe else "plain")
+                    + bench(threads, thread_safe)
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
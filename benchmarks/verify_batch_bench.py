@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Compare `verifying` with the equivalent sequence of `verify` calls.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/verify_batch_bench.py
+
+The mock records calls to a handful of methods with literal arguments.
+Then we check one wanted call per method and argument, once with a
+`verify` each and once in a single `verifying` block, first with the
+literal arguments and then with matchers.  Literal checks look up the
+equal calls in the index of the recorded calls either way, so they should
+cost about the same.  Checks with matchers need a pass over the calls of
+their method; the block does one per method instead of one per check.
+"""
+from __future__ import annotations
+
+import time
+
+from mockito import eq, mock, verify, verifying
+
+
+SIZES = (800, 8_000, 80_000)
+METHODS = ("get", "put", "delete", "scan")
+KEYS = 20
+
+
+def record(size: int):
+    store = mock()
+    for n in range(size):
+        method = getattr(store, METHODS[n % len(METHODS)])
+        method("key:%d" % (n // len(METHODS) % KEYS))
+    return store
+
+
+def bench(size: int, wrap) -> tuple[float, float]:
+    times = size // (len(METHODS) * KEYS)
+
+    store = record(size)
+    start = time.perf_counter()
+    for name in METHODS:
+        for k in range(KEYS):
+            getattr(verify(store, times=times), name)(wrap("key:%d" % k))
+    single = time.perf_counter() - start
+
+    store = record(size)
+    start = time.perf_counter()
+    with verifying(store) as v:
+        for name in METHODS:
+            for k in range(KEYS):
+                getattr(v(times=times), name)(wrap("key:%d" % k))
+    batch = time.perf_counter() - start
+    return single * 1e3, batch * 1e3
+
+
+def main() -> None:
+    for title, wrap in (("literal", lambda key: key), ("matcher", eq)):
+        print("%s arguments" % title)
+        print("%10s  %14s  %14s"
+              % ("calls", "verify (ms)", "verifying (ms)"))
+        for size in SIZES:
+            print("%10d  %14.2f  %14.2f" % ((size,) + bench(size, wrap)))
+
+
+if __name__ == "__main__":
+    main()
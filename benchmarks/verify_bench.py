@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""Measure `verify` with plain literal arguments against the recorded calls.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/verify_bench.py
+
+The mock records calls to `get('user:<n>')` for a few hundred different
+users, and to some other methods.  Then we verify the count for each user.
+The first verification builds the index; the others should not depend on the
+number of recorded calls anymore.
+"""
+from __future__ import annotations
+
+import time
+
+from mockito import mock, verify
+
+
+SIZES = (1_000, 10_000, 100_000)
+USERS = 100
+VERIFICATIONS = 50
+
+
+def bench(size: int) -> tuple[float, float]:
+    cache = mock()
+    for n in range(size):
+        cache.get("user:%d" % (n % USERS))
+        if n % 10 == 0:
+            cache.put("user:%d" % (n % USERS), n)
+
+    times = size // USERS
+    start = time.perf_counter()
+    verify(cache, times=times).get("user:0")
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for n in range(1, VERIFICATIONS + 1):
+        verify(cache, times=times).get("user:%d" % n)
+    rest = (time.perf_counter() - start) / VERIFICATIONS
+    return first * 1e3, rest * 1e3
+
+
+def main() -> None:
+    print("%10s  %14s  %14s" % ("calls", "first (ms)", "next (ms)"))
+    for size in SIZES:
+        print("%10d  %14.2f  %14.3f" % ((size,) + bench(size)))
+
+
+if __name__ == "__main__":
+    main()
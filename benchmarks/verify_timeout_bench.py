@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""Measure waiting for calls from another thread.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/verify_timeout_bench.py
+
+First a worker makes a single call after a short nap; we print how long
+after that call the waiting `verify` returned.  Then the worker makes many
+calls as fast as it can while we wait for all of them, which shows what
+waiting adds to each call.  Each is compared to a loop which retries a plain
+`verify` every millisecond.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from mockito import VerificationError, mock, unstub, verify
+
+
+ROUNDS = 20
+CALLS = (1_000, 10_000, 100_000)
+POLL_INTERVAL = 0.001
+
+
+def wait_by_polling(m: object, times: int) -> None:
+    while True:
+        try:
+            verify(m, times=times).foo(...)
+        except VerificationError:
+            time.sleep(POLL_INTERVAL)
+        else:
+            return
+
+
+def wait_with_timeout(m: object, times: int) -> None:
+    verify(m, times=times, timeout=10).foo(...)
+
+
+def latency(wait) -> float:
+    total = 0.0
+    for _ in range(ROUNDS):
+        m = mock()
+        called_at: list[float] = []
+
+        def call() -> None:
+            time.sleep(0.005)
+            called_at.append(time.perf_counter())
+            m.foo(1)
+
+        worker = threading.Thread(target=call)
+        worker.start()
+        wait(m, 1)
+        total += time.perf_counter() - called_at[0]
+        worker.join()
+        unstub()
+    return total / ROUNDS * 1e6
+
+
+def throughput(wait, calls: int) -> float:
+    m = mock()
+
+    def run() -> None:
+        for n in range(calls):
+            m.foo(n)
+
+    worker = threading.Thread(target=run)
+    start = time.perf_counter()
+    worker.start()
+    wait(m, calls)
+    elapsed = time.perf_counter() - start
+    worker.join()
+    unstub()
+    return elapsed / calls * 1e6
+
+
+def main() -> None:
+    print("%10s  %16s  %16s" % ("", "polling", "timeout"))
+    print(
+        "%10s  %16.1f  %16.1f"
+        % ("wake (us)", latency(wait_by_polling), latency(wait_with_timeout))
+    )
+    for calls in CALLS:
+        print(
+            "%10s  %16.2f  %16.2f"
+            % (
+                "%d calls" % calls,
+                throughput(wait_by_polling, calls),
+                throughput(wait_with_timeout, calls),
+            )
+        )
+    print("(per call in us)")
+
+
+if __name__ == "__main__":
+    main()
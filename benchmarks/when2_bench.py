@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""Measure `when2` on module functions, which parses its call site.
+
+Usage (with mockito importable, e.g. after ``pip install -e .``)::
+
+    python benchmarks/when2_bench.py
+
+`when2(os.path.exists, ...)` finds the host of `exists` by reading the source
+line of its caller.  We run it at different stack depths, as test runners
+call tests deep down the stack.
+"""
+from __future__ import annotations
+
+import os
+import time
+
+from mockito import unstub, when2
+
+
+DEPTHS = (10, 50, 200)
+ROUNDS = 2_000
+
+
+def setup() -> None:
+    when2(os.path.exists, "/foo").thenReturn(True)
+
+
+def at_depth(depth: int) -> float:
+    if depth > 0:
+        return at_depth(depth - 1)
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        setup()
+        unstub()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print("%10s  %20s" % ("depth", "when2 + unstub (us)"))
+    for depth in DEPTHS:
+        print("%10d  %20.1f" % (depth, at_depth(depth) / ROUNDS * 1e6))
+
+
+if __name__ == "__main__":
+    main()
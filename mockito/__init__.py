@@ -29,9 +29,14 @@ from .mockito import (
     patch_dict,
     expect,
     unstub,
+    scope,
     forget_invocations,
+    set_recording,
+    set_thread_safe,
     ensureNoUnverifiedInteractions,
     verify,
+    verify_async,
+    verifying,
     verifyZeroInteractions,
     verifyExpectedInteractions,
     verifyStubbedInvocationsAreUsed,
@@ -41,6 +46,8 @@ from .mockito import (
 )
 from . import inorder
 from .inorder import InOrder
+from .session import MockitoSession
+from .templates import StubTemplate, snapshot
 from .spying import spy, spy2
 from .mocking import mock
 from .verification import VerificationError
@@ -68,13 +75,21 @@ __all__ = [
     'expect',
     'ensureNoUnverifiedInteractions',
     'verify',
+    'verify_async',
+    'verifying',
     'verifyZeroInteractions',
     'verifyExpectedInteractions',
     'verifyStubbedInvocationsAreUsed',
     'inorder',
     'InOrder',
+    'MockitoSession',
     'unstub',
+    'scope',
+    'snapshot',
+    'StubTemplate',
     'forget_invocations',
+    'set_recording',
+    'set_thread_safe',
     'VerificationError',
     'ArgumentError',
 
@@ -21,9 +21,10 @@ from __future__ import annotations
 
 import ast
 import inspect
-from collections import deque
+import types
+import weakref
 from functools import partial
-from typing import Deque, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
 from .verification import VerificationError
 from .invocation import RealInvocation, VerifiableInvocation
@@ -131,12 +132,15 @@ class InOrderImpl:
                 raise ValueError(f"{obj} is provided more than once")
             objects_.append(obj)
         self._objects = objects_
-        self._object_labels = self._guess_object_labels_from_callsite(
-            len(objects_)
-        )
+        # The labels are only needed for error messages, so we only
+        # remember where we are and parse the source lazily.
+        self._callsite = _find_callsite() if len(objects_) > 1 else None
+        self._labels: list[str | None] | None = None
         self._active = True
         self._observer_registered = False
-        self.ordered_invocations: Deque[RealInvocation] = deque()
+        self.ordered_invocations: list[RealInvocation] = []
+        # All invocations before this index are verified in order
+        self._cursor = 0
 
         self._register_observer()
         self._attach_all()
@@ -171,6 +175,17 @@ class InOrderImpl:
     def update(self, invocation: RealInvocation) -> None:
         self.ordered_invocations.append(invocation)
 
+    def next_unverified_index(self) -> int | None:
+        """Return the index of the first invocation not verified in order."""
+        # `verified_inorder` is never reset, so we continue where we stopped
+        # the last time.
+        ordered = self.ordered_invocations
+        cursor = self._cursor
+        while cursor < len(ordered) and ordered[cursor].verified_inorder:
+            cursor += 1
+        self._cursor = cursor
+        return cursor if cursor < len(ordered) else None
+
     def verify(
         self,
         obj: object,
@@ -241,39 +256,30 @@ class InOrderImpl:
             return str(invocation)
         return f"{self._label_for_mock(mock)}.{invocation}"
 
+    @property
+    def _object_labels(self) -> list[str | None]:
+        if self._labels is None:
+            self._labels = self._guess_object_labels_from_callsite(
+                len(self._objects)
+            )
+        return self._labels
+
     def _guess_object_labels_from_callsite(self, count: int) -> list[str | None]:
         if count == 0:
             return []
 
         # For a single observed object, object qualification adds little value
         # to mismatch messages (there is no cross-object ambiguity anyway).
-        if count == 1:
-            return [None]
-
-        frame = inspect.currentframe()
-        # Start at the direct caller and then walk out of our own module.
-        # This is important because public `InOrder` delegates to `InOrderImpl`,
-        # so the first stack frames are internal wrappers.
-        caller_frame = frame.f_back if frame else None
-        while caller_frame and caller_frame.f_code.co_filename == __file__:
-            caller_frame = caller_frame.f_back
-
-        if caller_frame is None:
+        if count == 1 or self._callsite is None:
             return [None] * count
 
-        try:
-            source_lines, start_lineno = inspect.getsourcelines(
-                caller_frame.f_code
-            )
-            source = ''.join(source_lines)
-            call_lineno = caller_frame.f_lineno - start_lineno + 1
-            tree = ast.parse(source)
-        except (OSError, TypeError, SyntaxError):
+        code, lineno = self._callsite
+        parsed = _parse_source_of(code)
+        if parsed is None:
             return [None] * count
-        finally:
-            del frame
-            del caller_frame
 
+        source, start_lineno, tree = parsed
+        call_lineno = lineno - start_lineno + 1
         call = self._find_inorder_call_for_lineno(tree, call_lineno)
         if call is None:
             return [None] * count
@@ -322,7 +328,52 @@ class InOrderImpl:
         return False
 
 
+def _find_callsite() -> tuple[types.CodeType, int] | None:
+    frame = inspect.currentframe()
+    # Start at the direct caller and then walk out of our own module.
+    # This is important because public `InOrder` delegates to `InOrderImpl`,
+    # so the first stack frames are internal wrappers.
+    caller_frame = frame.f_back if frame else None
+    while caller_frame and caller_frame.f_code.co_filename == __file__:
+        caller_frame = caller_frame.f_back
+
+    try:
+        if caller_frame is None:
+            return None
+        return caller_frame.f_code, caller_frame.f_lineno
+    finally:
+        del frame
+        del caller_frame
+
+
+# The source, its first line number, and its syntax tree per code object, or
+# None if we could not get or parse the source
+_parsed_sources: weakref.WeakKeyDictionary[
+    types.CodeType, tuple[str, int, ast.AST] | None
+] = weakref.WeakKeyDictionary()
+
+
+def _parse_source_of(code: types.CodeType) -> tuple[str, int, ast.AST] | None:
+    try:
+        return _parsed_sources[code]
+    except KeyError:
+        pass
+
+    parsed: tuple[str, int, ast.AST] | None
+    try:
+        source_lines, start_lineno = inspect.getsourcelines(code)
+        source = ''.join(source_lines)
+        parsed = source, start_lineno, ast.parse(source)
+    except (OSError, TypeError, SyntaxError):
+        parsed = None
+
+    _parsed_sources[code] = parsed
+    return parsed
+
+
 class InOrderVerifiableInvocation(VerifiableInvocation):
+    __slots__ = ('_inorder',)
+
     def __init__(self, mock, method_name, verification, inorder: InOrderImpl):
         super().__init__(mock, method_name, verification)
         self._inorder = inorder
@@ -341,18 +392,14 @@ class InOrderVerifiableInvocation(VerifiableInvocation):
 
         # Find first invocation in global order that hasn't been used
         # for "in-order" verification yet.
-        try:
-            start_idx, next_invocation = next(
-                (i, inv)
-                for i, inv in enumerate(ordered)
-                if not inv.verified_inorder
-            )
-        except StopIteration:
+        start_idx = self._inorder.next_unverified_index()
+        if start_idx is None:
             if self.handle_zero_matches_if_allowed():
                 return
             raise VerificationError(
                 "\nThere are no more recorded invocations."
             )
+        next_invocation = ordered[start_idx]
 
         called_mock = next_invocation.mock
         if called_mock is not self.mock:
@@ -385,7 +432,8 @@ class InOrderVerifiableInvocation(VerifiableInvocation):
         matched_invocations: list[RealInvocation] = []
 
         # Walk the contiguous block of this mock in the global queue.
-        for inv in list(ordered)[start_idx:]:
+        for x in range(start_idx, len(ordered)):
+            inv = ordered[x]
             if inv.verified_inorder:
                 continue
             if inv.mock is not self.mock:
@@ -21,20 +21,27 @@
 from __future__ import annotations
 from abc import ABC
 from dataclasses import dataclass
+import asyncio
 import os
 import inspect
 import operator
+import threading
+import time
 from collections import deque
-from typing import TYPE_CHECKING, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Sequence, Union
 
-from . import matchers, sameish, signature
+from . import match_plan, matchers, sameish, signature
 from . import verification as verificationModule
 from .mock_registry import mock_registry
 from .utils import contains_strict
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, NoReturn, Self, TypeVar
+    from typing import (
+        Any, Callable, Coroutine, Hashable, Mapping, NoReturn, Self, TypeVar
+    )
     from .mocking import Mock
+    from .recording import SameCalls
     T = TypeVar('T')
 
 
@@ -70,15 +77,20 @@ __tracebackhide__ = operator.methodcaller(
     (InvocationError, verificationModule.VerificationError)
 )
 
+#: The `named_params` of all invocations without keyword arguments
+NO_NAMED_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
 
 class Invocation(object):
+    __slots__ = ('mock', 'method_name', 'strict', 'params', 'named_params')
+
     def __init__(self, mock: Mock, method_name: str) -> None:
         self.mock = mock
         self.method_name = method_name
         self.strict = mock.strict
 
         self.params: tuple[Any, ...] = ()
-        self.named_params: dict[str, Any] = {}
+        self.named_params: Mapping[str, Any] = NO_NAMED_PARAMS
 
     def _remember_params(self, params: tuple, named_params: dict) -> None:
         self.params = params
@@ -95,13 +107,23 @@ class Invocation(object):
 
 
 class RealInvocation(Invocation, ABC):
+    __slots__ = ('verified', 'verified_inorder')
+
     def __init__(self, mock: Mock, method_name: str) -> None:
         super(RealInvocation, self).__init__(mock, method_name)
         self.verified = False
         self.verified_inorder = False
 
+    def _remember_params(self, params: tuple, named_params: dict) -> None:
+        self.params = params
+        # Most calls have no keyword arguments.  Millions of recorded calls
+        # then share one empty (read-only) mapping.
+        self.named_params = named_params or NO_NAMED_PARAMS
+
 
 class RememberedInvocation(RealInvocation):
+    __slots__ = ('discard_first_arg',)
+
     def __init__(
         self, mock: Mock, method_name: str, discard_first_arg: bool = False
     ) -> None:
@@ -136,19 +158,26 @@ class RememberedInvocation(RealInvocation):
         self._remember_params(params_without_first_arg, named_params)
         self.mock.remember(self)
 
-        for matching_invocation in self.mock.stubbed_invocations:
-            if matching_invocation.matches(self):
-                matching_invocation.should_answer(self)
-                matching_invocation.capture_arguments(self)
-                return matching_invocation.answer_first(
-                    *params, **named_params)
+        mocks = [self.mock]
+        answer = self._take_answer(self.mock)
+        if (
+            answer is None
+            and self.mock.patch_per_scope
+            and self.mock.scope is not None
+        ):
+            # Within a scope, calls the scope does not stub fall through to
+            # the stubs of the enclosing scopes, then to the global ones.
+            # The mock answering remembers the call as well.
+            for mock in mock_registry.outer_mocks(self.mock):
+                mocks.append(mock)
+                answer = self._take_answer(mock)
+                if answer is not None:
+                    mock.remember(self)
+                    break
+        if answer is not None:
+            return answer(*params, **named_params)
 
         if self.strict:
-            stubbed_invocations = [
-                invoc
-                for invoc in self.mock.stubbed_invocations
-                if invoc.method_name == self.method_name
-            ]
             raise InvocationError(
                 """
 Called but not expected:
@@ -163,15 +192,39 @@ Stubbed invocations are:
                 % (
                     self,
                     "\n    ".join(
-                        str(invoc) for invoc in reversed(stubbed_invocations)
+                        str(invoc)
+                        for mock in reversed(mocks)
+                        for invoc in reversed(
+                            mock.stubbed_invocations_for(self.method_name)
+                        )
                     )
                 )
             )
 
         return None
 
+    def _take_answer(self, mock: Mock) -> Callable | None:
+        lock = mock.lock
+        if lock is None:
+            return self._take_answer_unlocked(mock)
+        # The answer itself runs unlocked, as it may call the mock again,
+        # maybe from another thread.
+        with lock:
+            return self._take_answer_unlocked(mock)
+
+    def _take_answer_unlocked(self, mock: Mock) -> Callable | None:
+        matching_invocation = mock.find_stub_for(self)
+        if matching_invocation is None:
+            return None
+
+        matching_invocation.should_answer(self)
+        matching_invocation.capture_arguments(self)
+        return matching_invocation.take_answer()
+
 
 class RememberedPropertyAccess(RememberedInvocation):
+    __slots__ = ()
+
     def ensure_mocked_object_has_method(self, method_name):
         return True
 
@@ -184,6 +237,8 @@ class RememberedProxyInvocation(RealInvocation):
 
     Calls method on original object and returns it's return value.
     """
+    __slots__ = ()
+
     def __call__(self, *params: Any, **named_params: Any) -> Any:
         self._remember_params(params, named_params)
         self.mock.remember(self)
@@ -208,17 +263,16 @@ class MatchingInvocation(Invocation, ABC):
     consume multiple arguments of the (other) `invocation`.
 
     """
-    @staticmethod
-    def compare(p1, p2):
-        if p1 is Ellipsis:
-            return True
-
-        if isinstance(p1, matchers.Matcher):
-            if not p1.matches(p2):
-                return False
-        elif p1 != p2:
-            return False
-        return True
+    __slots__ = ('_match_plan',)
+
+    def __init__(self, mock: Mock, method_name: str) -> None:
+        super(MatchingInvocation, self).__init__(mock, method_name)
+        self._match_plan: match_plan.MatchPlan | None = None
+
+    # `compare` is a documented-by-usage extension point, e.g. to compare
+    # numpy arrays.  As long as it is not replaced, `matches` uses the
+    # precompiled comparators of the match plan instead.
+    compare = staticmethod(match_plan.compare)
 
     def capture_arguments(self, invocation: RealInvocation) -> None:  # noqa: C901
         """Capture arguments of `invocation` into "capturing" matchers of self.
@@ -251,11 +305,7 @@ class MatchingInvocation(Invocation, ABC):
 
         # Explicit keyword matchers (excluding the **kwargs rest placeholder).
         # We use these keys to derive the remaining kwargs for rest-capture.
-        fixed_named_keys = {
-            key
-            for key in self.named_params
-            if key is not matchers.KWARGS_SENTINEL
-        }
+        fixed_named_keys = self.match_plan.fixed_keys
         for key, p1 in self.named_params.items():
             if (
                 key is matchers.KWARGS_SENTINEL
@@ -305,78 +355,32 @@ class MatchingInvocation(Invocation, ABC):
 
         self.params = tuple(wrap(p) for p in params)
         self.named_params = {k: wrap(v) for k, v in named_params.items()}
+        self._match_plan = match_plan.compile_plan(
+            self.params, self.named_params
+        )
+
+    @property
+    def match_plan(self) -> match_plan.MatchPlan:
+        plan = self._match_plan
+        if plan is None:
+            plan = self._match_plan = match_plan.compile_plan(
+                self.params, self.named_params
+            )
+        return plan
 
     # Note: matches(a, b) does not imply matches(b, a) because
     # the left side might contain wildcards (like Ellipsis) or matchers.
     # In its current form the right side is a concrete call signature.
-    def matches(self, invocation: Invocation) -> bool:  # noqa: C901, E501  (too complex)
+    def matches(self, invocation: Invocation) -> bool:
         if self.method_name != invocation.method_name:
             return False
 
-        if self._get_call_captor() is not None:
-            return True
-
-        for x, p1 in enumerate(self.params):
-            if (
-                p1 is Ellipsis
-                and x == len(self.params) - 1
-                and not self.named_params
-            ):
-                return True
-
-            if p1 is matchers.ARGS_SENTINEL:
-                break
-
-            if matchers.is_captor_args_sentinel(p1):
-                if not p1.matches(invocation.params[x:]):
-                    return False
-                break
-
-            try:
-                p2 = invocation.params[x]
-            except IndexError:
-                return False
-
-            if not self.compare(p1, p2):
-                return False
-        else:
-            if len(self.params) != len(invocation.params):
-                return False
-
-        # Explicit keyword matchers (excluding the **kwargs rest placeholder).
-        # We use these keys to derive the remaining kwargs for rest-matching.
-        fixed_named_keys = {
-            key
-            for key in self.named_params
-            if key is not matchers.KWARGS_SENTINEL
-        }
-        for key, p1 in sorted(
-            self.named_params.items(),
-            key=lambda k_v: 1 if k_v[0] is matchers.KWARGS_SENTINEL else 0
-        ):
-            if key is matchers.KWARGS_SENTINEL:
-                if matchers.is_captor_kwargs_sentinel(p1):
-                    rest_kwargs = {
-                        k: v
-                        for k, v in invocation.named_params.items()
-                        if k not in fixed_named_keys
-                    }
-                    if not p1.matches(rest_kwargs):
-                        return False
-                break
-
-            try:
-                p2 = invocation.named_params[key]
-            except KeyError:
-                return False
-
-            if not self.compare(p1, p2):
-                return False
-        else:
-            if len(self.named_params) != len(invocation.named_params):
-                return False
-
-        return True
+        compare = self.compare
+        return self.match_plan.matches(
+            invocation.params,
+            invocation.named_params,
+            None if compare is match_plan.compare else compare,
+        )
 
     def _get_call_captor(self):
         if (
@@ -407,6 +411,8 @@ class VerifiableInvocation(MatchingInvocation):
     call.  But the `__call__` is essentially virtual and can contain
     placeholders and matchers.
     """
+    __slots__ = ('verification', 'verification_allows_zero_matches')
+
     def __init__(
         self,
         mock: Mock,
@@ -420,17 +426,44 @@ class VerifiableInvocation(MatchingInvocation):
 
     def __call__(self, *params: Any, **named_params: Any) -> None:
         self._remember_params(params, named_params)
+        self.mock.recorder.ensure_can_verify('verify')
+        self._verify()
+
+    def _verify(self) -> None:
+        recorder = self.mock.recorder
+
+        # Calls equal to a plain literal verification are counted in one go.
+        # They cannot fill captors since such a verification has none.
+        same_calls, others = recorder.lookup(self)
         matched_invocations = []
-        for invocation in self.mock.invocations:
+        for invocation in others:
             if self.matches(invocation):
                 self.capture_arguments(invocation)
                 matched_invocations.append(invocation)
 
-        self.verification.verify(self, len(matched_invocations))
+        self._conclude(same_calls, matched_invocations)
+
+    def _conclude(
+        self,
+        same_calls: SameCalls | None,
+        matched_invocations: list[RealInvocation],
+    ) -> None:
+        recorder = self.mock.recorder
+        count = sum(map(recorder.count, matched_invocations))
+        if same_calls is not None:
+            count += len(same_calls)
+        try:
+            self.verification.verify(self, count)
+        except verificationModule.VerificationError as error:
+            limitation = recorder.limitation()
+            if not limitation:
+                raise
+            raise verificationModule.VerificationError(
+                "%s%s" % (error, limitation)
+            ) from None
 
         # check (real) invocations as verified
-        for invocation in matched_invocations:
-            invocation.verified = True
+        recorder.mark_verified(matched_invocations, same_calls)
 
         self.maybe_check_stubs_as_used()
 
@@ -448,11 +481,259 @@ class VerifiableInvocation(MatchingInvocation):
         invocations, not about requiring that the stub was exercised.
         """
         if self.verification_allows_zero_matches:
-            for stub in self.mock.stubbed_invocations:
+            for stub in self.mock.stubbed_invocations_for(self.method_name):
                 # Remember: matches(a, b) does not imply matches(b, a)
                 # (see above!), so we check for both
                 if stub.matches(self) or self.matches(stub):
                     stub.allow_zero_invocations = True
+                    self.mock.mark_stub_as_used(stub)
+
+
+def verify_together(
+    wanted: Sequence[tuple[VerifiableInvocation, tuple, dict]],
+) -> list[verificationModule.VerificationError | None]:
+    """Verify the `wanted` invocations of one mock with their arguments.
+
+    Like calling each of them, but without a pass over the calls per wanted
+    invocation: the ones matched against the same calls (t.i. the calls to
+    one method) are matched in a single pass, and against calls with equal
+    plain literal arguments only once.  Returns the error of each wanted
+    invocation, or None if it passed.
+    """
+    verifiables = []
+    for verifiable, params, named_params in wanted:
+        verifiable._remember_params(params, named_params)
+        verifiables.append(verifiable)
+    if not verifiables:
+        return []
+
+    recorder = verifiables[0].mock.recorder
+    try:
+        recorder.ensure_can_verify('verify')
+    except verificationModule.VerificationError as error:
+        return [error] * len(verifiables)
+
+    found = [recorder.lookup(verifiable) for verifiable in verifiables]
+    matched: list[list[RealInvocation]] = [[] for _ in verifiables]
+    # The recorder hands out the same bucket for the same candidates
+    by_candidates: dict[int, list[int]] = {}
+    for i, (_, others) in enumerate(found):
+        by_candidates.setdefault(id(others), []).append(i)
+    for indexes in by_candidates.values():
+        _match_together(
+            [verifiables[i] for i in indexes],
+            found[indexes[0]][1],
+            [matched[i] for i in indexes],
+        )
+
+    errors: list[verificationModule.VerificationError | None] = []
+    for verifiable, (same_calls, _), matched_invocations in zip(
+        verifiables, found, matched
+    ):
+        try:
+            verifiable._conclude(same_calls, matched_invocations)
+        except verificationModule.VerificationError as error:
+            errors.append(error)
+        else:
+            errors.append(None)
+    return errors
+
+
+def _match_together(
+    verifiables: list[VerifiableInvocation],
+    candidates: Sequence[RealInvocation],
+    matched: list[list[RealInvocation]],
+) -> None:
+    # Calls with equal plain literal arguments of the same types are matched
+    # by the same wanted invocations, so we match them only once.  Unless a
+    # wanted invocation compares on its own, or there is nothing to share.
+    share = len(verifiables) > 1 and all(
+        verifiable.compare is match_plan.compare for verifiable in verifiables
+    )
+    hits_by_key: dict[Hashable, list[int]] = {}
+    for invocation in candidates:
+        key = None
+        if share:
+            key = match_plan.call_key(
+                invocation.params, invocation.named_params
+            )
+        if key is None:
+            hits = [
+                i for i, verifiable in enumerate(verifiables)
+                if verifiable.matches(invocation)
+            ]
+        else:
+            key = (
+                key,
+                tuple(map(type, invocation.params)),
+                tuple(map(type, invocation.named_params.values())),
+            )
+            try:
+                hits = hits_by_key[key]
+            except KeyError:
+                hits = hits_by_key[key] = [
+                    i for i, verifiable in enumerate(verifiables)
+                    if verifiable.matches(invocation)
+                ]
+        for i in hits:
+            verifiables[i].capture_arguments(invocation)
+            matched[i].append(invocation)
+
+
+class EventualVerifiableInvocation(VerifiableInvocation):
+    """
+    Denotes the signature after `verify(..., timeout=...)` is called.
+
+    Instead of failing right away, the `__call__` waits up to `timeout`
+    seconds for the wanted calls, typically made by another thread.  We
+    wake up on each call the mock remembers, and then only match the calls
+    we have not seen yet.  As soon as the verification holds, or the time is
+    up, we verify as usual, which fills the captors, marks the calls as
+    verified or raises.
+    """
+    __slots__ = ('timeout',)
+
+    def __init__(
+        self,
+        mock: Mock,
+        method_name: str,
+        verification: verificationModule.VerificationMode,
+        timeout: float
+    ) -> None:
+        super().__init__(mock, method_name, verification)
+        self.timeout = timeout
+
+    def __call__(self, *params: Any, **named_params: Any) -> None:
+        self._remember_params(params, named_params)
+        self.mock.recorder.ensure_can_verify('verify')
+
+        signal = _CallSignal()
+        self.mock.attach(signal)
+        try:
+            signal.wait_until(_MatchCounter(self).satisfied, self.timeout)
+        finally:
+            self.mock.detach(signal)
+        self._verify()
+
+
+class AsyncVerifiableInvocation(EventualVerifiableInvocation):
+    """
+    Denotes the signature after `verify_async(...)` is called.
+
+    As `EventualVerifiableInvocation` but the `__call__` returns a coroutine
+    to `await`, so that the calls can be made by other tasks of the same
+    event loop meanwhile.
+    """
+    __slots__ = ()
+
+    def __call__(  # type: ignore[override]
+        self, *params: Any, **named_params: Any
+    ) -> Coroutine[Any, Any, None]:
+        self._remember_params(params, named_params)
+        return self._verify_eventually()
+
+    async def _verify_eventually(self) -> None:
+        self.mock.recorder.ensure_can_verify('verify')
+
+        signal = _AsyncCallSignal(asyncio.get_running_loop())
+        self.mock.attach(signal)
+        try:
+            await signal.wait_until(
+                _MatchCounter(self).satisfied, self.timeout
+            )
+        finally:
+            self.mock.detach(signal)
+        self._verify()
+
+
+class _MatchCounter:
+    """Count the calls matching `wanted`, only looking at the new ones.
+
+    The default recorder hands out the same, growing, lists of candidates
+    until it is cleared, so we just continue where we stopped the last time.
+    Otherwise we count all over again.
+    """
+
+    def __init__(self, wanted: VerifiableInvocation) -> None:
+        self.wanted = wanted
+        self._others: Sequence[RealInvocation] | None = None
+        self._seen = 0
+        self._count = 0
+
+    def count(self) -> int:
+        recorder = self.wanted.mock.recorder
+        same_calls, others = recorder.lookup(self.wanted)
+        if others is not self._others:
+            self._others, self._seen, self._count = others, 0, 0
+
+        for invocation in others[self._seen:]:
+            if self.wanted.matches(invocation):
+                self._count += recorder.count(invocation)
+        self._seen = len(others)
+
+        if same_calls is not None:
+            return self._count + len(same_calls)
+        return self._count
+
+    def satisfied(self) -> bool:
+        return self.wanted.verification.satisfied_by(self.count())
+
+
+class _CallSignal:
+    """Observer waking up a thread waiting for the calls of a mock."""
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.calls = 0
+
+    def update(self, invocation: RealInvocation) -> None:
+        with self.condition:
+            self.calls += 1
+            self.condition.notify_all()
+
+    def wait_until(self, predicate: Callable[[], bool], timeout: float) -> None:
+        """Wait until `predicate()` holds, checking it after each call."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self.condition:
+                seen = self.calls
+            if predicate():
+                return
+            with self.condition:
+                while self.calls == seen:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    self.condition.wait(remaining)
+
+
+class _AsyncCallSignal:
+    """Observer waking up a task waiting for the calls of a mock."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.event = asyncio.Event()
+
+    def update(self, invocation: RealInvocation) -> None:
+        # The call may come from another thread.
+        self.loop.call_soon_threadsafe(self.event.set)
+
+    async def wait_until(
+        self, predicate: Callable[[], bool], timeout: float
+    ) -> None:
+        """Wait until `predicate()` holds, checking it after each call."""
+        deadline = self.loop.time() + timeout
+        while True:
+            self.event.clear()
+            if predicate():
+                return
+            remaining = deadline - self.loop.time()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(self.event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
 
 
 def verification_has_lower_bound_of_zero(
@@ -511,6 +792,16 @@ class StubbedInvocation(MatchingInvocation):
     there is no "new" keyword in Python.)
 
     """
+    __slots__ = (
+        'verification',
+        'parent_invocation',
+        'refers_coroutine',
+        'discard_first_arg',
+        'answers',
+        'used',
+        'allow_zero_invocations',
+    )
+
     def __init__(
         self,
         mock: Mock,
@@ -578,8 +869,35 @@ class StubbedInvocation(MatchingInvocation):
         self.mock.finish_stubbing(self)
         return AnswerSelector(self, self.refers_coroutine, self.discard_first_arg)
 
+    def copy_to(
+        self,
+        mock: Mock,
+        parent_invocation: StubbedInvocation | None = None,
+    ) -> StubbedInvocation:
+        """Return an unused copy of this stub for `mock`.
+
+        Skips the checks and lookups `__init__` and `__call__` do; the copy
+        still has to be added via `mock.stub()` and `mock.finish_stubbing()`.
+        """
+        cls = self.__class__
+        stub = cls.__new__(cls)
+        stub.mock = mock
+        stub.method_name = self.method_name
+        stub.strict = self.strict
+        stub.params = self.params
+        stub.named_params = self.named_params
+        stub._match_plan = self.match_plan
+        stub.verification = self.verification
+        stub.parent_invocation = parent_invocation
+        stub.refers_coroutine = self.refers_coroutine
+        stub.discard_first_arg = self.discard_first_arg
+        stub.answers = self.answers.copy()
+        stub.used = 0
+        stub.allow_zero_invocations = self.allow_zero_invocations
+        return stub
+
     def forget_self(self) -> None:
-        if self in self.mock.stubbed_invocations:
+        if self in self.mock.stubbed_invocations_for(self.method_name):
             self.mock.forget_stubbed_invocation(self)
             self._maybe_forget_parent_chain_invocation()
 
@@ -666,14 +984,26 @@ class StubbedInvocation(MatchingInvocation):
 
     def pop_verification(self) -> verificationModule.VerificationMode | None:
         verification, self.verification = self.verification, None
+        self.mock.forget_expectation(self)
         return verification
 
     def add_answer(self, answer: Callable) -> None:
         self.answers.add(answer)
+        # A stub already used up to its former answers counts as unused again
+        if 0 < self.used < len(self.answers):
+            self.mock.mark_stub_as_unused(self)
+
+    def take_answer(self) -> Callable:
+        """Count a use of this stub and return the answer to give."""
+        used = self.used = self.used + 1
+        # Cheap pre-check, as `len(self.answers)` is `max(1, answer_count)`
+        if used == 1 or used == self.answers.answer_count:
+            if used >= len(self.answers):
+                self.mock.mark_stub_as_used(self)
+        return self.answers.next_answer()
 
     def answer_first(self, *args: Any, **kwargs: Any) -> Any:
-        self.used += 1
-        return self.answers.answer(*args, **kwargs)
+        return self.take_answer()(*args, **kwargs)
 
     def should_answer(self, invocation: RememberedInvocation) -> None:
         verification = self.verification
@@ -734,6 +1064,8 @@ class StubbedInvocation(MatchingInvocation):
 
 
 class StubbedPropertyAccess(StubbedInvocation):
+    __slots__ = ()
+
     def ensure_mocked_object_has_attribute(self, method_name: str) -> None:
         if self.mock.spec is None:
             return
@@ -762,6 +1094,19 @@ class StubbedPropertyAccess(StubbedInvocation):
             "have." % (method_name, self.mock.mocked_obj)
         )
 
+    def copy_to(
+        self,
+        mock: Mock,
+        parent_invocation: StubbedInvocation | None = None,
+    ) -> StubbedInvocation:
+        stub = super().copy_to(mock, parent_invocation)
+        # Answers calling the original descriptor need the access on `mock`
+        answers = stub.answers.answers
+        for i, answer in enumerate(answers):
+            if isinstance(answer, PropertyDescriptorAnswer):
+                answers[i] = PropertyDescriptorAnswer(stub, answer.descriptor)
+        return stub
+
     def __call__(self, *params, **named_params):
         if self.strict:
             self.ensure_mocked_object_has_attribute(self.method_name)
@@ -920,14 +1265,7 @@ class AnswerSelector(object):
             self.invocation.forget_self()
 
     def _property_descriptor_answer(self, descriptor: Any) -> Callable:
-        def answer(*args: Any, **kwargs: Any) -> Any:
-            obj, type_ = self.invocation.mock.get_current_property_access(
-                self.invocation.method_name
-            )
-            # Guarded by `hasattr(descriptor, '__get__')` in caller.
-            return descriptor.__get__(obj, type_)
-
-        return answer
+        return PropertyDescriptorAnswer(self.invocation, descriptor)
 
     def _then(self, answer: Callable) -> None:
         self.invocation.transition_to_value()
@@ -935,6 +1273,23 @@ class AnswerSelector(object):
 
 
 
+class PropertyDescriptorAnswer:
+    """Answer with the value of the original descriptor for the current
+    property access on the mock of `invocation`."""
+    __slots__ = ('invocation', 'descriptor')
+
+    def __init__(self, invocation: StubbedInvocation, descriptor: Any) -> None:
+        self.invocation = invocation
+        self.descriptor = descriptor
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        obj, type_ = self.invocation.mock.get_current_property_access(
+            self.invocation.method_name
+        )
+        # Guarded by `hasattr(descriptor, '__get__')` in caller.
+        return self.descriptor.__get__(obj, type_)
+
+
 class CompositeAnswer(object):
     def __init__(self, default_answer: Callable = return_(None)) -> None:
         #: Container for answers, which are just ordinary callables
@@ -952,14 +1307,22 @@ class CompositeAnswer(object):
         self.answer_count += 1
         self.answers.append(answer)
 
-    def answer(self, *args: Any, **kwargs: Any) -> Any:
+    def copy(self) -> CompositeAnswer:
+        """Return a copy holding the answers not given yet."""
+        other = CompositeAnswer(self.default_answer)
+        other.answers = self.answers.copy()
+        other.answer_count = len(other.answers)
+        return other
+
+    def next_answer(self) -> Callable:
         if len(self.answers) == 0:
-            return self.default_answer(*args, **kwargs)
+            return self.default_answer
 
         if len(self.answers) == 1:
-            a = self.answers[0]
-        else:
-            a = self.answers.popleft()
+            return self.answers[0]
 
-        return a(*args, **kwargs)
+        return self.answers.popleft()
+
+    def answer(self, *args: Any, **kwargs: Any) -> Any:
+        return self.next_answer()(*args, **kwargs)
 
@@ -0,0 +1,279 @@
+"""Precompiled argument matching for stubbed and verified invocations.
+
+The params of a `StubbedInvocation` or `VerifiableInvocation` never change
+after `_remember_params`.  Everything `MatchingInvocation.matches` needs to
+know about them (where the rest placeholders are, which keywords are fixed,
+how to compare each position) is thus derived once and kept in an immutable
+`MatchPlan`.
+"""
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Mapping
+
+from . import matchers
+
+
+Comparator = Callable[[Any], Any]
+
+
+# Positional tails, t.i. what happens after the fixed positions
+EXACT = 'exact'              # no rest placeholder; arity must match
+REST = 'rest'                # trailing `...` without keywords: accept all
+ARGS = 'args'                # `*args`: ignore the remaining positionals
+CAPTOR_ARGS = 'captor-args'  # `*captor`: remaining positionals go to a captor
+
+# Keyword tails
+# EXACT                      # no `**kwargs`; the key sets must be equal
+KWARGS = 'kwargs'            # `**kwargs`: ignore the remaining keywords
+CAPTOR_KWARGS = 'captor-kwargs'  # `**captor`: remaining keywords go to a captor
+
+
+# Builtin value types for which `==`, `!=` and `hash` are consistent with each
+# other.  Fixed positions holding only such values can be compared in one go.
+PLAIN_LITERAL_TYPES = frozenset({
+    str, bytes, int, float, complex, bool, type(None)
+})
+# The plain literal types which are always equal to themselves
+_NEVER_NAN_TYPES = frozenset({str, bytes, int, bool, type(None)})
+_NO_KEYWORDS: frozenset = frozenset()
+
+
+@dataclass(frozen=True)
+class MatchPlan:
+    #: Set if the invocation consists of a sole `call_captor()`
+    accepts_everything: bool
+
+    #: The fixed positional arguments, t.i. the ones before any rest
+    #: placeholder, and one comparator for each of them
+    fixed_params: tuple
+    positional: tuple[Comparator, ...]
+    #: If all fixed positional arguments are plain literals, their values
+    literal_positional: tuple | None
+    positional_tail: str
+    args_captor: matchers.CaptorArgsSentinel | None
+
+    #: `(key, value)` and `(key, comparator)` per fixed keyword argument
+    fixed_named_params: tuple[tuple[str, Any], ...]
+    keywords: tuple[tuple[str, Comparator], ...]
+    fixed_keys: frozenset
+    keyword_tail: str
+    kwargs_captor: matchers.CaptorKwargsSentinel | None
+
+    #: If the invocation consists of plain literals only, and neither has
+    #: placeholders nor matchers, a hashable key equal to `call_key` of
+    #: exactly the calls it matches
+    literal_key: Hashable | None
+
+    def matches(  # noqa: C901
+        self,
+        params: tuple,
+        named_params: Mapping,
+        compare: Callable[[Any, Any], Any] | None = None,
+    ) -> bool:
+        """Match a concrete call against this plan.
+
+        `compare` is only given if the user replaced the default
+        `MatchingInvocation.compare`.  Then every fixed argument goes through
+        it, just like before we had plans.
+        """
+        if self.accepts_everything:
+            return True
+
+        fixed = len(self.positional)
+        if self.positional_tail is EXACT:
+            if len(params) != fixed:
+                return False
+        elif len(params) < fixed:
+            return False
+
+        literals = self.literal_positional
+        if compare is not None:
+            for p1, p2 in zip(self.fixed_params, params):
+                if not compare(p1, p2):
+                    return False
+        elif literals is not None:
+            if literals != (params if len(params) == fixed else params[:fixed]):
+                return False
+        else:
+            for comparator, value in zip(self.positional, params):
+                if not comparator(value):
+                    return False
+
+        tail = self.positional_tail
+        if tail is REST:
+            return True
+        if tail is CAPTOR_ARGS:
+            if not self.args_captor.matches(params[fixed:]):  # type: ignore[union-attr]  # noqa: E501
+                return False
+
+        if self.keyword_tail is EXACT:
+            if len(named_params) != len(self.keywords):
+                return False
+
+        if compare is not None:
+            for key, p1 in self.fixed_named_params:
+                try:
+                    p2 = named_params[key]
+                except KeyError:
+                    return False
+
+                if not compare(p1, p2):
+                    return False
+        else:
+            for key, comparator in self.keywords:
+                try:
+                    value = named_params[key]
+                except KeyError:
+                    return False
+
+                if not comparator(value):
+                    return False
+
+        if self.keyword_tail is CAPTOR_KWARGS:
+            rest_kwargs = {
+                k: v
+                for k, v in named_params.items()
+                if k not in self.fixed_keys
+            }
+            if not self.kwargs_captor.matches(rest_kwargs):  # type: ignore[union-attr]  # noqa: E501
+                return False
+
+        return True
+
+
+def compile_plan(params: tuple, named_params: Mapping) -> MatchPlan:
+    accepts_everything = (
+        len(params) == 1
+        and not named_params
+        and matchers.is_call_captor(params[0])
+    )
+
+    positional_tail = EXACT
+    args_captor = None
+    fixed_params = params
+    for x, p in enumerate(params):
+        if p is Ellipsis and x == len(params) - 1 and not named_params:
+            positional_tail = REST
+        elif p is matchers.ARGS_SENTINEL:
+            positional_tail = ARGS
+        elif matchers.is_captor_args_sentinel(p):
+            positional_tail = CAPTOR_ARGS
+            args_captor = p
+        else:
+            continue
+
+        fixed_params = params[:x]
+        break
+
+    keyword_tail = EXACT
+    kwargs_captor = None
+    fixed_named_params = []
+    for key, p in named_params.items():
+        if key is matchers.KWARGS_SENTINEL:
+            if matchers.is_captor_kwargs_sentinel(p):
+                keyword_tail = CAPTOR_KWARGS
+                kwargs_captor = p
+            else:
+                keyword_tail = KWARGS
+            continue
+
+        fixed_named_params.append((key, p))
+
+    literal_positional = (
+        fixed_params
+        if all(is_plain_literal(p) for p in fixed_params)
+        else None
+    )
+    literal_key = (
+        (fixed_params, frozenset(fixed_named_params))
+        if (
+            not accepts_everything
+            and literal_positional is not None
+            and positional_tail is EXACT
+            and keyword_tail is EXACT
+            and all(is_plain_literal(p) for _, p in fixed_named_params)
+        )
+        else None
+    )
+
+    return MatchPlan(
+        accepts_everything=accepts_everything,
+        fixed_params=fixed_params,
+        positional=tuple(comparator_for(p) for p in fixed_params),
+        literal_positional=literal_positional,
+        positional_tail=positional_tail,
+        args_captor=args_captor,
+        fixed_named_params=tuple(fixed_named_params),
+        keywords=tuple((key, comparator_for(p)) for key, p in fixed_named_params),
+        fixed_keys=frozenset(key for key, _ in fixed_named_params),
+        keyword_tail=keyword_tail,
+        kwargs_captor=kwargs_captor,
+        literal_key=literal_key,
+    )
+
+
+def call_key(params: tuple, named_params: Mapping) -> Hashable | None:
+    """Return the hash key of a concrete call, or None if it has none.
+
+    Only calls with plain literal arguments have a key.  Such a call matches
+    a stub with a `literal_key` if and only if both keys are equal.
+    """
+    for value in params:
+        if type(value) not in _NEVER_NAN_TYPES and not is_plain_literal(value):
+            return None
+    if not named_params:
+        return (params, _NO_KEYWORDS)
+    for value in named_params.values():
+        if type(value) not in _NEVER_NAN_TYPES and not is_plain_literal(value):
+            return None
+    return (params, frozenset(named_params.items()))
+
+
+def compare(p1: object, p2: object) -> bool:
+    """Compare a stubbed or verified value `p1` with an actual value `p2`."""
+    if p1 is Ellipsis:
+        return True
+
+    if isinstance(p1, matchers.Matcher):
+        if not p1.matches(p2):
+            return False
+    elif p1 != p2:
+        return False
+    return True
+
+
+def comparator_for(p: object) -> Comparator:
+    """Specialize `compare` for a fixed `p1`."""
+    if p is Ellipsis:
+        return _anything
+
+    if isinstance(p, matchers.Matcher):
+        return p.matches
+
+    return functools.partial(_equals, p)
+
+
+def is_plain_literal(value: object) -> bool:
+    """Return True for builtin values that compare (and hash) consistently.
+
+    Tuples of such values qualify as well.  NaN's do not, because they are
+    not equal to themselves.
+    """
+    type_ = type(value)
+    if type_ is tuple:
+        return all(is_plain_literal(v) for v in value)  # type: ignore[attr-defined]  # noqa: E501
+    if type_ not in PLAIN_LITERAL_TYPES:
+        return False
+    return value == value
+
+
+def _anything(value: object) -> bool:
+    return True
+
+
+def _equals(expected: object, actual: object) -> bool:
+    # Spelled exactly as in `compare`: we ask the stubbed value if it
+    # differs from the actual one.
+    return not (expected != actual)
@@ -20,10 +20,12 @@
 
 from __future__ import annotations
 import weakref
-from typing import TYPE_CHECKING, Callable, Generic, TypeVar
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Callable, Generic, Iterator, TypeVar
 
 if TYPE_CHECKING:
     from .mocking import Mock
+    from .patching import Patch
 
 
 RegisterObserver = Callable[[object, "Mock"], None]
@@ -37,11 +39,31 @@ class MockRegistry:
 
     Registers mock()s, ensures that we only have one mock() per mocked_obj, and
     iterates over them to unstub each stubbed method.
+
+    Within a `scope()` mocks are registered with that scope.  Lookups see the
+    mocks of the current scope, then of the enclosing ones, then the global
+    ones.  Unstubbing only touches the mocks of the current scope.
     """
 
     def __init__(self) -> None:
-        self.mocks: IdentityMap[object, Mock] = IdentityMap()
+        self._mocks: IdentityMap[object, Mock] = IdentityMap()
         self._register_observers: list[weakref.WeakMethod] = []
+        #: The mocks, of any scope, with unused stubs or expectations.  The
+        #: checks look at these only, not at all the registered ones.
+        self._mocks_to_check: dict[Mock, None] = {}
+
+    @property
+    def mocks(self) -> IdentityMap[object, Mock]:
+        """The mocks registered in the current scope."""
+        scope = current_scope.get()
+        return self._mocks if scope is None else scope.mocks
+
+    def _visible_mocks(self) -> Iterator[IdentityMap[object, Mock]]:
+        scope = current_scope.get()
+        while scope is not None:
+            yield scope.mocks
+            scope = scope.parent
+        yield self._mocks
 
     def register(self, obj: object, mock: Mock) -> None:
         self.mocks[obj] = mock
@@ -82,11 +104,36 @@ class MockRegistry:
             if observer_ref() is not None
         ]
 
+    def outer_mocks(self, mock: Mock) -> Iterator[Mock]:
+        """Yield the visible mocks of the object of `mock` which `mock`
+        hides, t.i. the ones of the enclosing scopes, then the global one."""
+        obj = mock.mocked_obj
+        hidden = False
+        for mocks in self._visible_mocks():
+            other = mocks.get(obj, None)
+            if other is None:
+                continue
+            if hidden:
+                yield other
+            elif other is mock:
+                hidden = True
+
     def mock_for(self, obj: object) -> Mock | None:
-        return self.mocks.get(obj, None)
+        if current_scope.get() is None:
+            return self._mocks.get(obj, None)
+
+        for mocks in self._visible_mocks():
+            mock = mocks.get(obj, None)
+            if mock is not None:
+                return mock
+        return None
 
     def obj_for(self, mock: Mock) -> object | None:
-        return self.mocks.lookup(mock)
+        for mocks in self._visible_mocks():
+            obj = mocks.lookup(mock)
+            if obj is not None:
+                return obj
+        return None
 
     def unstub(self, obj: object) -> bool:
         try:
@@ -109,56 +156,135 @@ class MockRegistry:
     def get_registered_mocks(self) -> list[Mock]:
         return self.mocks.values()
 
+    def mark_to_check(self, mock: Mock) -> None:
+        self._mocks_to_check[mock] = None
+
+    def unmark_to_check(self, mock: Mock) -> None:
+        self._mocks_to_check.pop(mock, None)
+
+    def get_mocks_to_check(self) -> list[Mock]:
+        """The registered mocks of the current scope with unused stubs or
+        expectations."""
+        mocks = self.mocks
+        return [
+            mock for mock in list(self._mocks_to_check)
+            if mocks.lookup(mock, _NOT_REGISTERED) is not _NOT_REGISTERED
+        ]
+
+
+_NOT_REGISTERED = object()
+
 
 # We have this dict like because we want non-hashable items in our registry.
+# Both directions are indexed by `id()`. Since the entries hold strong
+# references to their keys and values, an `id()` cannot be reused by another
+# object while it is still part of the map.
 class IdentityMap(Generic[K, V]):
     def __init__(self) -> None:
-        self._store: list[tuple[K, V]] = []
+        self._store: dict[int, tuple[K, V]] = {}
+        self._keys_by_value: dict[int, list[K]] = {}
 
     def __setitem__(self, key: K, value: V) -> None:
-        for i, (k, _) in enumerate(self._store):
-            if k is key:
-                self._store[i] = (key, value)
-                return
-        self._store.append((key, value))
+        try:
+            _, previous = self._store[id(key)]
+        except KeyError:
+            pass
+        else:
+            self._forget_reverse_entry(key, previous)
+        self._store[id(key)] = (key, value)
+        self._keys_by_value.setdefault(id(value), []).append(key)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __iter__(self) -> Iterator[K]:
+        return (k for k, v in self._store.values())
 
     def remove(self, key: K) -> None:
-        for i, (k, _) in enumerate(self._store):
-            if k is key:
-                del self._store[i]
-                return
+        try:
+            self.pop(key)
+        except KeyError:
+            pass
 
     def pop(self, key: K) -> V:
-        for i, (k, value) in enumerate(self._store):
-            if k is key:
-                del self._store[i]
-                return value
-        raise KeyError()
+        try:
+            _, value = self._store.pop(id(key))
+        except KeyError:
+            raise KeyError()
+        self._forget_reverse_entry(key, value)
+        return value
 
     def pop_value(self, value: V) -> V:
-        for i, (key, val) in enumerate(self._store):
-            if val is value:
-                del self._store[i]
-                return val
-        raise KeyError()
+        try:
+            key = self._keys_by_value[id(value)][0]
+        except KeyError:
+            raise KeyError()
+        return self.pop(key)
 
     def get(self, key: K, default: T | None = None) -> V | T | None:
-        for k, value in self._store:
-            if k is key:
-                return value
-        return default
+        try:
+            return self._store[id(key)][1]
+        except KeyError:
+            return default
 
     def lookup(self, value: V, default: T | None = None) -> K | T | None:
-        for key, v in self._store:
-            if v is value:
-                return key
-        return default
+        try:
+            return self._keys_by_value[id(value)][0]
+        except KeyError:
+            return default
 
     def values(self) -> list[V]:
-        return [v for k, v in self._store]
+        return [v for k, v in self._store.values()]
+
+    def items(self) -> list[tuple[K, V]]:
+        return list(self._store.values())
 
     def clear(self) -> None:
-        self._store[:] = []
+        self._store.clear()
+        self._keys_by_value.clear()
+
+    def _forget_reverse_entry(self, key: K, value: V) -> None:
+        keys = self._keys_by_value[id(value)]
+        for i, k in enumerate(keys):
+            if k is key:
+                del keys[i]
+                break
+        if not keys:
+            del self._keys_by_value[id(value)]
 
 
+class Scope:
+    """The mocks and patches made within a `scope()`.
+
+    Stubs on objects shared with other code, e.g. classes and modules, are
+    not patched in directly.  We patch in a dispatcher once for all scopes
+    instead, and keep the replacements of each scope in `replacements`.  On
+    access the dispatcher looks up the one of the current scope.
+    """
+
+    def __init__(self, parent: Scope | None) -> None:
+        self.parent = parent
+        self.mocks: IdentityMap[object, Mock] = IdentityMap()
+        #: The patches applied within this scope, in the order of application
+        self.patches: dict[Patch, None] = {}
+        #: The replacements per `(id(obj), attr_name)`, newest last
+        self.replacements: dict[tuple[int, str], list[object]] = {}
+
+    def replacement_for(self, key: tuple[int, str]) -> object | None:
+        """Return the newest replacement for `key`, also looking at the
+        enclosing scopes."""
+        scope: Scope | None = self
+        while scope is not None:
+            stack = scope.replacements.get(key)
+            if stack:
+                return stack[-1]
+            scope = scope.parent
+        return None
+
+
+#: The current `Scope`; each thread and asyncio task has its own.
+current_scope: ContextVar[Scope | None] = ContextVar(
+    'mockito_scope', default=None
+)
+
 mock_registry = MockRegistry()
@@ -21,17 +21,23 @@
 from __future__ import annotations
 import inspect
 import operator
+import sys
+import threading
 import types
 import functools
+import itertools
 from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Callable, Iterable, Iterator, cast
+from typing import (
+    Any, AsyncIterator, Callable, Hashable, Iterable, Iterator, Sequence, cast
+)
 
-from . import invocation, sameish, signature, utils
+from . import invocation, recording, sameish, signature, utils
+from .stub_index import StubIndex
 from . import verification as verificationModule
-from .mock_registry import mock_registry
-from .patching import Patch, patcher
+from .mock_registry import current_scope, mock_registry
+from .patching import Patch, original_of, patcher
 
 
 __all__ = ['mock']
@@ -310,7 +316,7 @@ def _should_continue_with_stubbed_invocation(
 class _mocked_property:
     def __init__(self, mock, method_name):
         self.mock = mock
-        self.method_name = method_name
+        self.method_name = sys.intern(method_name)
 
     def __get__(self, obj, type):
         # For property/descriptors, `thenCallOriginalImplementation()` must
@@ -331,6 +337,10 @@ class _mocked_property:
 
 
 class Mock:
+    #: Within a `scope()`, patch only for the code running in that scope, as
+    #: other code may use the `mocked_obj` too
+    patch_per_scope = True
+
     def __init__(
         self,
         mocked_obj: object,
@@ -340,9 +350,24 @@ class Mock:
         self.mocked_obj = mocked_obj
         self.strict = strict
         self.spec = spec
+        #: The `scope()` this mock belongs to, if any
+        self.scope = current_scope.get()
 
-        self.invocations: list[invocation.RealInvocation] = []
+        self.recorder: recording.Recorder = recording.Recorder()
+        #: Set in thread-safe mode; guards choosing and counting answers
+        self.lock: threading.RLock | None = None
         self.stubbed_invocations: deque[invocation.StubbedInvocation] = deque()
+        # Same stubs, grouped by method name.  Calls only need to look at
+        # the candidates for the called name.
+        self._stubs_by_method: dict[str, StubIndex] = {}
+        # Shared by the indexes, so that the ages of all stubs compare
+        self._stub_counter = itertools.count()
+        # The stubs `verifyStubbedInvocationsAreUsed` would complain about,
+        # and the ones set up via `expect`, so that the global checks do not
+        # need to look at every stub.  While there are any, the registry
+        # keeps us as a mock to check.
+        self._unused_stubs: dict[invocation.StubbedInvocation, None] = {}
+        self._expectations: dict[invocation.StubbedInvocation, None] = {}
 
         self._original_methods: dict[str, object | None] = {}
         self._methods_to_unstub: dict[str, Patch] = {}
@@ -354,10 +379,23 @@ class Mock:
             invocation.StubbedInvocation,
             invocation.ConfiguredContinuation,
         ] = {}
+        # The stubs with a continuation, by method name and their sameish
+        # fingerprint.  Stubs without a fingerprint are kept under None.
+        self._continued_stubs: dict[
+            str, dict[Hashable, dict[invocation.StubbedInvocation, None]]
+        ] = {}
 
         self._observers: list = []
         self._methods_marked_as_coroutine: set[str] = set()
 
+    def __deepcopy__(self, memo) -> Mock:
+        # Copies of a `mock()` share its Mock, as they share its class
+        return self
+
+    def patch_target(self, attr_name: str) -> object:
+        """Return the object to patch `attr_name` on, usually `mocked_obj`."""
+        return self.mocked_obj
+
     def attach(self, observer) -> None:
         if observer not in self._observers:
             self._observers.append(observer)
@@ -368,8 +406,29 @@ class Mock:
         except ValueError:
             pass
 
+    @property
+    def invocations(self) -> Sequence[invocation.RealInvocation]:
+        """The recorded invocations; all of them unless `set_recording`."""
+        return self.recorder.invocations
+
+    def set_recording(self, policy: recording.Policy) -> None:
+        recorder = recording.recorder_for(policy)
+        if self.lock is not None:
+            recorder = recording.ThreadSafeRecorder(recorder)
+        self.recorder = recorder
+
+    def set_thread_safe(self, enabled: bool) -> None:
+        recorder = self.recorder
+        if enabled and self.lock is None:
+            self.lock = threading.RLock()
+            self.recorder = recording.ThreadSafeRecorder(recorder)
+        elif not enabled and self.lock is not None:
+            self.lock = None
+            if isinstance(recorder, recording.ThreadSafeRecorder):
+                self.recorder = recorder.flush()
+
     def remember(self, invocation: invocation.RealInvocation) -> None:
-        self.invocations.append(invocation)
+        self.recorder.remember(invocation)
         for observer in self._observers:
             observer.update(invocation)
 
@@ -377,9 +436,82 @@ class Mock:
         self, stubbed_invocation: invocation.StubbedInvocation
     ) -> None:
         self.stubbed_invocations.appendleft(stubbed_invocation)
+        try:
+            index = self._stubs_by_method[stubbed_invocation.method_name]
+        except KeyError:
+            index = self._stubs_by_method[stubbed_invocation.method_name] = \
+                StubIndex(self._stub_counter)
+        index.add(stubbed_invocation)
+        if not stubbed_invocation.allow_zero_invocations:
+            self._unused_stubs[stubbed_invocation] = None
+        if stubbed_invocation.verification:
+            self._expectations[stubbed_invocation] = None
+        self._update_to_check()
+
+    def mark_stub_as_used(self, stub: invocation.StubbedInvocation) -> None:
+        self._unused_stubs.pop(stub, None)
+        if not self._unused_stubs:
+            self._update_to_check()
+
+    def mark_stub_as_unused(self, stub: invocation.StubbedInvocation) -> None:
+        if (
+            not stub.allow_zero_invocations
+            and stub in self.stubbed_invocations_for(stub.method_name)
+        ):
+            self._unused_stubs[stub] = None
+            self._update_to_check()
+
+    def _update_to_check(self) -> None:
+        if self._unused_stubs or self._expectations:
+            mock_registry.mark_to_check(self)
+        else:
+            mock_registry.unmark_to_check(self)
+
+    def unused_stubs(self) -> list[invocation.StubbedInvocation]:
+        """Return the stubs not used as often as they have answers, newest
+        first.
+
+        Stubs allowed to go unused, e.g. via `expect(..., times=0)`, are
+        left out.
+        """
+        if not self._unused_stubs:
+            return []
+        return sorted(self._unused_stubs, key=self._age_of, reverse=True)
+
+    def _age_of(self, stub: invocation.StubbedInvocation) -> int:
+        age = self._stubs_by_method[stub.method_name].age_of(stub)
+        assert age is not None
+        return age
+
+    def expectations(self) -> list[invocation.StubbedInvocation]:
+        """Return the stubs set up via `expect`, newest first."""
+        return list(reversed(self._expectations))
+
+    def forget_expectation(self, stub: invocation.StubbedInvocation) -> None:
+        self._expectations.pop(stub, None)
+        self._update_to_check()
+
+    def stubbed_invocations_for(
+        self, method_name: str
+    ) -> deque[invocation.StubbedInvocation]:
+        """Return the stubs for `method_name`, newest first."""
+        try:
+            return self._stubs_by_method[method_name].stubs
+        except KeyError:
+            return _NO_STUBS
+
+    def find_stub_for(
+        self, invoc: invocation.RealInvocation
+    ) -> invocation.StubbedInvocation | None:
+        """Return the newest stub matching the call `invoc`, if any."""
+        try:
+            index = self._stubs_by_method[invoc.method_name]
+        except KeyError:
+            return None
+        return index.find(invoc)
 
     def clear_invocations(self) -> None:
-        self.invocations = []
+        self.recorder.clear()
 
     def continuation_for(
         self, invoc: invocation.StubbedInvocation
@@ -388,26 +520,56 @@ class Mock:
         if continuation is not None:
             return continuation
 
-        for other in self._sameish_invocations(invoc):
-            configured_continuation = self._continuations.get(other)
-            if isinstance(configured_continuation, invocation.ValueContinuation):
-                return configured_continuation
-
-            if isinstance(configured_continuation, invocation.ChainContinuation):
-                # We do not keep mixed continuation modes (`Value` and `Chain`)
-                # alive at the same time. So the first chain continuation
-                # can be returned immediately.
-                return configured_continuation
+        # We do not keep mixed continuation modes (`Value` and `Chain`) alive
+        # at the same time.  So the newest configured continuation decides.
+        other = self._newest_sameish_invocation(invoc)
+        if other is not None:
+            return self._continuations[other]
 
         return invocation.UnconfiguredContinuation()
 
+    def configured_continuation(
+        self, invoc: invocation.StubbedInvocation
+    ) -> invocation.ConfiguredContinuation | None:
+        """Return the continuation configured on `invoc` itself, if any."""
+        return self._continuations.get(invoc)
+
     def set_continuation(self, continuation: invocation.ConfiguredContinuation) -> None:
-        self._continuations[continuation.invocation] = continuation
+        self.set_continuation_by_fingerprint(
+            continuation, sameish.fingerprint(continuation.invocation)
+        )
 
-    def _sameish_invocations(
+    def set_continuation_by_fingerprint(
+        self,
+        continuation: invocation.ConfiguredContinuation,
+        fingerprint: Hashable | None,
+    ) -> None:
+        """Like `set_continuation`, with the sameish fingerprint of its
+        invocation already known."""
+        invoc = continuation.invocation
+        self._continuations[invoc] = continuation
+        self._continued_stubs.setdefault(invoc.method_name, {}).setdefault(
+            fingerprint, {}
+        )[invoc] = None
+
+    def _forget_continuation(self, invoc: invocation.StubbedInvocation) -> None:
+        if self._continuations.pop(invoc, None) is None:
+            return
+
+        by_fingerprint = self._continued_stubs[invoc.method_name]
+        fingerprint = sameish.fingerprint(invoc)
+        same_fingerprint = by_fingerprint[fingerprint]
+        same_fingerprint.pop(invoc)
+        if not same_fingerprint:
+            del by_fingerprint[fingerprint]
+            if not by_fingerprint:
+                del self._continued_stubs[invoc.method_name]
+
+    def _newest_sameish_invocation(
         self, same: invocation.StubbedInvocation
-    ) -> list[invocation.StubbedInvocation]:
-        """Find prior stubs that are signature-compatible.
+    ) -> invocation.StubbedInvocation | None:
+        """Find the newest prior stub that is signature-compatible and has a
+        continuation.
 
         This is used only for continuation bookkeeping (value-vs-chain mode),
         not for runtime call dispatch. The comparison is structural and avoids
@@ -421,18 +583,40 @@ class Mock:
 
         should share the same root continuation for `meow()`.
         """
-        sameish: list[invocation.StubbedInvocation] = []
-        for invoc in self.stubbed_invocations:
-            if invoc is same:
-                continue
-
-            if invoc.method_name != same.method_name:
-                continue
+        by_fingerprint = self._continued_stubs.get(same.method_name)
+        index = self._stubs_by_method.get(same.method_name)
+        if not by_fingerprint or index is None:
+            return None
 
-            if self._invocations_are_sameish(invoc, same):
-                sameish.append(invoc)
+        # Equal fingerprints mean sameish invocations.  Only the stubs without
+        # a fingerprint must be compared one by one.
+        fingerprint = sameish.fingerprint(same)
+        if fingerprint is None:
+            candidates: Iterable[invocation.StubbedInvocation] = (
+                invoc
+                for same_fingerprint in by_fingerprint.values()
+                for invoc in same_fingerprint
+                if self._invocations_are_sameish(invoc, same)
+            )
+        else:
+            candidates = itertools.chain(
+                by_fingerprint.get(fingerprint, ()),
+                (
+                    invoc
+                    for invoc in by_fingerprint.get(None, ())
+                    if self._invocations_are_sameish(invoc, same)
+                ),
+            )
 
-        return sameish
+        newest = None
+        newest_age = -1
+        for invoc in candidates:
+            age = index.age_of(invoc)
+            # Stubs forgotten but configured later on via an old answer
+            # selector have no age.
+            if age is not None and age > newest_age and invoc is not same:
+                newest, newest_age = invoc, age
+        return newest
 
     def _invocations_are_sameish(
         self,
@@ -491,7 +675,14 @@ class Mock:
         if self.spec is None:
             return None, False
 
-        return utils.get_original_attribute(self.spec, method_name, default=None)
+        original, was_in_spec = utils.get_original_attribute(
+            self.spec, method_name, default=None
+        )
+        # Other scopes may have patched the spec already
+        original = original_of(original)
+        if original is utils.MISSING_ATTRIBUTE:
+            return None, was_in_spec
+        return original, was_in_spec
 
     def replace_method(
         self,
@@ -499,6 +690,8 @@ class Mock:
         original_method: object | None,
     ) -> Patch:
         discard_first_arg = self._takes_implicit_self_or_cls(original_method)
+        # All invocations recorded by this method share the name
+        method_name = sys.intern(method_name)
 
         def new_mocked_method(*args, **kwargs):
             return remembered_invocation_builder(
@@ -534,10 +727,11 @@ class Mock:
             new_mocked_method = staticmethod(new_mocked_method)
 
         return patcher.patch_attribute(
-            self.mocked_obj,
+            self.patch_target(method_name),
             method_name,
             new_mocked_method,
             allow_unstub_by_replacement=False,
+            per_scope=self.patch_per_scope,
         )
 
     def stub(self, method_name: str) -> None:
@@ -558,25 +752,29 @@ class Mock:
             original_method, _ = self._get_original_method_before_stub(method_name)
             self._original_methods[method_name] = original_method
             self._methods_to_unstub[method_name] = patcher.patch_attribute(
-                self.mocked_obj,
+                self.patch_target(method_name),
                 method_name,
                 _mocked_property(self, method_name),
                 allow_unstub_by_replacement=False,
+                per_scope=self.patch_per_scope,
             )
 
 
     def forget_stubbed_invocation(
         self, invocation: invocation.StubbedInvocation
     ) -> None:
-        assert invocation in self.stubbed_invocations
+        same_named = self._stubs_by_method[invocation.method_name]
+        assert invocation in same_named.stubs
 
+        same_named.remove(invocation)
         self.stubbed_invocations.remove(invocation)
-        self._continuations.pop(invocation, None)
+        self._unused_stubs.pop(invocation, None)
+        self._expectations.pop(invocation, None)
+        self._update_to_check()
+        self._forget_continuation(invocation)
 
-        if not any(
-            inv.method_name == invocation.method_name
-            for inv in self.stubbed_invocations
-        ):
+        if not same_named:
+            del self._stubs_by_method[invocation.method_name]
             patch = self._methods_to_unstub.pop(invocation.method_name)
             patch.restore_and_unregister()
 
@@ -586,31 +784,28 @@ class Mock:
         mock_registry.unstub(self.mocked_obj)
 
     def unstub_method(self, method_name: str) -> None:
-        invocations = [
-            invoc
-            for invoc in self.stubbed_invocations
-            if invoc.method_name == method_name
-        ]
+        invocations = list(self.stubbed_invocations_for(method_name))
         if not invocations:
             return
 
         for invoc in invocations:
             invoc.forget_self()
 
-        self.invocations = [
-            invocation
-            for invocation in self.invocations
-            if invocation.method_name != method_name
-        ]
+        self.recorder.forget_method(method_name)
 
     def unstub(self) -> None:
         while self._methods_to_unstub:
             _, patch = self._methods_to_unstub.popitem()
             patch.restore_and_unregister()
         self.stubbed_invocations = deque()
-        self.invocations = []
+        self._stubs_by_method = {}
+        self._unused_stubs = {}
+        self._expectations = {}
+        mock_registry.unmark_to_check(self)
+        self.recorder.clear()
         self._methods_marked_as_coroutine = set()
         self._continuations = {}
+        self._continued_stubs = {}
 
     # SPECCING
 
@@ -641,6 +836,10 @@ class Mock:
         if self.spec is None:
             return True
 
+        # We only ever took the signature of existing attributes
+        if method_name in self._signatures_store:
+            return True
+
         return hasattr(self.spec, method_name)
 
     def get_signature(self, method_name: str) -> signature.Signature | None:
@@ -682,6 +881,9 @@ def _is_coroutine_method(method: object | None) -> bool:
     return inspect.iscoroutinefunction(method)
 
 
+_NO_STUBS: deque[invocation.StubbedInvocation] = deque(maxlen=0)
+
+
 class _OMITTED(object):
     def __repr__(self):
         return 'OMITTED'
@@ -689,63 +891,18 @@ class _OMITTED(object):
 
 OMITTED = _OMITTED()
 
-def mock(config_or_spec=None, spec=None, strict=OMITTED):  # noqa: C901
-    """Create 'empty' objects ('Mocks').
-
-    Will create an empty unconfigured object, that you can pass
-    around. All interactions (method calls) will be recorded and can be
-    verified using :func:`verify` et.al.
-
-    A plain `mock()` will be not `strict`, and thus all methods regardless
-    of the arguments will return ``None``.
-
-    .. note:: Technically all attributes will return an internal interface.
-        Because of that a simple ``if mock().foo:`` will surprisingly pass.
-
-    If you set strict to ``True``: ``mock(strict=True)`` all unexpected
-    interactions will raise an error instead.
-
-    You configure a mock using :func:`when`, :func:`when2` or :func:`expect`.
-    You can also very conveniently just pass in a dict here::
-
-        response = mock({'text': 'ok', 'raise_for_status': lambda: None})
-
-    You can also create an empty Mock which is specced against a given
-    `spec`: ``mock(requests.Response)``. These mock are by default strict,
-    thus they raise if you want to stub a method, the spec does not implement.
-    Mockito will also match the function signature.
-
-    You can pre-configure a specced mock as well::
-
-        response = mock({'json': lambda: {'status': 'Ok'}},
-                        spec=requests.Response)
-
-    Mocks are by default callable. Configure the callable behavior using
-    `when`::
-
-        dummy = mock()
-        when(dummy).__call__(1).thenReturn(2)
-
-    All other magic methods must be configured this way or they will raise an
-    AttributeError.
-
-
-    See :func:`verify` to verify your interactions after usage.
-
-    """
-
-    if type(config_or_spec) is dict:
-        config, spec = config_or_spec, spec
-    else:
-        config, spec = {}, spec or config_or_spec
-
-    if strict is OMITTED:
-        strict = False if spec is None else True
+def _make_dummy_template(has_spec: bool, strict: bool) -> type:  # noqa: C901
+    class Dummy(_Dummy):
+        __qualname__ = 'Dummy'
+        __slots__ = ('__mock',)
 
+        def __init__(self, mock):
+            self.__mock = mock
 
-    class Dummy(_Dummy):
-        if spec:
-            __class__ = spec  # make isinstance work
+        if has_spec:
+            @property  # type: ignore[misc]
+            def __class__(self):  # make isinstance work
+                return self.__mock.spec
 
         def __getattr__(self, method_name):
             if strict:
@@ -771,11 +928,12 @@ def mock(config_or_spec=None, spec=None, strict=OMITTED):  # noqa: C901
             # If a descriptor exists on the dummy class, resolve it here so
             # InvocationError from descriptor-backed stubs is not converted
             # into a dynamic fallback attribute.
+            taken_on_class = True
             if method_name != "__call__":
                 try:
                     class_attr = inspect.getattr_static(type(self), method_name)
                 except AttributeError:
-                    pass
+                    taken_on_class = False
                 else:
                     if hasattr(class_attr, "__get__"):
                         try:
@@ -786,34 +944,165 @@ def mock(config_or_spec=None, spec=None, strict=OMITTED):  # noqa: C901
                             # Keep dynamic-attribute behavior for descriptors that
                             # deliberately signal missing via AttributeError.
 
+            theMock = self.__mock
+            interned_name = sys.intern(method_name)
+
             def ad_hoc_function(*args, **kwargs):
                 return remembered_invocation_builder(
-                    theMock, method_name, False, *args, **kwargs
+                    theMock, interned_name, False, *args, **kwargs
                 )
             ad_hoc_function.__name__ = method_name
-            ad_hoc_function.__self__ = obj  # type: ignore[attr-defined]
-            if spec:
+            ad_hoc_function.__self__ = self  # type: ignore[attr-defined]
+            if has_spec:
                 try:
-                    original_method = getattr(spec, method_name)
+                    original_method = getattr(theMock.spec, method_name)
                     ad_hoc_function.__wrapped__ = original_method  # type: ignore[attr-defined]  # noqa: E501
                     ad_hoc_function.__doc__ = original_method.__doc__
                 except AttributeError:
                     pass
 
+            # Remember the function, so that the next lookup does not even
+            # get here.  As the `__dict__` would shadow a method we stub later
+            # on the class, `_DummyMock.patch_target` drops it again.
+            if not taken_on_class:
+                self.__dict__[method_name] = ad_hoc_function
             return ad_hoc_function
 
         def __repr__(self):
             name = 'Dummy'
-            if spec:
-                name += spec.__name__
+            if has_spec:
+                name += self.__mock.spec.__name__
             return "<%s id=%s>" % (name, id(self))
 
+        def __reduce_ex__(self, protocol):
+            # A copy shares the class and the Mock, and thus the stubs.  So
+            # the class must be ours before we copy, else the copy misses
+            # the stubs we add later.  Our cached functions stay with us.
+            theMock = self.__mock
+            cls = theMock.own_class()
+            state = {
+                name: value
+                for name, value in vars(self).items()
+                if not _is_ad_hoc_function(value, self)
+            }
+            return cls, (theMock,), state
+
+    return Dummy
+
+
+# All `mock()`s of the same kind share one of these classes, until we need to
+# patch the class of a particular one, see `_DummyMock.patch_target`.
+_DUMMY_TEMPLATES = {
+    (has_spec, strict): _make_dummy_template(has_spec, strict)
+    for has_spec in (False, True)
+    for strict in (False, True)
+}
+
+
+def _dummy_template(has_spec: bool, strict: bool) -> type:
+    return _DUMMY_TEMPLATES[(has_spec, strict)]
+
+
+_set_class = object.__dict__['__class__'].__set__
+
+
+class _DummyMock(Mock):
+    """The Mock of a `mock()`, which patches the class of its dummy.
+
+    That class starts out as a template shared with other dummies.  Creating
+    a class per dummy is expensive, so we do it only once we patch it.
+    """
+
+    mocked_obj: type
+    #: The object `mock()` returned
+    dummy: object
+    _owns_class = False
+    # Once patched, the class is ours alone
+    patch_per_scope = False
+
+    def own_class(self) -> type:
+        """Give the dummy a class of its own, if it still has the template."""
+        if not self._owns_class:
+            own_class = type('Dummy', (self.mocked_obj,), {'__slots__': ()})
+            _set_class(self.dummy, own_class)
+            self.mocked_obj = own_class
+            self._owns_class = True
+        return self.mocked_obj
+
+    def patch_target(self, attr_name: str) -> object:
+        self.own_class()
+        attrs = vars(self.dummy)
+        if _is_ad_hoc_function(attrs.get(attr_name), self.dummy):
+            del attrs[attr_name]
+        return self.mocked_obj
+
+
+def _is_ad_hoc_function(value: object, dummy: object) -> bool:
+    return (
+        isinstance(value, types.FunctionType)
+        and getattr(value, '__self__', None) is dummy
+    )
+
+
+def mock(config_or_spec=None, spec=None, strict=OMITTED):  # noqa: C901
+    """Create 'empty' objects ('Mocks').
+
+    Will create an empty unconfigured object, that you can pass
+    around. All interactions (method calls) will be recorded and can be
+    verified using :func:`verify` et.al.
+
+    A plain `mock()` will be not `strict`, and thus all methods regardless
+    of the arguments will return ``None``.
+
+    .. note:: Technically all attributes will return an internal interface.
+        Because of that a simple ``if mock().foo:`` will surprisingly pass.
+
+    If you set strict to ``True``: ``mock(strict=True)`` all unexpected
+    interactions will raise an error instead.
+
+    You configure a mock using :func:`when`, :func:`when2` or :func:`expect`.
+    You can also very conveniently just pass in a dict here::
+
+        response = mock({'text': 'ok', 'raise_for_status': lambda: None})
+
+    You can also create an empty Mock which is specced against a given
+    `spec`: ``mock(requests.Response)``. These mock are by default strict,
+    thus they raise if you want to stub a method, the spec does not implement.
+    Mockito will also match the function signature.
+
+    You can pre-configure a specced mock as well::
+
+        response = mock({'json': lambda: {'status': 'Ok'}},
+                        spec=requests.Response)
+
+    Mocks are by default callable. Configure the callable behavior using
+    `when`::
+
+        dummy = mock()
+        when(dummy).__call__(1).thenReturn(2)
+
+    All other magic methods must be configured this way or they will raise an
+    AttributeError.
+
+
+    See :func:`verify` to verify your interactions after usage.
+
+    """
+
+    if type(config_or_spec) is dict:
+        config, spec = config_or_spec, spec
+    else:
+        config, spec = {}, spec or config_or_spec
+
+    if strict is OMITTED:
+        strict = False if spec is None else True
 
     # That's a tricky one: The object we will return is an *instance* of our
     # Dummy class, but the mock we register will point and patch the class.
     # T.i. so that magic methods (`__call__` etc.) can be configured.
-    obj = Dummy()
-    theMock = Mock(Dummy, strict=strict, spec=spec)
+    Dummy = _dummy_template(bool(spec), bool(strict))
+    theMock = _DummyMock(Dummy, strict=strict, spec=spec)
+    obj = theMock.dummy = Dummy(theMock)
 
     normalized_names = {
         _normalize_config_key(raw_name)[0]
@@ -823,7 +1112,6 @@ def mock(config_or_spec=None, spec=None, strict=OMITTED):  # noqa: C901
     for raw_name, value in config.items():
         _configure_mock_from_shorthand(
             theMock,
-            Dummy,
             obj,
             raw_name,
             value,
@@ -836,7 +1124,6 @@ def mock(config_or_spec=None, spec=None, strict=OMITTED):  # noqa: C901
 
 def _configure_mock_from_shorthand(
     theMock: Mock,
-    Dummy: type,
     obj: object,
     raw_name: str,
     value: object,
@@ -894,7 +1181,7 @@ def _configure_mock_from_shorthand(
             % raw_name
         )
 
-    setattr(Dummy, method_name, value)
+    setattr(theMock.patch_target(method_name), method_name, value)
 
 
 def _normalize_config_key(raw_name: str) -> tuple[str, bool]:
@@ -20,14 +20,16 @@
 
 from __future__ import annotations
 from collections.abc import Iterable, MutableMapping
+from contextlib import contextmanager
 import operator
+import textwrap
 
 from . import invocation
 from . import verification
 
 from .utils import deprecated, get_obj, get_obj_attr_tuple
 from .mocking import Chain, Mock
-from .mock_registry import mock_registry
+from .mock_registry import Scope, current_scope, mock_registry
 from .patching import restore_patch_contextmanager, patcher
 from .verification import VerificationError
 
@@ -99,7 +101,10 @@ def _get_wanted_verification(
 
 def _get_mock(obj: object, strict=True) -> Mock:
     theMock = mock_registry.mock_for(obj)
-    if theMock is None:
+    if theMock is None or (
+        # Within a scope, stub shared objects on a mock of the scope
+        theMock.patch_per_scope and theMock.scope is not current_scope.get()
+    ):
         theMock = Mock(obj, strict=strict, spec=obj)
         mock_registry.register(obj, theMock)
     return theMock
@@ -117,6 +122,7 @@ def verify(
     atmost=None,
     between=None,
     inorder=False,
+    timeout=None,
     _factory=None,
 ):
     """Central interface to verify interactions.
@@ -139,6 +145,18 @@ def verify(
         verify(manager).add_tasks(...)       # Py3
         verify(manager).add_tasks(Ellipsis)  # Py2
 
+    If the calls are made by another thread, pass a `timeout` in seconds
+    to wait for them::
+
+        worker.start()
+        verify(manager, timeout=2).add_tasks(...)
+
+    `verify` then blocks until the verification holds, and returns right
+    away as soon as it does; only after `timeout` seconds it fails as usual.
+    Note that e.g. ``times=0`` or `atmost` hold from the start; `verify`
+    doesn't wait for more calls then.  For code running on an event loop,
+    see :func:`verify_async`.
+
     """
 
     if isinstance(obj, str):
@@ -149,7 +167,12 @@ def verify(
             times=times, atleast=atleast, atmost=atmost, between=between
         ) or verification.Times(1)
     )
+    _check_timeout(timeout)
     if inorder:
+        if timeout is not None:
+            raise ArgumentError(
+                "You can set only one of the arguments: 'inorder' or "
+                "'timeout'.")
         verification_fn = verification.InOrder(verification_fn)
 
     theMock = _get_mock_or_raise(obj)
@@ -158,11 +181,145 @@ def verify(
 
     class Verify(object):
         def __getattr__(self, method_name):
+            if timeout is not None:
+                return invocation.EventualVerifiableInvocation(
+                    theMock, method_name, verification_fn, timeout
+                )
             return factory(theMock, method_name, verification_fn)
 
     return Verify()
 
 
+def verify_async(
+    obj, times=None, atleast=None, atmost=None, between=None, timeout=None
+):
+    """Verify interactions, waiting for calls made by other tasks.
+
+    Like :func:`verify` with a `timeout`, but you ``await`` the result,
+    so that the event loop runs the code making the calls meanwhile::
+
+        asyncio.create_task(manager.run())
+        await verify_async(manager, timeout=2).add_tasks(...)
+
+    The calls may also come from other threads.  Without a `timeout` this
+    checks the calls right away, as :func:`verify` does.
+
+    """
+    if isinstance(obj, str):
+        obj = get_obj(obj)
+
+    verification_fn = (
+        _get_wanted_verification(
+            times=times, atleast=atleast, atmost=atmost, between=between
+        ) or verification.Times(1)
+    )
+    _check_timeout(timeout)
+    timeout = timeout or 0
+
+    theMock = _get_mock_or_raise(obj)
+
+    class Verify(object):
+        def __getattr__(self, method_name):
+            return invocation.AsyncVerifiableInvocation(
+                theMock, method_name, verification_fn, timeout
+            )
+
+    return Verify()
+
+
+def _check_timeout(timeout) -> None:
+    if timeout is not None and not timeout >= 0:
+        raise ArgumentError(
+            "'timeout' argument has invalid value.\n"
+            "It should be at least 0.  You wanted to set it to: %s" % timeout
+        )
+
+
+def verifying(obj):
+    """Collect verifications for `obj` and check them all at once.
+
+    Within the ``with`` block you spell out the wanted calls as with
+    :func:`verify`, and on exit they are checked together::
+
+        with verifying(cat) as v:
+            v.meow()
+            v(times=2).purr(...)
+            v(atleast=1).eat('fish')
+
+    Calling ``v`` takes the same verification arguments as :func:`verify`,
+    ``times``, ``atleast``, ``atmost`` and ``between``; the default is
+    ``times=1``.  Instead of stopping at the first failure, the raised
+    `VerificationError` lists all wanted calls that failed.  Nothing is
+    checked if the block raises.
+
+    """
+    if isinstance(obj, str):
+        obj = get_obj(obj)
+
+    return _Verifying(_get_mock_or_raise(obj))
+
+
+class _Verifying(object):
+    # Slots with mangled names, so that no method of the mock is shadowed
+    __slots__ = ('__mock', '__wanted')
+
+    def __init__(self, theMock: Mock) -> None:
+        self.__mock = theMock
+        self.__wanted: list[
+            tuple[invocation.VerifiableInvocation, tuple, dict]
+        ] = []
+
+    def __call__(self, times=None, atleast=None, atmost=None, between=None):
+        verification_fn = (
+            _get_wanted_verification(
+                times=times, atleast=atleast, atmost=atmost, between=between
+            ) or verification.Times(1)
+        )
+        wanted = self.__wanted
+        theMock = self.__mock
+
+        class Verify(object):
+            def __getattr__(self, method_name):
+                def collect(*args, **kwargs):
+                    wanted.append((
+                        invocation.VerifiableInvocation(
+                            theMock, method_name, verification_fn
+                        ),
+                        args,
+                        kwargs,
+                    ))
+                return collect
+
+        return Verify()
+
+    def __getattr__(self, method_name):
+        return getattr(self(), method_name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            _verify_all(self.__wanted)
+
+
+def _verify_all(
+    wanted: list[tuple[invocation.VerifiableInvocation, tuple, dict]]
+) -> None:
+    errors = invocation.verify_together(wanted)
+    failures = [
+        "\n%s:%s" % (verifiable, textwrap.indent(str(error), '    '))
+        for (verifiable, _, _), error in zip(wanted, errors)
+        if error is not None
+    ]
+
+    if failures:
+        raise VerificationError(
+            "\n%i of %i wanted calls failed verification:\n%s"
+            % (len(failures), len(wanted), "\n".join(failures))
+        )
+
+
 class _OMITTED(object):
     def __repr__(self):
         return 'OMITTED'
@@ -359,6 +516,11 @@ def patch_dict(mapping_or_path, values=None, *, clear=False, remove=None, **kwar
     ``with`` context management is supported and restores the original mapping
     state on ``__exit__``. ``__enter__`` returns the patched mapping.
 
+    Mappings with more than 1000 entries, e.g. ``sys.modules``, are not
+    copied.  Only the keys given in ``values`` and ``remove`` are restored
+    then, other changes made in the meantime are kept.  ``clear=True``
+    always restores the full original mapping.
+
     ``values`` can be any value accepted by ``dict(values)``.
     ``kwargs`` are merged into ``values`` and take precedence.
 
@@ -442,6 +604,55 @@ def expect(obj, strict=True,
 
 
 
+@contextmanager
+def scope():
+    """Keep the stubs made within the ``with`` block to its context.
+
+    Stubs on shared objects, e.g. classes and modules, are usually seen by
+    everyone.  Within a `scope` they are only seen by the code running in
+    the same context: the same thread, or asyncio task, and the tasks it
+    starts.  So tests can run concurrently in one process::
+
+        async def test_login():
+            with scope():
+                when(auth).check('bob').thenReturn(True)
+                assert await login('bob')
+
+        async def test_logout():
+            with scope():
+                when(auth).check('bob').thenReturn(False)
+                ...
+
+        await asyncio.gather(test_login(), test_logout())
+
+    On exit, all mocks and patches made within the block are unstubbed, the
+    ones of other scopes stay.  Within a scope :func:`unstub`, and the checks
+    like :func:`verifyStubbedInvocationsAreUsed`, look at the mocks of the
+    scope only.  Scopes nest; the inner one sees the stubs of the outer one.
+    A call no stub of the scope matches falls through to the stubs of the
+    enclosing scopes, and then to the global ones.
+
+    The context is a `contextvars` one.  A thread you start yourself does
+    not inherit it, run it via ``contextvars.copy_context().run`` for that.
+    Note that :func:`patch_attr` and :func:`patch_dict` still patch for
+    everyone, and that stubs made outside of any scope are seen everywhere.
+
+    """
+    parent = current_scope.get()
+    token = current_scope.set(Scope(parent))
+    try:
+        yield
+    finally:
+        try:
+            unstub()
+        finally:
+            try:
+                current_scope.reset(token)
+            except ValueError:
+                # E.g. exited from another task than the one it was entered in
+                current_scope.set(parent)
+
+
 def unstub(*objs):
     """Unstubs all stubbed methods, functions, and patched attributes.
 
@@ -600,6 +811,63 @@ def forget_invocations(*objs):
         theMock.clear_invocations()
 
 
+def set_recording(*objs, policy):
+    """Choose how the given objs remember their invocations.
+
+    By default, mocks remember every call for later verification.  For mocks
+    called millions of times, e.g. in soak tests, choose one of
+
+    - ``'full'``: remember every call (the default)
+    - an int ``n``: remember the last ``n`` calls.  :func:`verify` and
+      :func:`ensureNoUnverifiedInteractions` only see these.
+    - ``'counts'``: remember the first call per method and arguments, and
+      only count the others.  :func:`verify` counts exactly, captors see
+      each distinct call once, in-order verification is not possible.
+    - ``'off'``: remember nothing.  Verifying raises.
+
+    Verification errors tell if something was dropped.  Choosing a policy
+    forgets the calls recorded so far.  The objs must be stubbed or mocked
+    already::
+
+        when(cache).get(...).thenReturn(None)
+        set_recording(cache, policy=1000)
+
+    Stub expectations, t.i. :func:`expect` and
+    :func:`verifyStubbedInvocationsAreUsed`, work with all policies.
+    """
+    for obj in objs:
+        theMock = _get_mock_or_raise(obj)
+        try:
+            theMock.set_recording(policy)
+        except ValueError as e:
+            raise ArgumentError(str(e))
+
+
+def set_thread_safe(*objs, enabled=True):
+    """Make the given objs safe to be called from many threads at once.
+
+    By default, mocks are meant to be called from one thread at a time.
+    Under load from many threads, calls can get lost for verification, and
+    answers handed out twice.  In thread-safe mode
+
+    - every thread records its calls on its own; they are merged, in order,
+      when the mock gets verified
+    - choosing a stub, counting its use, and picking its next answer happen
+      atomically.  The answer itself runs unlocked.
+
+    The objs must be stubbed or mocked already::
+
+        when(client).fetch(...).thenReturn(1, 2, 3)
+        set_thread_safe(client)
+
+    Pass ``enabled=False`` to switch back.  Works with all recording policies,
+    see :func:`set_recording`.
+    """
+    for obj in objs:
+        theMock = _get_mock_or_raise(obj)
+        theMock.set_thread_safe(enabled)
+
+
 def ensureNoUnverifiedInteractions(*objs):
     """Check if any given object has any unverified interaction.
 
@@ -607,15 +875,22 @@ def ensureNoUnverifiedInteractions(*objs):
     happened.
 
     Can lead to over-specified tests.
+
+    Under a limited recording policy (see :func:`set_recording`) only the
+    recorded calls can be checked.
     """
     verifyExpectedInteractions(*objs)
 
     for obj in objs:
         theMock = _get_mock_or_raise(obj)
+        recorder = theMock.recorder
+        recorder.ensure_can_verify('check for unverified interactions')
 
-        for i in theMock.invocations:
-            if not i.verified:
-                raise VerificationError("\nUnwanted interaction: %s" % i)
+        i = recorder.first_unverified()
+        if i is not None:
+            raise VerificationError(
+                "\nUnwanted interaction: %s%s" % (i, recorder.limitation())
+            )
 
 
 def verifyZeroInteractions(*objs):
@@ -633,10 +908,12 @@ def verifyZeroInteractions(*objs):
     """
     for obj in objs:
         theMock = _get_mock_or_raise(obj)
+        recorder = theMock.recorder
+        recorder.ensure_can_verify('verify zero interactions')
 
-        if len(theMock.invocations) > 0:
+        if len(recorder.invocations) > 0:
             raise VerificationError(
-                "\nUnwanted interaction: %s" % theMock.invocations[0])
+                "\nUnwanted interaction: %s" % recorder.invocations[0])
 
 
 
@@ -662,10 +939,10 @@ def verifyExpectedInteractions(*objs):
     if objs:
         theMocks: Iterable[Mock] = map(_get_mock_or_raise, objs)
     else:
-        theMocks = mock_registry.get_registered_mocks()
+        theMocks = mock_registry.get_mocks_to_check()
 
     for mock in theMocks:
-        for i in mock.stubbed_invocations:
+        for i in mock.expectations():
             i.verify()
 
 
@@ -680,11 +957,11 @@ def verifyStubbedInvocationsAreUsed(*objs):
     if objs:
         theMocks: Iterable[Mock] = map(_get_mock_or_raise, objs)
     else:
-        theMocks = mock_registry.get_registered_mocks()
+        theMocks = mock_registry.get_mocks_to_check()
 
 
     for mock in theMocks:
-        for i in mock.stubbed_invocations:
+        for i in mock.unused_stubs():
             i.check_used()
 
 
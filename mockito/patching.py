@@ -5,7 +5,12 @@ from collections.abc import MutableMapping
 from contextlib import contextmanager
 from dataclasses import dataclass
 import inspect
+import itertools
+import threading
+import weakref
+from typing import Callable, Iterator, Tuple
 
+from .mock_registry import Scope, current_scope
 from .utils import MISSING_ATTRIBUTE, get_original_attribute
 
 
@@ -25,10 +30,32 @@ def restore_patch_contextmanager(patch: Patch, yield_value: object = None):
         patch.restore_and_unregister()
 
 
+# Patches are indexed by identity.  A patch holds on to its `obj` and its
+# unstub targets, so their ids stay valid as long as the patch is registered.
+_AttrKey = Tuple[int, str]
+
+
 class Patcher:
+    """Registry of all patches.
+
+    Patches applied within a `scope()` are owned by that scope.  Within a
+    scope, unstubbing only restores the patches of the current scope;
+    outside of any scope only the ones not owned by a scope.
+    """
+
     def __init__(self) -> None:
-        self._patches: list[Patch] = []
-        self._restore_infos: list[_RestoreInformation] = []
+        #: All registered patches, in the order of registration
+        self._patches: dict[Patch, None] = {}
+        #: The registered attribute patches per `(id(obj), attr_name)`
+        self._attr_stacks: dict[_AttrKey, list[_AttrPatch]] = {}
+        #: The registered patches per `id()` of their unstub targets
+        self._by_target: dict[int, dict[Patch, None]] = {}
+        self._restore_infos: dict[_AttrKey, _RestoreInformation] = {}
+        #: The dispatchers patched in for scoped patches
+        self._dispatches: dict[_AttrKey, ScopedDispatch] = {}
+        self._register_observers: list[weakref.WeakMethod] = []
+        # Scopes may patch from many threads at once
+        self._lock = threading.RLock()
 
     def patch_attribute(
         self,
@@ -37,8 +64,19 @@ class Patcher:
         replacement: object,
         *,
         allow_unstub_by_replacement: bool,
+        per_scope: bool = False,
     ) -> _AttrPatch:
-        attr_patch = _AttrPatch(
+        """Set `obj.attr_name` to `replacement`.
+
+        With `per_scope`, and within a `scope()`, only the code running in
+        that scope sees the `replacement`.  This works for attributes of
+        classes, and for callables on other objects, e.g. modules.
+        """
+        if per_scope and current_scope.get() is not None:
+            patch_type: type[_AttrPatch] = _ScopedAttrPatch
+        else:
+            patch_type = _AttrPatch
+        attr_patch = patch_type(
             registry=self,
             obj=obj,
             attr_name=attr_name,
@@ -69,39 +107,197 @@ class Patcher:
         return dict_patch
 
     def unstub_matching(self, obj: object) -> bool:
-        matching = [
-            patch for patch in self._patches
-            if patch.matches_unstub_target(obj)
-        ]
+        scope = current_scope.get()
+        if scope is None:
+            matching = [
+                patch
+                for patch in self._by_target.get(id(obj), ())
+                if _is_global(patch)
+            ]
+        else:
+            matching = [
+                patch
+                for patch in scope.patches
+                if any(target is obj for target in patch.unstub_targets())
+            ]
         for patch in reversed(matching):
             patch.restore_and_unregister()
 
         return bool(matching)
 
     def unstub_attribute(self, obj: object, attr_name: str) -> bool:
-        matching = [
-            patch for patch in self._patches
-            if isinstance(patch, _AttrPatch)
-            if patch.obj is obj
-            if patch.attr_name == attr_name
-        ]
+        scope = current_scope.get()
+        matching: list[Patch]
+        if scope is None:
+            matching = [
+                patch
+                for patch in self._attr_stacks.get((id(obj), attr_name), ())
+                if _is_global(patch)
+            ]
+        else:
+            matching = [
+                patch
+                for patch in scope.patches
+                if isinstance(patch, _AttrPatch)
+                and patch.obj is obj
+                and patch.attr_name == attr_name
+            ]
         for patch in reversed(matching):
             patch.restore_and_unregister()
 
         return bool(matching)
 
     def unstub_all(self) -> None:
-        for patch in reversed(self._patches.copy()):
+        for patch in reversed(list(self.registered_patches())):
             patch.restore_and_unregister()
 
+    def registered_patches(self) -> Iterator[Patch]:
+        """Yield the patches `unstub_all` would restore, oldest first."""
+        scope = current_scope.get()
+        if scope is None:
+            return (patch for patch in self._patches if _is_global(patch))
+        return iter(scope.patches)
+
+    def add_register_observer(self, observer: Callable[[Patch], None]) -> None:
+        """Call `observer`, a bound method, with each patch registered from
+        now on, as long as its object lives.
+
+        The dispatchers of scoped patches are not reported.
+        """
+        self._prune_dead_register_observers()
+        for observer_ref in self._register_observers:
+            callback = observer_ref()
+            if callback is not None and callback == observer:
+                return
+
+        self._register_observers.append(weakref.WeakMethod(observer))
+
+    def remove_register_observer(
+        self, observer: Callable[[Patch], None]
+    ) -> None:
+        self._prune_dead_register_observers()
+
+        for i, observer_ref in enumerate(self._register_observers):
+            callback = observer_ref()
+            if callback is not None and callback == observer:
+                del self._register_observers[i]
+                break
+
+    def _prune_dead_register_observers(self) -> None:
+        self._register_observers = [
+            observer_ref
+            for observer_ref in self._register_observers
+            if observer_ref() is not None
+        ]
+
     def unregister_patch(self, patch: Patch) -> None:
+        with self._lock:
+            self._unregister_patch(patch)
+
+    def _unregister_patch(self, patch: Patch) -> None:
+        if patch.scope is not None:
+            patch.scope.patches.pop(patch, None)
+        if not isinstance(patch, _ScopedAttrPatch):
+            self._unregister_global_patch(patch)
+
+    def _unregister_global_patch(self, patch: Patch) -> None:
         try:
-            self._patches.remove(patch)
-        except ValueError:
-            pass
+            del self._patches[patch]
+        except KeyError:
+            return
+
+        if isinstance(patch, _AttrPatch):
+            key = _attr_key(patch.obj, patch.attr_name)
+            stack = self._attr_stacks[key]
+            if stack[-1] is patch:
+                stack.pop()
+            else:
+                stack.remove(patch)
+            if not stack:
+                del self._attr_stacks[key]
+            self._forget_original_below_dispatch(key)
+
+        for target in patch.unstub_targets():
+            same_target = self._by_target.get(id(target))
+            if same_target is None:
+                continue
+            same_target.pop(patch, None)
+            if not same_target:
+                del self._by_target[id(target)]
 
     def _register_patch(self, patch: Patch) -> None:
-        self._patches.append(patch)
+        with self._lock:
+            if patch.scope is not None:
+                patch.scope.patches[patch] = None
+            if not isinstance(patch, _ScopedAttrPatch):
+                self._register_global_patch(patch)
+        for observer_ref in self._register_observers:
+            observer = observer_ref()
+            if observer is not None:
+                observer(patch)
+
+    def _register_global_patch(self, patch: Patch) -> None:
+        self._patches[patch] = None
+        if isinstance(patch, _AttrPatch):
+            key = _attr_key(patch.obj, patch.attr_name)
+            self._attr_stacks.setdefault(key, []).append(patch)
+            self._forget_original_below_dispatch(key)
+
+        for target in patch.unstub_targets():
+            self._by_target.setdefault(id(target), {})[patch] = None
+
+    def dispatch_for(
+        self, obj: object, attr_name: str, replacement: object
+    ) -> ScopedDispatch:
+        """Return the dispatcher for `obj.attr_name`, patched in if needed,
+        and count one more user of it."""
+        with self._lock:
+            key = _attr_key(obj, attr_name)
+            dispatch = self._dispatches.get(key)
+            if dispatch is None or not dispatch.installed():
+                original, _ = get_original_attribute(
+                    obj, attr_name, default=MISSING_ATTRIBUTE
+                )
+                if _is_data_descriptor(replacement) or _is_data_descriptor(
+                    original
+                ):
+                    dispatch = ScopedDataDispatch(obj, attr_name)
+                else:
+                    dispatch = ScopedDispatch(obj, attr_name)
+                patch = _AttrPatch(
+                    registry=self,
+                    obj=obj,
+                    attr_name=attr_name,
+                    replacement=dispatch,
+                    allow_unstub_by_replacement=False,
+                )
+                # The dispatcher serves all scopes, so none of them owns it
+                patch.scope = None
+                patch.apply()
+                self._register_global_patch(patch)
+                dispatch.patch = patch
+                self._dispatches[key] = dispatch
+
+            dispatch.users += 1
+            return dispatch
+
+    def _forget_original_below_dispatch(self, key: _AttrKey) -> None:
+        dispatch = self._dispatches.get(key)
+        if dispatch is not None:
+            dispatch.forget_original()
+
+    def release_dispatch(self, dispatch: ScopedDispatch) -> None:
+        """Count one user less of `dispatch`; restore what it stands in for
+        if it was the last one."""
+        with self._lock:
+            dispatch.users -= 1
+            if dispatch.users > 0:
+                return
+
+            if self._dispatches.get(dispatch.key) is dispatch:
+                del self._dispatches[dispatch.key]
+            if dispatch.patch is not None:
+                dispatch.patch.restore_and_unregister()
 
     @contextmanager
     def capture_restore_information(self, patch: _AttrPatch):
@@ -116,16 +312,17 @@ class Patcher:
             raise
         else:
             if not has_restore_info:
-                self._restore_infos.append(restore_info)
+                self._restore_infos[
+                    _attr_key(patch.obj, patch.attr_name)
+                ] = restore_info
 
     def stack_for_attr_patch(self, patch: _AttrPatch) -> list[_AttrPatch]:
         return [
             candidate
-            for candidate in reversed(self._patches)
-            if isinstance(candidate, _AttrPatch)
+            for candidate in reversed(
+                self._attr_stacks.get(_attr_key(patch.obj, patch.attr_name), ())
+            )
             if candidate.active
-            if candidate.obj is patch.obj
-            if candidate.attr_name == patch.attr_name
         ]
 
     def has_restore_information(self, obj: object, attr_name: str) -> bool:
@@ -134,16 +331,24 @@ class Patcher:
     def find_restore_information(
         self, obj: object, attr_name: str
     ) -> _RestoreInformation | None:
-        for restore_info in self._restore_infos:
-            if restore_info.obj is obj and restore_info.attr_name == attr_name:
-                return restore_info
-        return None
+        return self._restore_infos.get(_attr_key(obj, attr_name))
 
     def remove_restore_information(self, restore_info: _RestoreInformation) -> None:
-        try:
-            self._restore_infos.remove(restore_info)
-        except ValueError:
-            pass
+        key = _attr_key(restore_info.obj, restore_info.attr_name)
+        if self._restore_infos.get(key) is restore_info:
+            del self._restore_infos[key]
+
+
+def _attr_key(obj: object, attr_name: str) -> _AttrKey:
+    return (id(obj), attr_name)
+
+
+def _is_global(patch: Patch) -> bool:
+    # Dispatchers serve the running scopes, and go with the last of them
+    return patch.scope is None and not (
+        isinstance(patch, _AttrPatch)
+        and isinstance(patch.replacement, ScopedDispatch)
+    )
 
 
 def _capture_restore_information(obj: object, attr_name: str) -> _RestoreInformation:
@@ -185,6 +390,8 @@ class Patch(ABC):
     def __init__(self, registry: Patcher) -> None:
         self.registry = registry
         self.active = False
+        #: The scope owning this patch, see `scope()`
+        self.scope: Scope | None = current_scope.get()
 
     @abstractmethod
     def apply(self) -> None:
@@ -195,8 +402,8 @@ class Patch(ABC):
         pass
 
     @abstractmethod
-    def matches_unstub_target(self, obj: object) -> bool:
-        pass
+    def unstub_targets(self) -> tuple[object, ...]:
+        """Return the objects for which `unstub(obj)` restores this patch."""
 
     def restore_and_unregister(self) -> None:
         try:
@@ -249,10 +456,175 @@ class _AttrPatch(Patch):
 
         self.active = False
 
-    def matches_unstub_target(self, obj: object) -> bool:
-        return self.obj is obj or (
-            self.allow_unstub_by_replacement and self.replacement is obj
+    def unstub_targets(self) -> tuple[object, ...]:
+        if self.allow_unstub_by_replacement:
+            return (self.obj, self.replacement)
+        return (self.obj,)
+
+
+class _ScopedAttrPatch(_AttrPatch):
+    """Patch of an attribute only seen by the code running in its scope."""
+
+    scope: Scope
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.dispatch: ScopedDispatch | None = None
+
+    def apply(self) -> None:
+        if self.active:
+            return
+
+        dispatch = self.dispatch = self.registry.dispatch_for(
+            self.obj, self.attr_name, self.replacement
+        )
+        self.scope.replacements.setdefault(dispatch.key, []).append(
+            self.replacement
+        )
+        self.active = True
+
+    def restore(self) -> None:
+        dispatch = self.dispatch
+        if not self.active or dispatch is None:
+            return
+
+        stack = self.scope.replacements[dispatch.key]
+        for i, replacement in enumerate(stack):
+            if replacement is self.replacement:
+                del stack[i]
+                break
+        if not stack:
+            del self.scope.replacements[dispatch.key]
+
+        self.registry.release_dispatch(dispatch)
+        self.active = False
+
+
+_NOT_LOOKED_UP = object()
+
+
+class ScopedDispatch:
+    """Stands in for an attribute patched within `scope()`s.
+
+    Resolves to the replacement of the current scope, or else to what the
+    attribute was before.  On classes this is a descriptor; on other
+    objects, e.g. modules, we can only stand in for callables.
+    """
+
+    #: The number of scoped patches relying on us
+    users = 0
+    _original: object = _NOT_LOOKED_UP
+
+    def __init__(self, obj: object, attr_name: str) -> None:
+        self.obj = obj
+        self.attr_name = attr_name
+        self.key = _attr_key(obj, attr_name)
+        self.patch: _AttrPatch | None = None
+
+    def installed(self) -> bool:
+        return self.patch is not None and self.patch.active
+
+    def resolve(self) -> object:
+        scope = current_scope.get()
+        if scope is not None:
+            replacement = scope.replacement_for(self.key)
+            if replacement is not None:
+                return replacement
+        return self.original()
+
+    def original(self) -> object:
+        """Return what the attribute would be without us."""
+        original = self._original
+        if original is _NOT_LOOKED_UP:
+            original = self._original = self._look_up_original()
+        return original
+
+    def forget_original(self) -> None:
+        """Forget the `original`, e.g. because the patches changed."""
+        self._original = _NOT_LOOKED_UP
+
+    def _look_up_original(self) -> object:
+        if self.patch is None:
+            return MISSING_ATTRIBUTE
+
+        registry = self.patch.registry
+        stack = registry.stack_for_attr_patch(self.patch)
+        for patch, below in zip(stack, stack[1:]):
+            if patch is self.patch:
+                return below.replacement
+
+        restore_info = registry.find_restore_information(
+            self.obj, self.attr_name
         )
+        if restore_info is None:
+            return MISSING_ATTRIBUTE
+        return restore_info.original_value
+
+    def __get__(self, obj: object, type_: type | None = None) -> object:
+        value = self._resolve_or_raise()
+        get = getattr(type(value), '__get__', None)
+        if get is None:
+            return value
+        return get(value, obj, type_)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve_or_raise()(*args, **kwargs)  # type: ignore[operator]  # noqa: E501
+
+    @property
+    def __wrapped__(self) -> object:
+        # For `inspect.signature` et.al.
+        return self._resolve_or_raise()
+
+    def __getattr__(self, name: str) -> object:
+        # Let e.g. `__name__` and coroutine markers look through
+        return getattr(self._resolve_or_raise(), name)
+
+    def _resolve_or_raise(self) -> object:
+        value = self.resolve()
+        if value is MISSING_ATTRIBUTE:
+            raise AttributeError(self.attr_name)
+        return value
+
+
+class ScopedDataDispatch(ScopedDispatch):
+    """`ScopedDispatch` standing in for properties and the like, which must
+    win over the instance `__dict__`."""
+
+    def __set__(self, obj: object, value: object) -> None:
+        target = self.resolve()
+        set_ = getattr(type(target), '__set__', None)
+        if set_ is None:
+            vars(obj)[self.attr_name] = value
+        else:
+            set_(target, obj, value)
+
+    def __delete__(self, obj: object) -> None:
+        target = self.resolve()
+        delete = getattr(type(target), '__delete__', None)
+        if delete is None:
+            del vars(obj)[self.attr_name]
+        else:
+            delete(target, obj)
+
+
+def original_of(value: object) -> object:
+    """Return `value`, or what it stands in for if it is a `ScopedDispatch`."""
+    if isinstance(value, ScopedDispatch):
+        return value.original()
+    return value
+
+
+def _is_data_descriptor(value: object) -> bool:
+    return (
+        hasattr(type(value), '__set__') or hasattr(type(value), '__delete__')
+    )
+
+
+# Up to this size we snapshot the whole mapping on `patch_dict`, and restore
+# exactly that.  Larger mappings only remember the keys we touch.
+SNAPSHOT_AT_MOST = 1000
+
+_ABSENT = object()
 
 
 class _DictPatch(Patch):
@@ -270,13 +642,22 @@ class _DictPatch(Patch):
         self.updates = updates
         self.clear = clear
         self.remove = remove
+        #: Set if we only remember the keys we touch
+        self.delta = not clear and len(target) > SNAPSHOT_AT_MOST
 
+        #: A snapshot of the target, or in delta mode the old values of the
+        #: touched keys, `_ABSENT` for the ones that did not exist
         self.original: dict[object, object] = {}
 
     def apply(self) -> None:
         if self.active:
             return
 
+        if self.delta:
+            self._apply_delta()
+            self.active = True
+            return
+
         self.original = dict(self.target)
 
         try:
@@ -294,17 +675,48 @@ class _DictPatch(Patch):
 
         self.active = True
 
+    def _apply_delta(self) -> None:
+        target = self.target
+        original: dict[object, object] = {}
+        for key in itertools.chain(self.remove, self.updates):
+            if key not in original:
+                original[key] = target[key] if key in target else _ABSENT
+
+        try:
+            for key in self.remove:
+                target.pop(key, None)
+
+            target.update(self.updates)
+        except Exception:
+            _restore_keys(target, original)
+            raise
+
+        self.original = original
+
     def restore(self) -> None:
         if not self.active:
             return
 
-        self.target.clear()
-        self.target.update(self.original)
+        if self.delta:
+            _restore_keys(self.target, self.original)
+        else:
+            self.target.clear()
+            self.target.update(self.original)
 
         self.active = False
 
-    def matches_unstub_target(self, obj: object) -> bool:
-        return self.target is obj
+    def unstub_targets(self) -> tuple[object, ...]:
+        return (self.target,)
+
+
+def _restore_keys(
+    target: MutableMapping[object, object], original: dict[object, object]
+) -> None:
+    for key, value in original.items():
+        if value is _ABSENT:
+            target.pop(key, None)
+        else:
+            target[key] = value
 
 
 def _has_data_descriptor_on_type(obj: object, attr_name: str) -> bool:
@@ -0,0 +1,40 @@
+"""pytest integration, registered via the ``pytest11`` entry point.
+
+Request the ``mockito_session`` fixture, or use it for a whole module::
+
+    pytestmark = pytest.mark.usefixtures("mockito_session")
+
+"""
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from .session import MockitoSession
+
+
+_test_failed = pytest.StashKey[bool]()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    # A failed setup leaves the test half set up, e.g. with unused stubs
+    if report.when in ("setup", "call") and report.failed:
+        item.stash[_test_failed] = True
+
+
+@pytest.fixture
+def mockito_session(request) -> Iterator[MockitoSession]:
+    """Run the test in a `MockitoSession`.
+
+    After the test, the mocks made by it are verified and unstubbed.  If the
+    test, or its setup, failed, they are only unstubbed.
+    """
+    with MockitoSession() as session:
+        yield session
+        # Teardown runs after the reports of the setup and the call are made
+        if request.node.stash.get(_test_failed, False):
+            session.finish(check=False)
@@ -0,0 +1,527 @@
+"""Recording policies for the real invocations of a mock.
+
+By default a mock remembers every call, so that it can be verified later.
+Long running mocks, e.g. in soak tests, can opt into remembering less.  See
+`mockito.set_recording`.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import deque
+from typing import (
+    TYPE_CHECKING, Deque, Hashable, Iterable, List, Sequence, Tuple, Union
+)
+
+from . import match_plan
+from .verification import VerificationError
+
+if TYPE_CHECKING:
+    from .invocation import RealInvocation, VerifiableInvocation
+
+
+FULL = 'full'
+COUNTS = 'counts'
+OFF = 'off'
+
+Policy = Union[str, int]
+
+
+class Recorder:
+    """Remember every invocation.  This is the default.
+
+    For `verify` the invocations are indexed by method name, and calls with
+    plain literal arguments by these.  Along, we count the indexed calls not
+    verified yet, for `ensureNoUnverifiedInteractions`.  The index is built
+    lazily, so that `remember` stays a plain append.
+    """
+
+    policy: Policy = FULL
+    #: Set if the recorded invocations are in the order of the calls
+    keeps_order = True
+    #: All invocations before this index are verified in order
+    _inorder_cursor: int
+    #: All invocations before this index are verified
+    _unverified_cursor: int
+    #: At least that many indexed invocations are unverified
+    _unverified: int
+
+    def __init__(self) -> None:
+        self.invocations: list[RealInvocation] | Deque[RealInvocation] = []
+        self._reset_index()
+
+    def remember(self, invocation: RealInvocation) -> None:
+        self.invocations.append(invocation)
+
+    def count(self, invocation: RealInvocation) -> int:
+        """Return how many calls the recorded `invocation` stands for."""
+        return 1
+
+    def clear(self) -> None:
+        self.invocations = []
+        self._reset_index()
+
+    def forget_method(self, method_name: str) -> None:
+        self.invocations = [
+            invocation
+            for invocation in self.invocations
+            if invocation.method_name != method_name
+        ]
+        self._reset_index()
+
+    def lookup(
+        self, wanted: VerifiableInvocation
+    ) -> tuple[SameCalls | None, Sequence[RealInvocation]]:
+        """Return the candidates `wanted` should be matched against.
+
+        That is the calls equal to `wanted`, if `wanted` has a literal key,
+        and the other calls to the same method which must still be matched
+        one by one.
+        """
+        self._update_index()
+        method_name = wanted.method_name
+        key = wanted.match_plan.literal_key
+        if key is None or wanted.compare is not match_plan.compare:
+            return None, self._by_method.get(method_name, ())
+
+        return (
+            self._by_key.get((method_name, key)),
+            self._unkeyed_by_method.get(method_name, ()),
+        )
+
+    def next_unverified_in_order(self) -> RealInvocation | None:
+        """Return the first invocation not yet verified in order, if any."""
+        # Invocations are only ever marked as verified, never unmarked, so
+        # the ones before the cursor stay verified.
+        invocations = self.invocations
+        cursor = self._inorder_cursor
+        while cursor < len(invocations) and invocations[cursor].verified_inorder:
+            cursor += 1
+        self._inorder_cursor = cursor
+        return invocations[cursor] if cursor < len(invocations) else None
+
+    def mark_verified(
+        self,
+        invocations: Iterable[RealInvocation],
+        same_calls: SameCalls | None = None,
+    ) -> None:
+        """Mark the indexed `invocations`, and `same_calls`, as verified."""
+        newly_verified = 0
+        for invocation in invocations:
+            if not invocation.verified:
+                invocation.verified = True
+                newly_verified += 1
+        if same_calls is not None:
+            newly_verified += same_calls.mark_verified()
+        self._unverified -= newly_verified
+
+    def first_unverified(self) -> RealInvocation | None:
+        """Return the first invocation not yet verified, if any."""
+        self._update_index()
+        if not self._unverified:
+            return None
+
+        # Calls verified otherwise, e.g. in order, are not counted off.  So
+        # we look for the first unverified one, and correct the count if
+        # there is none.
+        invocations = self.invocations
+        cursor = self._unverified_cursor
+        while cursor < len(invocations) and invocations[cursor].verified:
+            cursor += 1
+        self._unverified_cursor = cursor
+        if cursor < len(invocations):
+            return invocations[cursor]
+
+        self._unverified = 0
+        return None
+
+    def _reset_index(self) -> None:
+        self._inorder_cursor = 0
+        self._unverified_cursor = 0
+        self._unverified = 0
+        self._indexed = 0
+        self._by_method: dict[str, list[RealInvocation]] = {}
+        self._by_key: dict[Hashable, SameCalls] = {}
+        self._unkeyed_by_method: dict[str, list[RealInvocation]] = {}
+
+    def _update_index(self) -> None:
+        invocations = self.invocations
+        # Calls made meanwhile by other threads are indexed next time.
+        end = len(invocations)
+        for x in range(self._indexed, end):
+            invocation = invocations[x]
+            if not invocation.verified:
+                self._unverified += 1
+            method_name = invocation.method_name
+            try:
+                self._by_method[method_name].append(invocation)
+            except KeyError:
+                self._by_method[method_name] = [invocation]
+
+            key = match_plan.call_key(
+                invocation.params, invocation.named_params
+            )
+            if key is None:
+                self._unkeyed_by_method.setdefault(
+                    method_name, []
+                ).append(invocation)
+                continue
+
+            try:
+                self._by_key[(method_name, key)].invocations.append(invocation)
+            except KeyError:
+                self._by_key[(method_name, key)] = SameCalls(invocation)
+
+        self._indexed = end
+
+    def ensure_can_verify(self, what: str) -> None:
+        """Raise if nothing can be checked at all, `what` being the check."""
+        pass
+
+    def limitation(self) -> str:
+        """Explain what the recording lacks, for verification errors."""
+        return ''
+
+
+class SameCalls:
+    """Recorded calls with equal plain literal arguments."""
+
+    __slots__ = ('invocations', '_verified')
+
+    def __init__(self, invocation: RealInvocation) -> None:
+        self.invocations = [invocation]
+        #: The invocations up to here are marked as verified
+        self._verified = 0
+
+    def __len__(self) -> int:
+        return len(self.invocations)
+
+    def mark_verified(self) -> int:
+        """Mark all calls as verified; return how many were not before."""
+        newly_verified = 0
+        invocations = self.invocations
+        for x in range(self._verified, len(invocations)):
+            invocation = invocations[x]
+            if not invocation.verified:
+                invocation.verified = True
+                newly_verified += 1
+        self._verified = len(invocations)
+        return newly_verified
+
+
+class _UnindexedRecorder(Recorder):
+    """Base for the policies which only keep some of the invocations."""
+
+    def lookup(
+        self, wanted: VerifiableInvocation
+    ) -> tuple[SameCalls | None, Sequence[RealInvocation]]:
+        method_name = wanted.method_name
+        return None, [
+            invocation
+            for invocation in self.invocations
+            if invocation.method_name == method_name
+        ]
+
+    def next_unverified_in_order(self) -> RealInvocation | None:
+        for invocation in self.invocations:
+            if not invocation.verified_inorder:
+                return invocation
+        return None
+
+    def mark_verified(
+        self,
+        invocations: Iterable[RealInvocation],
+        same_calls: SameCalls | None = None,
+    ) -> None:
+        for invocation in invocations:
+            invocation.verified = True
+
+    def first_unverified(self) -> RealInvocation | None:
+        for invocation in self.invocations:
+            if not invocation.verified:
+                return invocation
+        return None
+
+    def _reset_index(self) -> None:
+        pass
+
+
+class RingRecorder(_UnindexedRecorder):
+    """Remember the last `maxlen` invocations only."""
+
+    def __init__(self, maxlen: int) -> None:
+        self.policy = self.maxlen = maxlen
+        self.invocations = deque(maxlen=maxlen)
+        #: How many older invocations were pushed out of the buffer
+        self.dropped = 0
+
+    def remember(self, invocation: RealInvocation) -> None:
+        if len(self.invocations) == self.maxlen:
+            self.dropped += 1
+        self.invocations.append(invocation)
+
+    def clear(self) -> None:
+        self.invocations = deque(maxlen=self.maxlen)
+        self.dropped = 0
+
+    def forget_method(self, method_name: str) -> None:
+        self.invocations = deque(
+            (
+                invocation
+                for invocation in self.invocations
+                if invocation.method_name != method_name
+            ),
+            maxlen=self.maxlen,
+        )
+
+    def limitation(self) -> str:
+        if not self.dropped:
+            return ''
+        return (
+            "\nNote: Only the last %i invocations are recorded for this mock;"
+            "\n%i older ones were dropped.  Counts include the recorded ones"
+            "\nonly, and the dropped ones cannot be verified."
+            % (self.maxlen, self.dropped)
+        )
+
+
+class CountingRecorder(_UnindexedRecorder):
+    """Remember the first call per method and arguments, and count the rest.
+
+    The first call stands for all later calls with equal arguments.
+    """
+
+    policy = COUNTS
+    keeps_order = False
+
+    def __init__(self) -> None:
+        self.invocations = []
+        self._counts: dict[RealInvocation, int] = {}
+        self._representatives: dict[Hashable, RealInvocation] = {}
+
+    def remember(self, invocation: RealInvocation) -> None:
+        key = match_plan.call_key(invocation.params, invocation.named_params)
+        if key is not None:
+            representative = self._representatives.get((invocation.method_name, key))
+        else:
+            representative = self._find_equal(invocation)
+
+        if representative is None:
+            self.invocations.append(invocation)
+            self._counts[invocation] = 1
+            if key is not None:
+                self._representatives[(invocation.method_name, key)] = invocation
+            return
+
+        self._counts[representative] += 1
+        # As with full recording, the new call has not been verified yet
+        representative.verified = False
+        representative.verified_inorder = False
+
+    def _find_equal(
+        self, invocation: RealInvocation
+    ) -> RealInvocation | None:
+        for other in self.invocations:
+            if other.method_name != invocation.method_name:
+                continue
+            try:
+                if (
+                    other.params == invocation.params
+                    and other.named_params == invocation.named_params
+                ):
+                    return other
+            except Exception:
+                pass
+        return None
+
+    def count(self, invocation: RealInvocation) -> int:
+        return self._counts[invocation]
+
+    def clear(self) -> None:
+        self.invocations = []
+        self._counts = {}
+        self._representatives = {}
+
+    def forget_method(self, method_name: str) -> None:
+        for invocation in self.invocations:
+            if invocation.method_name == method_name:
+                del self._counts[invocation]
+        self._representatives = {
+            key: invocation
+            for key, invocation in self._representatives.items()
+            if invocation.method_name != method_name
+        }
+        super().forget_method(method_name)
+
+    def limitation(self) -> str:
+        return (
+            "\nNote: This mock only counts its invocations per method and"
+            "\narguments.  Calls with equal arguments are shown once, and"
+            "\ncaptors see their arguments only once."
+        )
+
+
+class NullRecorder(_UnindexedRecorder):
+    """Remember nothing."""
+
+    policy = OFF
+    keeps_order = False
+
+    def __init__(self) -> None:
+        self.invocations = deque(maxlen=0)
+        #: How many calls went unrecorded
+        self.dropped = 0
+
+    def remember(self, invocation: RealInvocation) -> None:
+        self.dropped += 1
+
+    def clear(self) -> None:
+        self.dropped = 0
+
+    def forget_method(self, method_name: str) -> None:
+        pass
+
+    def ensure_can_verify(self, what: str) -> None:
+        raise VerificationError(
+            "\nCannot %s: invocation recording is off for this mock."
+            "\n%i calls went unrecorded.  Use `set_recording(obj, ...)` with"
+            "\nanother policy to check calls."
+            % (what, self.dropped)
+        )
+
+
+_Buffer = List[Tuple[int, 'RealInvocation']]
+
+
+class ThreadSafeRecorder(Recorder):
+    """Remember invocations from many threads, for another recorder.
+
+    Each thread appends its invocations to a buffer of its own, so recording
+    needs no lock.  Before anything is read, the buffers are merged, in the
+    order of the calls, into the `recorder` implementing the policy.  Calls
+    made while a verification runs are seen by the next one.  The buffers of
+    threads which have ended are dropped once merged.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        self.recorder = recorder
+        self.policy = recorder.policy
+        self.keeps_order = recorder.keeps_order
+        self._local = threading.local()
+        self._buffers: list[tuple[weakref.ref[threading.Thread], _Buffer]] = []
+        self._lock = threading.RLock()
+
+    def remember(self, invocation: RealInvocation) -> None:
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = []
+            thread = weakref.ref(threading.current_thread())
+            with self._lock:
+                self._buffers.append((thread, buffer))
+        buffer.append((time.perf_counter_ns(), invocation))
+
+    def flush(self) -> Recorder:
+        """Merge the buffered invocations, and return the inner recorder."""
+        with self._lock:
+            pending: _Buffer = []
+            alive = []
+            for thread_ref, buffer in self._buffers:
+                # Only checked before taking: a thread which ended cannot
+                # append anymore
+                thread = thread_ref()
+                running = thread is not None and thread.is_alive()
+                # Other threads may append meanwhile, but only at the end
+                taken = buffer[:]
+                del buffer[:len(taken)]
+                pending.extend(taken)
+                if running:
+                    alive.append((thread_ref, buffer))
+            self._buffers = alive
+            pending.sort(key=_timestamp)
+            for _, invocation in pending:
+                self.recorder.remember(invocation)
+            return self.recorder
+
+    # Reading holds the lock, so that no other thread flushes meanwhile
+
+    @property
+    def invocations(self) -> list[RealInvocation] | Deque[RealInvocation]:
+        with self._lock:
+            return self.flush().invocations
+
+    @invocations.setter
+    def invocations(
+        self, invocations: list[RealInvocation] | Deque[RealInvocation]
+    ) -> None:
+        with self._lock:
+            self.flush().invocations = invocations
+
+    def count(self, invocation: RealInvocation) -> int:
+        with self._lock:
+            return self.flush().count(invocation)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.flush().clear()
+
+    def forget_method(self, method_name: str) -> None:
+        with self._lock:
+            self.flush().forget_method(method_name)
+
+    def lookup(
+        self, wanted: VerifiableInvocation
+    ) -> tuple[SameCalls | None, Sequence[RealInvocation]]:
+        with self._lock:
+            return self.flush().lookup(wanted)
+
+    def next_unverified_in_order(self) -> RealInvocation | None:
+        with self._lock:
+            return self.flush().next_unverified_in_order()
+
+    def mark_verified(
+        self,
+        invocations: Iterable[RealInvocation],
+        same_calls: SameCalls | None = None,
+    ) -> None:
+        with self._lock:
+            self.recorder.mark_verified(invocations, same_calls)
+
+    def first_unverified(self) -> RealInvocation | None:
+        with self._lock:
+            return self.flush().first_unverified()
+
+    def ensure_can_verify(self, what: str) -> None:
+        with self._lock:
+            self.flush().ensure_can_verify(what)
+
+    def limitation(self) -> str:
+        with self._lock:
+            return self.flush().limitation()
+
+
+def _timestamp(entry: tuple[int, RealInvocation]) -> int:
+    return entry[0]
+
+
+def recorder_for(policy: Policy) -> Recorder:
+    """Create a new recorder for `policy`.
+
+    `policy` is one of 'full', 'counts', 'off', or a positive int for
+    remembering the last n invocations.
+    """
+    if policy == FULL:
+        return Recorder()
+    if policy == COUNTS:
+        return CountingRecorder()
+    if policy == OFF:
+        return NullRecorder()
+    if type(policy) is int and policy > 0:
+        return RingRecorder(policy)
+
+    raise ValueError(
+        "recording policy must be one of %r, %r, %r, or a positive int; "
+        "got %r" % (FULL, COUNTS, OFF, policy)
+    )
+
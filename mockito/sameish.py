@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Hashable, Mapping
 
 from . import matchers
+from .match_plan import PLAIN_LITERAL_TYPES
 
 if TYPE_CHECKING:
     from .invocation import StubbedInvocation
@@ -27,6 +28,104 @@ def invocations_are_sameish(
     )
 
 
+def fingerprint(invocation: StubbedInvocation) -> Hashable | None:
+    """Return a hashable key equal for exactly the sameish invocations.
+
+    That is, two invocations with a fingerprint are sameish if and only if
+    their fingerprints are equal.  Returns None if we cannot tell, t.i. if
+    some value compares in a way we do not know, for example a custom
+    matcher or an object with its own `__eq__`.  Such invocations must be
+    compared using `invocations_are_sameish`.
+    """
+    try:
+        return (
+            tuple(map(_value_fingerprint, invocation.params)),
+            frozenset(
+                (key, _value_fingerprint(value))
+                for key, value in invocation.named_params.items()
+            ),
+        )
+    except _Unknown:
+        return None
+
+
+class _Unknown(Exception):
+    pass
+
+
+# Follows `_values_are_sameish`.  Plain values are their own fingerprint, all
+# others are tuples, tagged with a string or the type of the matcher.
+def _value_fingerprint(value: object) -> Hashable:  # noqa: C901
+    if value is Ellipsis:
+        return value
+
+    if matchers.is_call_captor(value):
+        return ('call_captor',)
+
+    if matchers.is_captor_args_sentinel(value):
+        return ('*captor', _value_fingerprint(value.captor.matcher))
+
+    if matchers.is_captor_kwargs_sentinel(value):
+        return ('**captor', _value_fingerprint(value.captor.matcher))
+
+    if isinstance(value, matchers.Matcher):
+        return _matcher_fingerprint(value)
+
+    if type(value) in PLAIN_LITERAL_TYPES or _compares_by_identity(value):
+        return value
+
+    raise _Unknown
+
+
+def _matcher_fingerprint(  # noqa: C901
+    matcher: matchers.Matcher,
+) -> Hashable:
+    type_ = type(matcher)
+    if isinstance(matcher, matchers.Any):
+        wanted_type = matcher.wanted_type
+        types = wanted_type if isinstance(wanted_type, tuple) else (wanted_type,)
+        if not all(
+            t is None or _compares_by_identity(t) for t in types
+        ):
+            raise _Unknown
+        return (type_, wanted_type)
+
+    if isinstance(matcher, matchers.ValueMatcher):
+        return (type_, _value_fingerprint(matcher.value))
+
+    if isinstance(matcher, (matchers.And, matchers.Or)):
+        return (type_, tuple(map(_value_fingerprint, matcher.matchers)))
+
+    if isinstance(matcher, matchers.Not):
+        return (type_, _value_fingerprint(matcher.matcher))
+
+    if isinstance(matcher, matchers.ArgThat):
+        # The stub keeps the predicate alive, so its id stays unique
+        return (type_, id(matcher.predicate))
+
+    if isinstance(matcher, matchers.Contains):
+        return (type_, _value_fingerprint(matcher.sub))
+
+    if isinstance(matcher, matchers.Matches):
+        return (type_, matcher.regex.pattern, matcher.flags)
+
+    if isinstance(matcher, matchers.ArgumentCaptor):
+        return (type_, _value_fingerprint(matcher.matcher))
+
+    if _compares_by_identity(matcher):
+        return (type_, id(matcher))
+
+    raise _Unknown
+
+
+def _compares_by_identity(value: object) -> bool:
+    type_ = type(value)
+    return (
+        type_.__eq__ is object.__eq__
+        and type_.__hash__ is object.__hash__
+    )
+
+
 def invocations_have_distinct_captors(
     left: StubbedInvocation,
     right: StubbedInvocation,
@@ -57,7 +156,7 @@ def _params_are_sameish(left: tuple, right: tuple) -> bool:
     )
 
 
-def _named_params_are_sameish(left: dict, right: dict) -> bool:
+def _named_params_are_sameish(left: Mapping, right: Mapping) -> bool:
     if set(left) != set(right):
         return False
 
@@ -0,0 +1,165 @@
+# Copyright (c) 2008-2016 Szczepan Faber, Serhiy Oplakanets, Herr Kaste
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from __future__ import annotations
+
+import warnings
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from .mock_registry import current_scope, mock_registry
+from .patching import _AttrPatch, patcher
+
+if TYPE_CHECKING:
+    from .mocking import Mock
+    from .patching import Patch
+
+
+class LeakWarning(UserWarning):
+    """Mocks or patches made before a `MockitoSession` are still active."""
+
+
+class MockitoSession:
+    """Track the mocks and patches made while the session is active.
+
+    Typically one session spans one test::
+
+        with MockitoSession():
+            when(os.path).exists('/foo').thenReturn(True)
+            expect(cache).get('foo')
+            ...
+
+    On exit the session checks its own mocks as
+    :func:`verifyExpectedInteractions` and
+    :func:`verifyStubbedInvocationsAreUsed` would, then unstubs them and
+    restores its patches.  Other mocks are not looked at, so the teardown
+    only costs as much as the session itself made.  The checks are skipped
+    if the block raised, or if you pass ``check=False`` to `finish`.
+
+    Anything still registered after that has been made before the session,
+    e.g. by an earlier test which did not :func:`unstub`.  Such leaks are
+    reported with a `LeakWarning`.
+
+    The session records what is made in any thread while it is active,
+    but within a :func:`scope` only what belongs to that scope.  With
+    pytest, the ``mockito_session`` fixture opens a session per test.
+
+    """
+
+    def __init__(self) -> None:
+        self._active = False
+        self._scope = current_scope.get()
+        self._mocks: list[tuple[object, Mock]] = []
+        self._patches: list[Patch] = []
+
+    def start(self) -> MockitoSession:
+        if self._active:
+            raise RuntimeError("The session is already active.")
+        self._active = True
+        self._scope = current_scope.get()
+        mock_registry.add_register_observer(self._on_mock_registered)
+        patcher.add_register_observer(self._on_patch_registered)
+        return self
+
+    def finish(self, check: bool = True) -> None:
+        """Check and unstub the mocks of the session, then report leaks."""
+        if not self._active:
+            return
+        self._active = False
+        mock_registry.remove_register_observer(self._on_mock_registered)
+        patcher.remove_register_observer(self._on_patch_registered)
+
+        try:
+            if check:
+                self._check()
+        finally:
+            self._unstub()
+        self._report_leaks()
+
+    def __enter__(self) -> MockitoSession:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.finish(check=exc_type is None)
+
+    @property
+    def mocks(self) -> list[Mock]:
+        """The mocks made within the session, and not unstubbed yet."""
+        return [mock for obj, mock in self._registered_mocks()]
+
+    def _on_mock_registered(self, obj: object, mock: Mock) -> None:
+        if self._active and mock.scope is self._scope:
+            self._mocks.append((obj, mock))
+
+    def _on_patch_registered(self, patch: Patch) -> None:
+        if self._active and patch.scope is self._scope:
+            self._patches.append(patch)
+
+    def _registered_mocks(self) -> list[tuple[object, Mock]]:
+        # A mock may have been unstubbed, or replaced, in the meantime
+        return [
+            (obj, mock) for obj, mock in self._mocks
+            if mock_registry.mock_for(obj) is mock
+        ]
+
+    def _check(self) -> None:
+        mocks = self.mocks
+        for mock in mocks:
+            for i in mock.expectations():
+                i.verify()
+        for mock in mocks:
+            for i in mock.unused_stubs():
+                i.check_used()
+
+    def _unstub(self) -> None:
+        mocks, self._mocks = self._mocks, []
+        patches, self._patches = self._patches, []
+        for obj, mock in reversed(mocks):
+            if mock_registry.mock_for(obj) is mock:
+                mock_registry.unstub(obj)
+        for patch in reversed(patches):
+            patch.restore_and_unregister()
+
+    def _report_leaks(self) -> None:
+        # Only look at a few of them, there may be many
+        mocks = mock_registry.mocks
+        patches = list(islice(patcher.registered_patches(), 3))
+        targets: dict[int, str] = {}
+        for obj in islice(mocks, 3):
+            targets.setdefault(id(obj), repr(obj))
+        for patch in patches:
+            target = patch.unstub_targets()[0]
+            if isinstance(patch, _AttrPatch):
+                description = "%r.%s" % (target, patch.attr_name)
+            else:
+                description = repr(target)
+            targets.setdefault(id(target), description)
+        if not targets:
+            return
+
+        what = ["%s mock(s)" % len(mocks)] if mocks else []
+        if patches:
+            what.append("patches")
+        warnings.warn(
+            "%s made before the session are still active, e.g. on %s.  "
+            "Unstub them where they are made."
+            % (" and ".join(what), ", ".join(list(targets.values())[:3])),
+            LeakWarning,
+            stacklevel=3,
+        )
@@ -1,8 +1,12 @@
 from __future__ import annotations
 from . import matchers
+from .patching import original_of
 
 import functools
 import inspect
+import types
+import weakref
+from typing import NamedTuple
 
 try:
     from inspect import signature, Parameter, Signature
@@ -10,6 +14,39 @@ except ImportError:
     from funcsigs import signature, Parameter, Signature  # type: ignore[import-not-found, no-redef]  # noqa: E501
 
 
+# How the signature of a function was taken
+_PLAIN = 0       # as is
+_BOUND = 1       # via a bound method of it
+_SKIP_FIRST = 2  # as an unbound method, t.i. without `self`
+
+# Signatures per function (and the `_PLAIN` etc. variant), shared by all
+# mocks.  Weak, so functions of garbage collected (e.g. reloaded) classes
+# drop out.
+_signature_cache: weakref.WeakKeyDictionary[
+    types.FunctionType, dict[int, Signature | None]
+] = weakref.WeakKeyDictionary()
+_cache_hits = 0
+_cache_misses = 0
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+def cache_info() -> CacheInfo:
+    """Report the statistics of the process-wide signature cache."""
+    return CacheInfo(_cache_hits, _cache_misses, len(_signature_cache))
+
+
+def cache_clear() -> None:
+    """Clear the process-wide signature cache and its statistics."""
+    global _cache_hits, _cache_misses
+    _signature_cache.clear()
+    _cache_hits = _cache_misses = 0
+
+
 def get_signature(obj: object, method_name: str) -> Signature | None:
     method = getattr(obj, method_name)
 
@@ -17,22 +54,217 @@ def get_signature(obj: object, method_name: str) -> Signature | None:
     if (
         inspect.isclass(obj)
         and not inspect.ismethod(method)
-        and not isinstance(obj.__dict__.get(method_name), staticmethod)
+        and not isinstance(
+            original_of(obj.__dict__.get(method_name)), staticmethod
+        )
     ):
-        method = functools.partial(method, None)
+        return _cached_signature(
+            method, _SKIP_FIRST, functools.partial(method, None)
+        )
+
+    if inspect.ismethod(method):
+        # `signature` of a bound method only looks at its `__func__`
+        return _cached_signature(method.__func__, _BOUND, method)
+
+    return _cached_signature(method, _PLAIN, method)
+
+
+def _cached_signature(
+    func: object, variant: int, target: object
+) -> Signature | None:
+    global _cache_hits, _cache_misses
+
+    # Only plain functions are known to be immutable enough, and weakly
+    # referenceable.
+    if type(func) is not types.FunctionType:
+        return _signature_or_none(target)
 
     try:
-        return signature(method)
+        signatures = _signature_cache[func]
+    except KeyError:
+        signatures = _signature_cache[func] = {}
+
+    try:
+        sig = signatures[variant]
+    except KeyError:
+        _cache_misses += 1
+        sig = signatures[variant] = _signature_or_none(target)
+    else:
+        _cache_hits += 1
+    return sig
+
+
+def _signature_or_none(target: object) -> Signature | None:
+    try:
+        return signature(target)  # type: ignore[arg-type]
     except Exception:
         return None
 
 
 def match_signature(sig: Signature, args: tuple, kwargs: dict) -> None:
-    sig.bind(*args, **kwargs)
+    if not binder_for(sig).accepts(args, kwargs):
+        # Either the call does not fit, or it is too unusual for the binder.
+        # `bind` has the final say, and the well-known error messages.
+        sig.bind(*args, **kwargs)
+
+
+class Binder:
+    """Decide quickly if a call fits a signature.
+
+    Compiled once per `Signature` into a few lookup tables.  `accepts` only
+    ever answers True if `Signature.bind` would succeed; on False the caller
+    should ask `bind` which then raises the proper `TypeError`.
+    """
+    def __init__(self, sig: Signature) -> None:
+        positional: list[Parameter] = []
+        keyword_only: list[Parameter] = []
+        self.var_positional = False
+        self.var_keyword = False
+        for param in sig.parameters.values():
+            kind = param.kind
+            if kind in (Parameter.POSITIONAL_ONLY,
+                        Parameter.POSITIONAL_OR_KEYWORD):
+                positional.append(param)
+            elif kind is Parameter.KEYWORD_ONLY:
+                keyword_only.append(param)
+            elif kind is Parameter.VAR_POSITIONAL:
+                self.var_positional = True
+            else:
+                self.var_keyword = True
+
+        self.max_positional = len(positional)
+        #: Positional parameters without default always come first
+        self.min_positional = len([
+            p for p in positional if p.default is Parameter.empty
+        ])
+        self.required_positional = tuple(
+            (p.name, p.kind is Parameter.POSITIONAL_ONLY)
+            for p in positional[:self.min_positional]
+        )
+        #: The positions of the parameters which can be passed by keyword
+        self.keyword_positions = {
+            p.name: x
+            for x, p in enumerate(positional)
+            if p.kind is Parameter.POSITIONAL_OR_KEYWORD
+        }
+        self.positional_only_names = frozenset(
+            p.name for p in positional if p.kind is Parameter.POSITIONAL_ONLY
+        )
+        self.keyword_only_names = frozenset(p.name for p in keyword_only)
+        self.required_keyword_only = tuple(
+            p.name for p in keyword_only if p.default is Parameter.empty
+        )
+
+        self._sig = sig
+        self._without_keywords: Signature | None = None
+        #: Shapes of stub calls (see `stub_shape`) known to be valid
+        self.valid_stub_shapes: set[tuple] = set()
+
+    @property
+    def without_keywords(self) -> Signature:
+        """The signature stripped of its keyword-only and `**` parameters."""
+        sig = self._without_keywords
+        if sig is None:
+            sig = self._without_keywords = self._sig.replace(parameters=[
+                p for p in self._sig.parameters.values()
+                if p.kind not in (Parameter.KEYWORD_ONLY,
+                                  Parameter.VAR_KEYWORD)
+            ])
+        return sig
 
+    def accepts(self, args: tuple, kwargs: dict) -> bool:  # noqa: C901
+        given = len(args)
+        if given > self.max_positional and not self.var_positional:
+            return False
 
-def match_signature_allowing_placeholders(  # noqa: C901
+        if not kwargs:
+            return (
+                given >= self.min_positional
+                and not self.required_keyword_only
+            )
+
+        keyword_positions = self.keyword_positions
+        for name in kwargs:
+            position = keyword_positions.get(name)
+            if position is not None:
+                if position < given:
+                    return False
+            elif name in self.keyword_only_names:
+                continue
+            elif not self.var_keyword or name in self.positional_only_names:
+                return False
+
+        for name, positional_only in self.required_positional[given:]:
+            if positional_only or name not in kwargs:
+                return False
+
+        for name in self.required_keyword_only:
+            if name not in kwargs:
+                return False
+
+        return True
+
+
+# Binders by `id` of their signature.  (Signatures cannot be weakly
+# referenced, and hashing them is costly.)  Since we keep the signature
+# alive with its binder, the `id` cannot be reused while in here.
+_binders: dict[int, tuple[Signature, Binder]] = {}
+MAX_BINDERS = 4096
+
+
+def binder_for(sig: Signature) -> Binder:
+    try:
+        return _binders[id(sig)][1]
+    except KeyError:
+        if len(_binders) >= MAX_BINDERS:
+            _binders.clear()
+        binder = Binder(sig)
+        _binders[id(sig)] = (sig, binder)
+        return binder
+
+
+# Tags for `stub_shape`
+_VALUE = 0
+_ELLIPSIS = 1
+_ARGS = 2
+_CALL_CAPTOR = 3
+MAX_STUB_SHAPES = 256
+
+
+def stub_shape(args: tuple, kwargs: dict) -> tuple:
+    """Reduce a stub call to what its validation depends on.
+
+    T.i. which arguments are placeholders and the keyword names, but not
+    the values.
+    """
+    return (tuple(map(_placeholder_tag, args)), tuple(kwargs))
+
+
+def _placeholder_tag(arg: object) -> int:
+    if arg is Ellipsis:
+        return _ELLIPSIS
+    if matchers.is_args_sentinel(arg):
+        return _ARGS
+    if matchers.is_call_captor(arg):
+        return _CALL_CAPTOR
+    return _VALUE
+
+
+def match_signature_allowing_placeholders(
     sig: Signature, args: tuple, kwargs: dict
+) -> None:
+    binder = binder_for(sig)
+    shape = stub_shape(args, kwargs)
+    if shape in binder.valid_stub_shapes:
+        return
+
+    _match_signature_allowing_placeholders(binder, sig, args, kwargs)
+    if len(binder.valid_stub_shapes) < MAX_STUB_SHAPES:
+        binder.valid_stub_shapes.add(shape)
+
+
+def _match_signature_allowing_placeholders(  # noqa: C901
+    binder: Binder, sig: Signature, args: tuple, kwargs: dict
 ) -> None:
     # Let's face it. If this doesn't work out, we have to do it the hard
     # way and reimplement something like `sig.bind` with our specific
@@ -48,15 +280,12 @@ def match_signature_allowing_placeholders(  # noqa: C901
         if len(args) == 1:
             return
 
-        has_kwargs = has_var_keyword(sig)
+        has_kwargs = binder.var_keyword
         # Ellipsis is the last arg in args; then it matches all keyword
         # arguments as well. So the strategy here is to strip off all
         # the keyword arguments from the signature, and do a partial
         # bind with the rest.
-        params = [p for n, p in sig.parameters.items()
-                  if p.kind not in (Parameter.KEYWORD_ONLY,
-                                    Parameter.VAR_KEYWORD)]
-        sig = sig.replace(parameters=params)
+        sig = binder.without_keywords
         # Ellipsis should fill at least one argument. We strip it off if
         # it can stand for a `kwargs` argument.
         sig.bind_partial(*(args[:-1] if has_kwargs else args))
@@ -86,8 +315,8 @@ def match_signature_allowing_placeholders(  # noqa: C901
                     raise
 
             else:
-                if kwargs_provided and not has_var_keyword(sig):
-                    pos_args = positional_arguments(sig)
+                if kwargs_provided and not binder.var_keyword:
+                    pos_args = binder.max_positional
                     len_args = len(args) - int(args_provided)
                     len_kwargs = len(kwargs)
                     provided_args = len_args + len_kwargs
@@ -101,15 +330,4 @@ def match_signature_allowing_placeholders(  # noqa: C901
         else:
             # Without Ellipsis and the other stuff this would really be
             # straight forward.
-            sig.bind(*args, **kwargs)
-
-
-def positional_arguments(sig: Signature) -> int:
-    return len([p for n, p in sig.parameters.items()
-                if p.kind in (Parameter.POSITIONAL_ONLY,
-                              Parameter.POSITIONAL_OR_KEYWORD)])
-
-def has_var_keyword(sig: Signature) -> bool:
-    return any(p for n, p in sig.parameters.items()
-               if p.kind is Parameter.VAR_KEYWORD)
-
+            match_signature(sig, args, kwargs)
@@ -52,29 +52,46 @@ def spy(object):
 
     """
     if inspect.isclass(object) or inspect.ismodule(object):
-        class_ = None
+        Spy = _SPY_WITHOUT_CLASS
     else:
-        class_ = object.__class__
+        Spy = _SPY_WITH_CLASS
 
+    theMock = Mock(None, strict=True, spec=object)
+    obj = theMock.mocked_obj = Spy(theMock)
+
+    mock_registry.register(obj, theMock)
+    return obj
+
+
+def _make_spy_template(has_class: bool) -> type:
     class Spy(_Dummy):
-        if class_:
-            __class__ = class_
+        __qualname__ = 'Spy'
+        __slots__ = ('__mock',)
+
+        def __init__(self, mock):
+            self.__mock = mock
+
+        if has_class:
+            @property  # type: ignore[misc]
+            def __class__(self):
+                return self.__mock.spec.__class__
 
         def __getattr__(self, method_name):
-            return RememberedProxyInvocation(theMock, method_name)
+            return RememberedProxyInvocation(self.__mock, method_name)
 
         def __repr__(self):
             name = 'Spied'
-            if class_:
-                name += class_.__name__
+            if has_class:
+                name += self.__mock.spec.__class__.__name__
             return "<%s id=%s>" % (name, id(self))
 
+    return Spy
 
-    obj = Spy()
-    theMock = Mock(obj, strict=True, spec=object)
 
-    mock_registry.register(obj, theMock)
-    return obj
+# Unlike for `mock()` we patch the spy itself, not its class, so all spies
+# can share these.
+_SPY_WITH_CLASS = _make_spy_template(True)
+_SPY_WITHOUT_CLASS = _make_spy_template(False)
 
 
 def spy2(fn) -> None:
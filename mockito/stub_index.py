@@ -0,0 +1,111 @@
+"""Per method lookup of the stub answering a call.
+
+Stubs are tried newest first, and the first matching one answers.  Stubs
+made of plain literals only, e.g. `when(cache).get('user:42')`, match exactly
+the calls with equal arguments.  We keep them in a dict keyed by their
+arguments, so that a call with plain literal arguments finds its stub without
+comparing it to all the others.  Only stubs with matchers or placeholders
+registered *after* the found one must still be tried.
+"""
+from __future__ import annotations
+
+import itertools
+from collections import deque
+from typing import Hashable, Iterator
+
+from . import match_plan
+from .invocation import RealInvocation, StubbedInvocation
+
+
+# For so few stubs trying them one by one is as fast as computing the key
+_SCAN_AT_MOST = 2
+
+
+class StubIndex:
+    def __init__(self, counter: Iterator[int] | None = None) -> None:
+        #: All stubs of the method, newest first
+        self.stubs: deque[StubbedInvocation] = deque()
+
+        self._literal_stubs: dict[Hashable, deque[StubbedInvocation]] = {}
+        #: The stubs which are not in `_literal_stubs`, newest first
+        self._other_stubs: deque[StubbedInvocation] = deque()
+        self._age: dict[StubbedInvocation, int] = {}
+        # Indexes sharing a counter tell the ages of their stubs apart
+        self._counter = itertools.count() if counter is None else counter
+
+    def __len__(self) -> int:
+        return len(self.stubs)
+
+    def add(self, stub: StubbedInvocation) -> None:
+        self.stubs.appendleft(stub)
+        self._age[stub] = next(self._counter)
+
+        key = stub.match_plan.literal_key
+        if key is None:
+            self._other_stubs.appendleft(stub)
+        else:
+            self._literal_stubs.setdefault(key, deque()).appendleft(stub)
+
+    def remove(self, stub: StubbedInvocation) -> None:
+        self.stubs.remove(stub)
+        del self._age[stub]
+
+        key = stub.match_plan.literal_key
+        if key is None:
+            self._other_stubs.remove(stub)
+        else:
+            same_key = self._literal_stubs[key]
+            same_key.remove(stub)
+            if not same_key:
+                del self._literal_stubs[key]
+
+    def age_of(self, stub: StubbedInvocation) -> int | None:
+        """Return when `stub` was added, relative to the other stubs.
+
+        Returns None if `stub` is not (anymore) in the index.
+        """
+        return self._age.get(stub)
+
+    def find(self, invoc: RealInvocation) -> StubbedInvocation | None:
+        """Return the newest stub matching `invoc`, if any."""
+        if (
+            len(self.stubs) <= _SCAN_AT_MOST
+            or not self._literal_stubs
+            or not _uses_default_compare()
+        ):
+            return _first_match(self.stubs, invoc)
+
+        key = match_plan.call_key(invoc.params, invoc.named_params)
+        if key is None:
+            return _first_match(self.stubs, invoc)
+
+        same_key = self._literal_stubs.get(key)
+        if same_key:
+            candidate = same_key[0]
+            minimum_age = self._age[candidate]
+        else:
+            candidate = None
+            minimum_age = -1
+
+        for stub in self._other_stubs:
+            if self._age[stub] < minimum_age:
+                break
+            if stub.matches(invoc):
+                return stub
+
+        return candidate
+
+
+def _first_match(
+    stubs: deque[StubbedInvocation], invoc: RealInvocation
+) -> StubbedInvocation | None:
+    for stub in stubs:
+        if stub.matches(invoc):
+            return stub
+    return None
+
+
+def _uses_default_compare() -> bool:
+    # A replaced `compare` may consider different literals equal, in which
+    # case the keys tell us nothing.
+    return StubbedInvocation.compare is match_plan.compare
@@ -0,0 +1,196 @@
+"""Snapshots of configured stubs, to set them up again in one go.
+
+Setting up a stub checks the method and its signature against the original
+object, looks up the original method, and figures out how the stub continues
+(with an answer or another chain).  A `StubTemplate` keeps the outcome of
+all that, so that `StubTemplate.apply` only needs to patch and to fill in
+the bookkeeping of the mocks.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Hashable, Tuple
+
+from . import invocation, sameish
+from .mock_registry import current_scope, mock_registry
+from .mocking import Mock
+from .mockito import ArgumentError
+from .utils import get_obj
+
+
+@dataclass(frozen=True)
+class _Stub:
+    #: A detached copy of the configured stub, never used itself
+    prototype: invocation.StubbedInvocation
+    #: Set if the stub answers directly, t.i. has a `ValueContinuation`
+    answers_directly: bool
+    #: The stubs of the chain, if the stub continues with one
+    chain: _Stubs | None
+    #: See `sameish.fingerprint`, for the bookkeeping of the continuation
+    fingerprint: Hashable | None
+
+
+@dataclass(frozen=True)
+class _Stubs:
+    #: Oldest first
+    stubs: Tuple[_Stub, ...]
+    coroutines: frozenset
+
+
+@dataclass(frozen=True)
+class _MockState:
+    obj: object
+    mock: Mock
+    stubs: _Stubs
+
+
+@dataclass(frozen=True)
+class StubTemplate:
+    """The stubs of some objects, as configured when `snapshot` was taken.
+
+    See :func:`snapshot`.
+    """
+
+    mocks: Tuple[_MockState, ...]
+
+    def apply(self) -> None:
+        """Stub the objects again, as configured when taking the snapshot.
+
+        The stubs are added to the ones the objects already have, as if the
+        ``when`` calls ran again, but without checking them again.  The
+        counts of uses, and the calls, start from zero.
+        """
+        for state in self.mocks:
+            _apply_stubs(state.stubs, _mock_for(state))
+
+    def __repr__(self) -> str:
+        return "<StubTemplate of %s>" % ", ".join(
+            repr(state.obj) for state in self.mocks
+        )
+
+
+def snapshot(*objs) -> StubTemplate:
+    """Capture the stubs of `objs` as a template to set them up again later.
+
+    Set up the same stubs over and over, e.g. for every test, without paying
+    for the checks :func:`when` and :func:`expect` do each time::
+
+        @pytest.fixture(scope="module")
+        def api_stubs():
+            when(api).get('/users').thenReturn(USERS)
+            ...  # many more
+            template = snapshot(api)
+            unstub(api)
+            return template
+
+        @pytest.fixture
+        def api(api_stubs):
+            api_stubs.apply()
+            yield
+            unstub()
+
+    The template holds the stubs, their answers, expectations and chains.
+    Answers already given are left out, so take the snapshot before the
+    stubs get used.  Attributes replaced via :func:`patch_attr` or
+    :func:`patch_dict` are not part of it.
+
+    If you leave out the argument, all registered objects are captured.
+    """
+    if objs:
+        pairs: list[tuple[object, Mock]] = []
+        for obj in objs:
+            if isinstance(obj, str):
+                obj = get_obj(obj)
+            theMock = mock_registry.mock_for(obj)
+            if theMock is None:
+                raise ArgumentError("obj '%s' is not registered" % obj)
+            pairs.append((obj, theMock))
+    else:
+        pairs = mock_registry.mocks.items()
+
+    chain_mocks: set[int] = set()
+    states = [
+        _MockState(obj, theMock, _capture_stubs(theMock, chain_mocks))
+        for obj, theMock in pairs
+    ]
+    # The mocks of chains are registered as well, but belong to their stub
+    return StubTemplate(tuple(
+        state for state in states if id(state.mock) not in chain_mocks
+    ))
+
+
+def _capture_stubs(theMock: Mock, chain_mocks: set[int]) -> _Stubs:
+    stubs = []
+    for stub in reversed(theMock.stubbed_invocations):
+        prototype = stub.copy_to(theMock)
+        continuation = theMock.configured_continuation(stub)
+        chain = None
+        if isinstance(continuation, invocation.ChainContinuation):
+            chain_mocks.add(id(continuation.chain_mock))
+            chain = _capture_stubs(continuation.chain_mock, chain_mocks)
+            # `apply` answers with a new chain instead
+            prototype.answers = invocation.CompositeAnswer(
+                prototype.answers.default_answer
+            )
+        stubs.append(_Stub(
+            prototype,
+            isinstance(continuation, invocation.ValueContinuation),
+            chain,
+            sameish.fingerprint(stub) if continuation else None,
+        ))
+
+    coroutines = frozenset(
+        stub.prototype.method_name for stub in stubs
+        if theMock.is_marked_as_coroutine(stub.prototype.method_name)
+    )
+    return _Stubs(tuple(stubs), coroutines)
+
+
+def _mock_for(state: _MockState) -> Mock:
+    # Prefer the captured mock, it already knows the original methods and
+    # their signatures.  Follows `_get_mock` otherwise.
+    theMock = mock_registry.mock_for(state.obj)
+    if theMock is not None and not (
+        theMock.patch_per_scope and theMock.scope is not current_scope.get()
+    ):
+        return theMock
+
+    theMock = state.mock
+    if theMock.patch_per_scope and theMock.scope is not current_scope.get():
+        theMock = Mock(state.obj, strict=theMock.strict, spec=theMock.spec)
+    mock_registry.register(state.obj, theMock)
+    return theMock
+
+
+def _apply_stubs(
+    stubs: _Stubs,
+    theMock: Mock,
+    parent_invocation: invocation.StubbedInvocation | None = None,
+) -> None:
+    for method_name in stubs.coroutines:
+        theMock.mark_as_coroutine(method_name)
+
+    for template in stubs.stubs:
+        stub = template.prototype.copy_to(theMock, parent_invocation)
+        if isinstance(stub, invocation.StubbedPropertyAccess):
+            theMock.stub_property(stub.method_name)
+        else:
+            theMock.stub(stub.method_name)
+        theMock.finish_stubbing(stub)
+
+        if template.chain is not None:
+            chain_root, chain_mock = invocation.create_chain_mock()
+            _apply_stubs(template.chain, chain_mock, stub)
+            stub.add_answer(
+                invocation.return_awaitable(chain_root)
+                if stub.refers_coroutine
+                else invocation.return_(chain_root)
+            )
+            theMock.set_continuation_by_fingerprint(
+                invocation.ChainContinuation(stub, chain_mock),
+                template.fingerprint,
+            )
+        elif template.answers_directly:
+            theMock.set_continuation_by_fingerprint(
+                invocation.ValueContinuation(stub), template.fingerprint
+            )
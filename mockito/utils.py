@@ -120,42 +120,66 @@ def get_function_host(fn):
 
 FIND_ID = re.compile(r'.*\s*.*(?:when2|patch|spy2)\(\s*(.+?)[,\)]', re.M)
 
+# The parsed dotted path per call site, t.i. per code object and instruction;
+# None if the source there did not match `FIND_ID`.
+_call_sites: dict = {}
+MAX_CALL_SITES = 1024
+
 
 def find_invoking_frame_and_try_parse():
     # Actually we just want the first frame in user land; we're open for
     # refactorings here and don't yet decide on which frame exactly we hit
     # that user land.
-    stack = inspect.stack(3)[2:10]
-    for frame_info in stack:
+    frame: types.FrameType | None = sys._getframe(2)
+    for _ in range(8):
+        if frame is None:
+            break
+
         # Within `patch` and `spy2` we delegate to `when2` but that's not
         # user land code
-        if frame_info[3] in ('patch', 'spy2'):
-            continue
-
-        source = ''.join(frame_info[4] or [])
-        m = FIND_ID.match(source)
-        if m:
-            # id should be something like `os.path.exists` etc.
-            id = m.group(1)
-            parts = id.split('.')
-            if len(parts) < 2:
-                raise TypeError("can't guess origin of '%s'" % id)
-
-            frame = frame_info[0]
-            vars = frame.f_globals.copy()
-            vars.update(frame.f_locals)
-
-            # Now that's a simple reduce; we get the initial value from the
-            # locally available `vars`, and then reduce the middle parts via
-            # `getattr`. The last path component gets not resolved, but is
-            # returned as plain string value.
-            obj = vars.get(parts[0])
-            for part in parts[1:-1]:
-                obj = getattr(obj, part)
-            return obj, parts[-1]
+        if frame.f_code.co_name not in ('patch', 'spy2'):
+            parts = _parse_call_site(frame)
+            if parts is not None:
+                if len(parts) < 2:
+                    raise TypeError("can't guess origin of '%s'" % '.'.join(parts))
+
+                # Now that's a simple reduce; we get the initial value from the
+                # locally available vars, and then reduce the middle parts via
+                # `getattr`. The last path component gets not resolved, but is
+                # returned as plain string value.
+                f_locals = frame.f_locals
+                obj = (
+                    f_locals[parts[0]]
+                    if parts[0] in f_locals
+                    else frame.f_globals.get(parts[0])
+                )
+                for part in parts[1:-1]:
+                    obj = getattr(obj, part)
+                return obj, parts[-1]
+
+        frame = frame.f_back
 
     raise TypeError('could not destructure first argument')
 
+
+def _parse_call_site(frame):
+    key = (frame.f_code, frame.f_lasti)
+    try:
+        return _call_sites[key]
+    except KeyError:
+        pass
+
+    source = ''.join(inspect.getframeinfo(frame, context=3).code_context or [])
+    m = FIND_ID.match(source)
+    # id should be something like `os.path.exists` etc.
+    parts = tuple(m.group(1).split('.')) if m else None
+
+    if len(_call_sites) >= MAX_CALL_SITES:
+        _call_sites.clear()
+    _call_sites[key] = parts
+    return parts
+
+
 def get_obj(path):
     """Return obj for given dotted path.
 
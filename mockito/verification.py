@@ -22,10 +22,11 @@ from __future__ import annotations
 
 import operator
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator, cast
 
 if TYPE_CHECKING:
-    from .invocation import MatchingInvocation
+    from .invocation import MatchingInvocation, RealInvocation
+    from .recording import Recorder
 
 __all__ = ['never', 'VerificationError']
 
@@ -48,6 +49,42 @@ class VerificationMode(ABC):
     ) -> None:
         pass
 
+    def satisfied_by(self, actual_count: int) -> bool:
+        """Tell if `verify` would pass for `actual_count` calls.
+
+        This is asked repeatedly while waiting for calls (see
+        `verify(..., timeout=...)`).  By default we run `verify` for a
+        stand-in of the wanted invocation; override it with a cheap check.
+        """
+        try:
+            self.verify(cast('MatchingInvocation', _STAND_IN), actual_count)
+        except VerificationError:
+            return False
+        return True
+
+
+class _StandIn:
+    """Stands in for the wanted invocation in `satisfied_by`.
+
+    It is also its own mock, without any calls or stubs.
+    """
+
+    method_name = ''
+    invocations = ()
+    stubbed_invocations = ()
+
+    def __init__(self) -> None:
+        self.mock = self
+
+    def matches(self, invocation: object) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return '<wanted invocation>'
+
+
+_STAND_IN = _StandIn()
+
 
 class AtLeast(VerificationMode):
     def __init__(self, wanted_count: int) -> None:
@@ -64,6 +101,9 @@ class AtLeast(VerificationMode):
             raise VerificationError("\nWanted at least: %i, actual times: %i"
                                     % (self.wanted_count, actual_count))
 
+    def satisfied_by(self, actual_count: int) -> bool:
+        return actual_count > 0 and actual_count >= self.wanted_count
+
     def __repr__(self):
         return "<%s wanted=%s>" % (type(self).__name__, self.wanted_count)
 
@@ -78,6 +118,9 @@ class AtMost(VerificationMode):
             raise VerificationError("\nWanted at most: %i, actual times: %i"
                                     % (self.wanted_count, actual_count))
 
+    def satisfied_by(self, actual_count: int) -> bool:
+        return actual_count <= self.wanted_count
+
     def __repr__(self):
         return "<%s wanted=%s>" % (type(self).__name__, self.wanted_count)
 
@@ -96,6 +139,9 @@ class Between(VerificationMode):
                 "\nWanted between: [%s, %s], actual times: %s"
                 % (self.wanted_from, self.wanted_to, actual_count))
 
+    def satisfied_by(self, actual_count: int) -> bool:
+        return self.wanted_from <= actual_count <= self.wanted_to
+
     def __repr__(self):
         return "<Between [%s, %s]>" % (self.wanted_from, self.wanted_to)
 
@@ -121,6 +167,9 @@ class Times(VerificationMode):
             raise VerificationError("\nWanted times: %i, actual times: %i"
                                     % (self.wanted_count, actual_count))
 
+    def satisfied_by(self, actual_count: int) -> bool:
+        return actual_count == self.wanted_count
+
     def __repr__(self):
         return "<%s wanted=%s>" % (type(self).__name__, self.wanted_count)
 
@@ -140,7 +189,9 @@ def error_message_for_unmatched_invocation(
         f"\nWanted but not invoked:\n\n    {invocation}\n"
     )
     if invocations:
-        content = "\n    ".join(map(str, invocations))
+        content = "\n    ".join(
+            _describe(invocations, invocation.mock.recorder)
+        )
         instead_section = f"\nInstead got:\n\n    {content}\n"
     elif (
         len(invocation.mock.stubbed_invocations) > 1
@@ -157,6 +208,17 @@ def error_message_for_unmatched_invocation(
     return "%s%s\n" % (wanted_section, instead_section)
 
 
+def _describe(
+    invocations: Iterable[RealInvocation], recorder: Recorder
+) -> Iterator[str]:
+    for invocation in invocations:
+        count = recorder.count(invocation)
+        if count == 1:
+            yield str(invocation)
+        else:
+            yield "%s  (%i times)" % (invocation, count)
+
+
 class InOrder(VerificationMode):
     '''Verifies invocations in order.
 
@@ -175,17 +237,28 @@ class InOrder(VerificationMode):
     def verify(
         self, wanted_invocation: MatchingInvocation, count: int
     ) -> None:
-        for invocation in wanted_invocation.mock.invocations:
-            if not invocation.verified_inorder:
-                if not wanted_invocation.matches(invocation):
-                    raise VerificationError(
-                        '\nWanted %s to be invoked,'
-                        '\ngot    %s instead.' %
-                        (wanted_invocation, invocation))
-                invocation.verified_inorder = True
-                break
+        if not wanted_invocation.mock.recorder.keeps_order:
+            raise VerificationError(
+                "\nCannot verify in order: the recording policy %r of this"
+                "\nmock does not keep the order of the calls."
+                % (wanted_invocation.mock.recorder.policy,)
+            )
+
+        invocation = \
+            wanted_invocation.mock.recorder.next_unverified_in_order()
+        if invocation is not None:
+            if not wanted_invocation.matches(invocation):
+                raise VerificationError(
+                    '\nWanted %s to be invoked,'
+                    '\ngot    %s instead.' %
+                    (wanted_invocation, invocation))
+            invocation.verified_inorder = True
         # proceed with original verification
         self.original_verification.verify(wanted_invocation, count)
 
+    def satisfied_by(self, actual_count: int) -> bool:
+        # The order is only checked by `verify`
+        return self.original_verification.satisfied_by(actual_count)
+
 
 never = 0
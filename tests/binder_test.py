@@ -0,0 +1,89 @@
+import itertools
+
+import pytest
+
+from mockito.signature import Binder, signature
+
+
+def none_args():
+    pass
+
+
+def one_arg(a):
+    pass
+
+
+def two_args_wt_default(a, b=None):
+    pass
+
+
+def star_arg(*args):
+    pass
+
+
+def star_kwarg(**kwargs):
+    pass
+
+
+def combination(a, b=None, *c, **d):
+    pass
+
+
+def keyword_only(a, *, b, c=None):
+    pass
+
+
+def keyword_only_with_kwargs(*, b, **d):
+    pass
+
+
+def positional_only(a, /, b):
+    pass
+
+
+def positional_only_with_kwargs(a, b=None, /, **d):
+    pass
+
+
+FUNCTIONS = [
+    none_args,
+    one_arg,
+    two_args_wt_default,
+    star_arg,
+    star_kwarg,
+    combination,
+    keyword_only,
+    keyword_only_with_kwargs,
+    positional_only,
+    positional_only_with_kwargs,
+]
+
+
+CALL_ARGS = [(), (1,), (1, 2), (1, 2, 3)]
+CALL_KWARGS = [
+    {}, {"a": 1}, {"b": 2}, {"c": 3}, {"d": 4}, {"a": 1, "b": 2},
+    {"b": 2, "c": 3}, {"args": 1}, {"kwargs": 1},
+]
+
+
+def binds(sig, args, kwargs):
+    try:
+        sig.bind(*args, **kwargs)
+    except TypeError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("func", FUNCTIONS, ids=lambda f: f.__name__)
+def test_binder_agrees_with_bind(func):
+    sig = signature(func)
+    binder = Binder(sig)
+    for args, kwargs in itertools.product(CALL_ARGS, CALL_KWARGS):
+        expected = binds(sig, args, kwargs)
+        accepted = binder.accepts(args, kwargs)
+        if accepted:
+            assert expected, (args, kwargs)
+        elif expected:
+            # The binder may only pass on positional-only names given
+            # by keyword.
+            assert set(kwargs) & binder.positional_only_names, (args, kwargs)
@@ -301,7 +301,7 @@ def test_failed_call_original_on_deep_property_leaf_rolls_back_only_leaf():
         when(cat).age.expected.to.value.thenCallOriginalImplementation()
 
     assert str(exc.value) == (
-        "'<class 'mockito.mocking.mock.<locals>.Dummy'>' "
+        "'<class 'mockito.mocking.Dummy'>' "
         "has no original implementation for 'value'."
     )
     assert cat.age.expected.to.be(14) is False
@@ -594,3 +594,54 @@ def test_unexpected_chain_segment_arguments_raise_invocation_error_early():
         "\n"
     )
 
+
+
+class AlwaysEqual:
+    def __eq__(self, other):
+        return True
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def test_chain_branches_with_opaque_arguments_share_root():
+    cat = mock()
+    key = AlwaysEqual()
+
+    when(cat).meow(key).purr().thenReturn("friendly")
+    when(cat).meow(key).roll().thenReturn("playful")
+
+    cat_that_meowed = cat.meow(key)
+    assert cat_that_meowed.purr() == "friendly"
+    assert cat_that_meowed.roll() == "playful"
+
+
+def test_opaque_arguments_see_equal_direct_return_configuration():
+    cat = mock()
+
+    when(cat).meow(1).thenReturn("one")
+    with pytest.raises(InvocationError) as exc:
+        when(cat).meow(AlwaysEqual()).purr()
+
+    assert str(exc.value) == "'meow' is already configured with a direct answer."
+
+
+def test_many_chain_roots_on_same_method_are_kept_apart():
+    cat = mock()
+
+    for n in range(100):
+        when(cat).meow(n).purr().thenReturn(n)
+        when(cat).meow(n).roll().thenReturn(-n)
+
+    assert cat.meow(42).purr() == 42
+    assert cat.meow(42).roll() == -42
+
+
+def test_old_answer_selector_does_not_configure_forgotten_root():
+    cat = mock()
+
+    answer_selector = when(cat).meow()
+    unstub(cat)
+    answer_selector.thenReturn("stale")
+
+    when(cat).meow().purr().thenReturn("friendly")
+    assert cat.meow().purr() == "friendly"
@@ -1,6 +1,8 @@
-
 import pytest
 
+# Loaded via the entry point if mockito is installed; for a plain checkout
+pytest_plugins = ["mockito.pytest_plugin"]
+
 
 @pytest.fixture
 def unstub():
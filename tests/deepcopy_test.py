@@ -74,3 +74,9 @@ class TestCopy:
         assert str(exc.value) == (
             "'Dummy' has no attribute '__copy__' configured"
         )
+
+    def test_copy_sees_stubs_added_later(self):
+        m = mock(strict=True)
+        n = copy(m)
+        when(m).bar().thenReturn(2)
+        assert n.bar() == 2
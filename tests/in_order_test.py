@@ -134,6 +134,24 @@ def test_incorrect_order_declaration_should_fail():
     )
 
 
+def test_in_order_verifies_long_protocols_step_by_step():
+    client = mock()
+    server = mock()
+
+    in_order = InOrder(client, server)
+    for step in range(500):
+        client.send(step)
+        server.ack(step)
+
+    for step in range(500):
+        in_order.verify(client).send(step)
+        in_order.verify(server).ack(step)
+
+    with pytest.raises(VerificationError) as e:
+        in_order.verify(client).send(...)
+    assert str(e.value) == "\nThere are no more recorded invocations."
+
+
 def test_in_order_error_message_uses_callsite_names_for_wrong_mock():
     garfield = mock()
     sinclair = mock()
@@ -150,6 +168,36 @@ def test_in_order_error_message_uses_callsite_names_for_wrong_mock():
     )
 
 
+def test_in_order_parses_the_callsite_only_for_error_messages():
+    garfield = mock()
+    sinclair = mock()
+
+    inorder._parsed_sources.clear()
+    in_order = InOrder(sinclair, garfield)
+    assert len(inorder._parsed_sources) == 0
+
+    garfield.meow()
+    with pytest.raises(VerificationError):
+        in_order.verify(sinclair).meow()
+    assert len(inorder._parsed_sources) == 1
+
+
+def test_in_order_parses_each_callsite_function_once():
+    garfield = mock()
+    sinclair = mock()
+
+    inorder._parsed_sources.clear()
+    for _ in range(3):
+        with InOrder(sinclair, garfield) as in_order:
+            garfield.meow()
+
+            with pytest.raises(VerificationError) as e:
+                in_order.verify(sinclair).meow()
+            assert "got    garfield.meow() instead." in str(e.value)
+
+    assert len(inorder._parsed_sources) == 1
+
+
 def test_in_order_error_message_falls_back_when_inorder_callsite_is_ambiguous():
     garfield = mock()
     sinclair = mock()
@@ -26,6 +26,7 @@ from mockito import (
     verifyZeroInteractions, verifyExpectedInteractions,
     verifyStubbedInvocationsAreUsed)
 from mockito.invocation import InvocationError
+from mockito.mock_registry import mock_registry
 from mockito.verification import VerificationError
 
 pytestmark = pytest.mark.usefixtures("unstub")
@@ -387,6 +388,65 @@ class TestEnsureStubsAreUsed:
             "\nOnly 2 of 3 answers were used for bark('Miau')"
         )
 
+    def testFailIfAnswersAreAddedAfterUse(self):
+        dog = mock()
+        answer_selector = when(dog).waggle().thenReturn('Sure')
+        dog.waggle()
+        verifyStubbedInvocationsAreUsed(dog)
+
+        answer_selector.thenReturn('Nope')
+        with pytest.raises(VerificationError) as exc:
+            verifyStubbedInvocationsAreUsed(dog)
+
+        assert str(exc.value) == "\nOnly 1 of 2 answers were used for waggle()"
+
+    def testReportTheNewestUnusedStubFirst(self):
+        dog = mock()
+        when(dog).waggle()
+        when(dog).bark('Miau')
+        when(dog).bark('Grrr')
+        dog.bark('Grrr')
+
+        with pytest.raises(VerificationError) as exc:
+            verifyStubbedInvocationsAreUsed(dog)
+
+        assert str(exc.value) == "\nUnused stub: bark('Miau')"
+
+    def testForgetUnstubbedStubs(self):
+        when(Dog).bark('Miau')
+        when(Dog).waggle()
+        rex = Dog()
+        rex.waggle()
+        unstub(Dog.bark)
+
+        verifyStubbedInvocationsAreUsed(Dog)
+
+    def testOnlyLookAtMocksWithSomethingToCheck(self):
+        used, unused, expected = mock(), mock(), mock()
+        answer_selector = when(used).waggle().thenReturn('Sure')
+        when(unused).waggle()
+        expect(expected, times=1).waggle()
+        used.waggle()
+        expected.waggle()
+
+        def mocks_to_check():
+            return [
+                mock_registry.obj_for(m)
+                for m in mock_registry.get_mocks_to_check()
+            ]
+
+        assert mocks_to_check() == [unused, expected]
+
+        answer_selector.thenReturn('Nope')
+        assert mocks_to_check() == [unused, expected, used]
+
+        unused.waggle()
+        used.waggle()
+        unstub(expected)
+        assert mocks_to_check() == []
+        verifyStubbedInvocationsAreUsed()
+        verifyExpectedInteractions()
+
 
 @pytest.mark.usefixtures('unstub')
 class TestImplicitVerificationsUsingExpect:
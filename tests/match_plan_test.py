@@ -0,0 +1,265 @@
+import itertools
+
+import pytest
+
+from mockito import matchers
+from mockito.match_plan import call_key, compile_plan, is_plain_literal
+from mockito.matchers import ARGS, KWARGS, any_, arg_that, captor, eq, gt
+
+
+def legacy_compare(p1, p2):
+    if p1 is Ellipsis:
+        return True
+
+    if isinstance(p1, matchers.Matcher):
+        if not p1.matches(p2):
+            return False
+    elif p1 != p2:
+        return False
+    return True
+
+
+def legacy_matches(params, named_params, call_params, call_named_params,  # noqa: C901, E501
+                   compare=legacy_compare):
+    """`MatchingInvocation.matches` as it was before match plans."""
+    if (
+        len(params) == 1
+        and not named_params
+        and matchers.is_call_captor(params[0])
+    ):
+        return True
+
+    for x, p1 in enumerate(params):
+        if (
+            p1 is Ellipsis
+            and x == len(params) - 1
+            and not named_params
+        ):
+            return True
+
+        if p1 is matchers.ARGS_SENTINEL:
+            break
+
+        if matchers.is_captor_args_sentinel(p1):
+            if not p1.matches(call_params[x:]):
+                return False
+            break
+
+        try:
+            p2 = call_params[x]
+        except IndexError:
+            return False
+
+        if not compare(p1, p2):
+            return False
+    else:
+        if len(params) != len(call_params):
+            return False
+
+    fixed_named_keys = {
+        key
+        for key in named_params
+        if key is not matchers.KWARGS_SENTINEL
+    }
+    for key, p1 in sorted(
+        named_params.items(),
+        key=lambda k_v: 1 if k_v[0] is matchers.KWARGS_SENTINEL else 0
+    ):
+        if key is matchers.KWARGS_SENTINEL:
+            if matchers.is_captor_kwargs_sentinel(p1):
+                rest_kwargs = {
+                    k: v
+                    for k, v in call_named_params.items()
+                    if k not in fixed_named_keys
+                }
+                if not p1.matches(rest_kwargs):
+                    return False
+            break
+
+        try:
+            p2 = call_named_params[key]
+        except KeyError:
+            return False
+
+        if not compare(p1, p2):
+            return False
+    else:
+        if len(named_params) != len(call_named_params):
+            return False
+
+    return True
+
+
+int_captor = captor(any_(int))
+
+POSITIONAL_PATTERNS = [
+    (),
+    (1,),
+    (1, 2),
+    (1.0,),
+    ("1",),
+    ((1, 2),),
+    (None,),
+    (True,),
+    (...,),
+    (1, ...),
+    (..., 2),
+    (..., ...),
+    (any_(),),
+    (any_(int),),
+    (any_(int), ...),
+    (eq(1), gt(1)),
+    (arg_that(lambda v: v == 2),),
+    (*ARGS,),
+    (1, *ARGS),
+    (..., *ARGS),
+    (*captor(),),
+    (1, *int_captor),
+    (float("nan"),),
+    ([1],),
+]
+
+KEYWORD_PATTERNS = [
+    {},
+    {"a": 1},
+    {"a": ...},
+    {"a": any_()},
+    {"a": 1, "b": 2},
+    {**KWARGS},
+    {"a": 1, **KWARGS},
+    {**captor()},
+    {"a": ..., **int_captor},
+]
+
+CALL_PARAMS = [
+    (),
+    (1,),
+    (2,),
+    (1, 2),
+    (1, 3),
+    (2, 2),
+    (1, 2, 3),
+    ("1",),
+    (1.0,),
+    (True,),
+    (None,),
+    ((1, 2),),
+    ([1],),
+    (float("nan"),),
+]
+
+CALL_NAMED_PARAMS = [
+    {},
+    {"a": 1},
+    {"a": 2},
+    {"b": 2},
+    {"a": 1, "b": 2},
+    {"a": "x", "c": 3},
+]
+
+
+@pytest.mark.parametrize("params", POSITIONAL_PATTERNS, ids=repr)
+def test_plans_agree_with_the_legacy_matcher(params):
+    for named_params in KEYWORD_PATTERNS:
+        plan = compile_plan(params, named_params)
+        for call_params, call_named_params in itertools.product(
+            CALL_PARAMS, CALL_NAMED_PARAMS
+        ):
+            expected = legacy_matches(
+                params, named_params, call_params, call_named_params
+            )
+            actual = plan.matches(call_params, call_named_params)
+            assert actual == expected, (
+                params, named_params, call_params, call_named_params
+            )
+
+
+@pytest.mark.parametrize("params", POSITIONAL_PATTERNS, ids=repr)
+def test_plans_agree_with_the_legacy_matcher_for_custom_compare(params):
+    def compare(p1, p2):
+        if isinstance(p1, (int, float)) and isinstance(p2, (int, float)):
+            return abs(p1 - p2) <= 1
+        return legacy_compare(p1, p2)
+
+    for named_params in KEYWORD_PATTERNS:
+        plan = compile_plan(params, named_params)
+        for call_params, call_named_params in itertools.product(
+            CALL_PARAMS, CALL_NAMED_PARAMS
+        ):
+            expected = legacy_matches(
+                params, named_params, call_params, call_named_params,
+                compare=compare,
+            )
+            actual = plan.matches(call_params, call_named_params, compare)
+            assert actual == expected, (
+                params, named_params, call_params, call_named_params
+            )
+
+
+@pytest.mark.parametrize("params", POSITIONAL_PATTERNS, ids=repr)
+def test_literal_keys_are_equal_exactly_for_matching_calls(params):
+    for named_params in KEYWORD_PATTERNS:
+        plan = compile_plan(params, named_params)
+        if plan.literal_key is None:
+            continue
+
+        for call_params, call_named_params in itertools.product(
+            CALL_PARAMS, CALL_NAMED_PARAMS
+        ):
+            key = call_key(call_params, call_named_params)
+            if key is None:
+                continue
+
+            assert (key == plan.literal_key) == plan.matches(
+                call_params, call_named_params
+            ), (params, named_params, call_params, call_named_params)
+
+
+@pytest.mark.parametrize("params, named_params", [
+    ((any_(),), {}),
+    ((1, ...), {}),
+    ((1, *ARGS), {}),
+    ((1,), {**KWARGS}),
+    ((1,), {"a": eq(1)}),
+    (([1],), {}),
+    ((matchers.call_captor(),), {}),
+])
+def test_only_plain_literal_stubs_have_a_literal_key(params, named_params):
+    assert compile_plan(params, named_params).literal_key is None
+
+
+def test_call_captor_accepts_everything():
+    plan = compile_plan((matchers.call_captor(),), {})
+    assert plan.matches((1, 2), {"a": 1})
+
+
+@pytest.mark.parametrize("value, expected", [
+    (1, True),
+    ("1", True),
+    (None, True),
+    ((1, ("a", b"b")), True),
+    (float("nan"), False),
+    ([1], False),
+    ((1, [1]), False),
+    (any_(), False),
+    (..., False),
+])
+def test_plain_literals(value, expected):
+    assert is_plain_literal(value) is expected
+
+
+class TestPlanShape:
+    def test_trailing_ellipsis_without_keywords_is_a_rest_marker(self):
+        plan = compile_plan((1, ...), {})
+        assert plan.fixed_params == (1,)
+        assert plan.literal_positional == (1,)
+
+    def test_trailing_ellipsis_with_keywords_is_a_fixed_position(self):
+        plan = compile_plan((1, ...), {"a": 1})
+        assert plan.fixed_params == (1, ...)
+        assert plan.literal_positional is None
+
+    def test_keywords_are_partitioned(self):
+        plan = compile_plan((), {"a": 1, **KWARGS})
+        assert plan.fixed_keys == frozenset({"a"})
+        assert plan.fixed_named_params == (("a", 1),)
@@ -1,3 +1,4 @@
+import pytest
 
 from mockito.mock_registry import IdentityMap
 
@@ -61,3 +62,51 @@ class TestIdentityMap:
         td[{"one", "two", "foo"}] = object()
         td[{"one", "two", "foo"}] = object()
         assert len(td.values()) == 2
+
+    def testLookupKeyForValue(self):
+        td = IdentityMap()
+        key = object()
+        val = object()
+        td[key] = val
+
+        assert td.lookup(val) is key
+        assert td.lookup(object(), 42) == 42
+
+    def testReplacedValueCannotBeLookedUpAnymore(self):
+        td = IdentityMap()
+        key = object()
+        mock1 = object()
+        mock2 = object()
+        td[key] = mock1
+        td[key] = mock2
+
+        assert td.lookup(mock1) is None
+        assert td.lookup(mock2) is key
+
+    def testReplaceKeepsInsertionOrder(self):
+        td = IdentityMap()
+        key1, key2 = object(), object()
+        val1, val2, val3 = object(), object(), object()
+        td[key1] = val1
+        td[key2] = val2
+        td[key1] = val3
+
+        assert td.values() == [val3, val2]
+
+    def testPopUnknownKeyRaises(self):
+        td = IdentityMap()
+        with pytest.raises(KeyError):
+            td.pop(object())
+        with pytest.raises(KeyError):
+            td.pop_value(object())
+
+    def testUnhashableKeys(self):
+        td = IdentityMap()
+        key = ["unhashable"]
+        val = object()
+        td[key] = val
+
+        assert td.get(key) is val
+        assert td.get(["unhashable"]) is None
+        assert td.pop_value(val) is val
+        assert len(td) == 0
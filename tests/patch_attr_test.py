@@ -225,3 +225,58 @@ def test_patch_attr_failed_apply_does_not_keep_target_alive():
 
     assert target_ref() is None
     assert replacement_ref() is None
+
+
+def test_patch_attr_restores_nested_patches_exited_out_of_order():
+    holder = Holder()
+
+    first = patch_attr(holder, "value", "first")
+    second = patch_attr(holder, "value", "second")
+    first.__enter__()
+    second.__enter__()
+
+    first.__exit__(None, None, None)
+    assert holder.value == "second"
+
+    second.__exit__(None, None, None)
+    assert holder.value == "original"
+
+
+def test_unstub_attribute_leaves_other_attributes_patched():
+    holder = Holder()
+    patch_attr(holder, "value", "patched")
+    patch_attr(holder, "other", "patched")
+
+    unstub(holder, "value")
+    assert holder.value == "original"
+    assert holder.other == "patched"
+
+    unstub(holder, "other")
+    assert not hasattr(holder, "other")
+
+
+def test_unstub_restores_only_the_patches_of_the_given_object():
+    holders = [Holder() for _ in range(100)]
+    for n, holder in enumerate(holders):
+        patch_attr(holder, "value", n)
+
+    unstub(holders[42])
+    assert holders[42].value == "original"
+    assert [holder.value for holder in holders[41:44:2]] == [41, 43]
+
+    unstub()
+    assert all(holder.value == "original" for holder in holders)
+
+
+def test_restored_patches_are_dropped_from_the_patcher():
+    from mockito.patching import patcher
+
+    holder = Holder()
+    with patch_attr(holder, "value", "first"):
+        with patch_attr(holder, "value", "second"):
+            pass
+
+    assert patcher._patches == {}
+    assert patcher._attr_stacks == {}
+    assert patcher._by_target == {}
+    assert patcher._restore_infos == {}
@@ -154,3 +154,63 @@ def test_patch_dict_failed_apply_does_not_keep_target_alive():
     gc.collect()
 
     assert target_ref() is None
+
+
+def large_mapping():
+    return {"key%d" % n: n for n in range(2000)}
+
+
+def test_patch_dict_restores_touched_keys_of_large_mappings():
+    registry = large_mapping()
+    original = dict(registry)
+
+    with patch_dict(registry, {"key1": "patched", "new": "added"},
+                    remove=["key2", "absent"]):
+        assert registry["key1"] == "patched"
+        assert registry["new"] == "added"
+        assert "key2" not in registry
+
+    assert registry == original
+
+
+def test_patch_dict_keeps_unrelated_changes_of_large_mappings():
+    registry = large_mapping()
+
+    with patch_dict(registry, {"key1": "patched"}):
+        registry["key3"] = "changed"
+
+    assert registry["key1"] == 1
+    assert registry["key3"] == "changed"
+
+
+def test_patch_dict_clear_restores_snapshot_of_large_mappings():
+    registry = large_mapping()
+    original = dict(registry)
+
+    with patch_dict(registry, {"key1": "patched"}, clear=True):
+        assert registry == {"key1": "patched"}
+        registry["new"] = "added"
+
+    assert registry == original
+
+
+def test_patch_dict_nested_patches_of_large_mappings_restore_in_lifo_order():
+    registry = large_mapping()
+
+    with patch_dict(registry, {"key1": "first"}):
+        with patch_dict(registry, {"key1": "second"}, remove=["key2"]):
+            assert registry["key1"] == "second"
+
+        assert registry["key1"] == "first"
+        assert registry["key2"] == 2
+
+    assert registry["key1"] == 1
+
+
+def test_patch_dict_failed_apply_rolls_back_touched_keys_of_large_mappings():
+    target = PartiallyFailingMapping(large_mapping())
+
+    with pytest.raises(RuntimeError):
+        patch_dict(target, [("key1", "patched"), ("bad", "value")])
+
+    assert dict(target.items()) == large_mapping()
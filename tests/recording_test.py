@@ -0,0 +1,392 @@
+import pytest
+
+from mockito import (
+    ArgumentError,
+    InOrder,
+    VerificationError,
+    captor,
+    ensureNoUnverifiedInteractions,
+    expect,
+    forget_invocations,
+    mock,
+    set_recording,
+    unstub,
+    verify,
+    verifyExpectedInteractions,
+    verifyZeroInteractions,
+    when,
+)
+from mockito.mock_registry import mock_registry
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+def recorded(obj):
+    return list(mock_registry.mock_for(obj).invocations)
+
+
+class TestFullRecording:
+    def test_is_the_default(self):
+        m = mock()
+        m.foo(1)
+        m.foo(1)
+
+        assert len(recorded(m)) == 2
+
+    def test_can_be_restored(self):
+        m = mock()
+        set_recording(m, policy=1)
+        set_recording(m, policy='full')
+        m.foo(1)
+        m.foo(2)
+
+        verify(m).foo(1)
+        verify(m).foo(2)
+
+
+class TestRingBuffer:
+    def test_keeps_the_last_n_invocations(self):
+        m = mock()
+        set_recording(m, policy=2)
+        for i in range(5):
+            m.foo(i)
+
+        assert [i.params for i in recorded(m)] == [(3,), (4,)]
+        verify(m).foo(4)
+
+    def test_explains_dropped_invocations_on_failure(self):
+        m = mock()
+        set_recording(m, policy=2)
+        for i in range(5):
+            m.foo(0)
+
+        with pytest.raises(VerificationError) as exc:
+            verify(m, times=5).foo(0)
+
+        message = str(exc.value)
+        assert "actual times: 2" in message
+        assert "Only the last 2 invocations are recorded" in message
+        assert "3 older ones were dropped" in message
+
+    def test_does_not_explain_if_nothing_was_dropped(self):
+        m = mock()
+        set_recording(m, policy=2)
+        m.foo(0)
+
+        with pytest.raises(VerificationError) as exc:
+            verify(m, times=2).foo(0)
+
+        assert "Note" not in str(exc.value)
+
+    def test_forget_invocations_resets_the_buffer(self):
+        m = mock()
+        set_recording(m, policy=2)
+        for i in range(5):
+            m.foo(i)
+        forget_invocations(m)
+
+        verifyZeroInteractions(m)
+
+
+class TestCountsOnly:
+    def test_counts_equal_calls(self):
+        m = mock()
+        set_recording(m, policy='counts')
+        for _ in range(1000):
+            m.foo(1, a='x')
+            m.foo([1])
+        m.foo(2)
+
+        assert len(recorded(m)) == 3
+        verify(m, times=1000).foo(1, a='x')
+        verify(m, times=1000).foo([1])
+        verify(m, times=2001).foo(...)
+
+    def test_counts_per_method(self):
+        m = mock()
+        set_recording(m, policy='counts')
+        m.foo(1)
+        m.bar(1)
+        m.foo(1)
+
+        verify(m, times=2).foo(1)
+        verify(m, times=1).bar(1)
+
+    def test_lists_counts_in_error_messages(self):
+        m = mock()
+        set_recording(m, policy='counts')
+        m.foo(1)
+        m.foo(1)
+
+        with pytest.raises(VerificationError) as exc:
+            verify(m).foo(2)
+
+        message = str(exc.value)
+        assert "foo(1)  (2 times)" in message
+        assert "only counts its invocations" in message
+
+    def test_new_equal_calls_are_unverified(self):
+        m = mock()
+        set_recording(m, policy='counts')
+        m.foo(1)
+        verify(m).foo(1)
+        ensureNoUnverifiedInteractions(m)
+
+        m.foo(1)
+        with pytest.raises(VerificationError) as exc:
+            ensureNoUnverifiedInteractions(m)
+        assert "Unwanted interaction: foo(1)" in str(exc.value)
+
+    def test_captors_see_each_distinct_call_once(self):
+        m = mock()
+        set_recording(m, policy='counts')
+        m.foo(1)
+        m.foo(1)
+        m.foo(2)
+
+        arg = captor()
+        verify(m, times=3).foo(arg)
+        assert arg.all_values == [1, 2]
+
+    def test_cannot_verify_in_order(self):
+        m = mock()
+        set_recording(m, policy='counts')
+        m.foo(1)
+
+        with pytest.raises(VerificationError) as exc:
+            verify(m, inorder=True).foo(1)
+        assert "does not keep the order" in str(exc.value)
+
+
+class TestOff:
+    def test_records_nothing(self):
+        m = mock()
+        set_recording(m, policy='off')
+        m.foo(1)
+
+        assert recorded(m) == []
+
+    def test_verifying_raises(self):
+        m = mock()
+        set_recording(m, policy='off')
+        m.foo(1)
+
+        with pytest.raises(VerificationError) as exc:
+            verify(m, times=0).foo(1)
+        assert "Cannot verify: invocation recording is off" in str(exc.value)
+        assert "1 calls went unrecorded" in str(exc.value)
+
+        with pytest.raises(VerificationError):
+            ensureNoUnverifiedInteractions(m)
+        with pytest.raises(VerificationError):
+            verifyZeroInteractions(m)
+
+    def test_stubs_and_expectations_still_work(self):
+        cat = mock()
+        expect(cat, times=2).meow().thenReturn('Miau')
+        set_recording(cat, policy='off')
+
+        assert cat.meow() == 'Miau'
+        assert cat.meow() == 'Miau'
+        verifyExpectedInteractions(cat)
+
+
+class TestSetRecording:
+    @pytest.mark.parametrize('policy', ['all', 0, -1, 1.5, None])
+    def test_rejects_unknown_policies(self, policy):
+        m = mock()
+        with pytest.raises(ArgumentError):
+            set_recording(m, policy=policy)
+
+    def test_requires_a_registered_obj(self):
+        with pytest.raises(ArgumentError):
+            set_recording(object(), policy='off')
+
+    def test_forgets_the_invocations_so_far(self):
+        m = mock()
+        m.foo(1)
+        set_recording(m, policy='counts')
+
+        verifyZeroInteractions(m)
+
+    def test_survives_unstubbing_a_method(self):
+        class Dog:
+            def bark(self, sound):
+                pass
+
+            def wag(self):
+                pass
+
+        rex = Dog()
+        when(rex).bark('Wuff')
+        when(rex).wag()
+        set_recording(rex, policy='counts')
+        rex.bark('Wuff')
+        rex.wag()
+        rex.wag()
+        unstub(rex.bark)
+
+        assert mock_registry.mock_for(rex).recorder.policy == 'counts'
+        verify(rex, times=2).wag()
+        verify(rex, times=0).bark(...)
+
+
+class AlwaysEqual:
+    def __eq__(self, other):
+        return True
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class TestVerifyIndex:
+    def test_counts_literal_calls(self):
+        m = mock()
+        for i in range(10):
+            m.foo(i % 2, a='x')
+        m.foo(0)
+        m.bar(0, a='x')
+
+        verify(m, times=5).foo(0, a='x')
+        verify(m, times=5).foo(1, a='x')
+        verify(m, times=1).foo(0)
+        verify(m, times=0).foo(2, a='x')
+
+    def test_counts_unhashable_calls_equal_to_the_literal(self):
+        m = mock()
+        m.foo(1)
+        m.foo(AlwaysEqual())
+        m.foo([1])
+
+        verify(m, times=2).foo(1)
+
+    def test_indexes_calls_made_after_a_verification(self):
+        m = mock()
+        m.foo(1)
+        verify(m).foo(1)
+        m.foo(1)
+
+        verify(m, times=2).foo(1)
+
+    def test_indexes_calls_made_while_indexing(self):
+        m = mock()
+        m.foo(1)
+        m.foo(2)
+        recorder = mock_registry.mock_for(m).recorder
+        late = recorder.invocations.pop()
+
+        class AppendingMeanwhile(list):
+            # As if another thread calls while we index the first call
+            def __getitem__(self, index):
+                if len(self) == 1:
+                    self.append(late)
+                return super().__getitem__(index)
+
+        recorder.invocations = AppendingMeanwhile(recorder.invocations)
+        verify(m).foo(1)
+        verify(m).foo(2)
+
+    def test_marks_counted_calls_as_verified(self):
+        m = mock()
+        m.foo(1)
+        m.foo(1)
+        verify(m, times=2).foo(1)
+        ensureNoUnverifiedInteractions(m)
+
+        m.foo(1)
+        with pytest.raises(VerificationError):
+            ensureNoUnverifiedInteractions(m)
+        verify(m, times=3).foo(1)
+        ensureNoUnverifiedInteractions(m)
+
+    def test_does_not_mark_calls_on_failure(self):
+        m = mock()
+        m.foo(1)
+        with pytest.raises(VerificationError):
+            verify(m, times=2).foo(1)
+
+        with pytest.raises(VerificationError):
+            ensureNoUnverifiedInteractions(m)
+
+    def test_forgets_unstubbed_methods(self):
+        class Dog:
+            def bark(self, sound):
+                pass
+
+        rex = Dog()
+        when(rex).bark('Wuff')
+        rex.bark('Wuff')
+        verify(rex).bark('Wuff')
+        unstub(rex.bark)
+
+        when(rex).bark('Wuff')
+        verify(rex, times=0).bark('Wuff')
+        rex.bark('Wuff')
+        verify(rex, times=1).bark('Wuff')
+
+    def test_forget_invocations_resets_the_index(self):
+        m = mock()
+        m.foo(1)
+        verify(m).foo(1)
+        forget_invocations(m)
+
+        verify(m, times=0).foo(1)
+
+
+class TestUnverifiedInvocations:
+    def test_reports_the_first_unverified_call(self):
+        m = mock()
+        m.foo(1)
+        m.bar(2)
+        m.foo(3)
+        verify(m).foo(1)
+
+        with pytest.raises(VerificationError) as exc:
+            ensureNoUnverifiedInteractions(m)
+        assert "Unwanted interaction: bar(2)" in str(exc.value)
+
+    def test_tracks_calls_verified_in_between(self):
+        m = mock()
+        m.foo(1)
+        with pytest.raises(VerificationError):
+            ensureNoUnverifiedInteractions(m)
+
+        m.bar(2)
+        verify(m).foo(1)
+        verify(m).bar(2)
+        ensureNoUnverifiedInteractions(m)
+
+    def test_counts_calls_answered_by_expectations_as_verified(self):
+        m = mock()
+        expect(m, times=1).foo(1).thenReturn('x')
+        m.foo(1)
+
+        ensureNoUnverifiedInteractions(m)
+
+    def test_sees_calls_verified_in_order(self):
+        m = mock()
+        with InOrder(m) as in_order:
+            m.foo(1)
+            m.bar(2)
+            verify(m).foo(1)
+            with pytest.raises(VerificationError):
+                ensureNoUnverifiedInteractions(m)
+
+            in_order.verify(m).foo(1)
+            in_order.verify(m).bar(2)
+        ensureNoUnverifiedInteractions(m)
+
+        m.bar(3)
+        with pytest.raises(VerificationError) as exc:
+            ensureNoUnverifiedInteractions(m)
+        assert "Unwanted interaction: bar(3)" in str(exc.value)
+
+    def test_restarts_after_forget_invocations(self):
+        m = mock()
+        m.foo(1)
+        forget_invocations(m)
+        ensureNoUnverifiedInteractions(m)
+
+        m.foo(1)
+        with pytest.raises(VerificationError):
+            ensureNoUnverifiedInteractions(m)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+import itertools
 
 from mockito import and_, any as any_, arg_that, call_captor, captor, eq, gt, neq, or_
 from mockito import sameish
@@ -215,3 +216,70 @@ def test_eq_failures_fallback_to_identity():
         bar(first),
         bar(second),
     )
+
+
+class Opaque:
+    def __eq__(self, other):
+        return True
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _predicate(value):
+    raise RuntimeError("must not be executed")
+
+
+_captor = captor()
+_sentinel = object()
+
+FINGERPRINT_CASES = [
+    bar(),
+    bar(1, "x"),
+    bar(2, "x"),
+    bar(1.0, "x"),
+    bar(True, "x"),
+    bar(a=1, b=2),
+    bar(b=2, a=1),
+    bar(a=1),
+    bar(...),
+    bar(1, ...),
+    bar(_sentinel),
+    bar(object()),
+    bar(any_()),
+    bar(any_(int)),
+    bar(any_((int, str))),
+    bar(eq(1)),
+    bar(neq(1)),
+    bar(gt(1)),
+    bar(gt(2)),
+    bar(and_(any_(int), gt(1))),
+    bar(or_(any_(int), gt(1))),
+    bar(arg_that(_predicate)),
+    bar(call_captor()),
+    bar(call_captor()),
+    bar(_captor),
+    bar(captor(any_(int))),
+    bar(1, *_captor),
+    bar(1, *captor(any_(int))),
+    bar(1, **_captor),
+    bar(1, **captor()),
+]
+
+
+def test_fingerprints_are_equal_for_exactly_the_sameish_invocations():
+    for left, right in itertools.product(FINGERPRINT_CASES, repeat=2):
+        left_fingerprint = sameish.fingerprint(left)
+        right_fingerprint = sameish.fingerprint(right)
+        assert left_fingerprint is not None
+        assert right_fingerprint is not None
+
+        assert (left_fingerprint == right_fingerprint) == (
+            sameish.invocations_are_sameish(left, right)
+        ), (left, right)
+
+
+def test_invocations_with_opaque_values_have_no_fingerprint():
+    assert sameish.fingerprint(bar(Opaque())) is None
+    assert sameish.fingerprint(bar(a=[1])) is None
+    assert sameish.fingerprint(bar(eq(Opaque()))) is None
+    assert sameish.fingerprint(bar(any_((int, (str,))))) is None
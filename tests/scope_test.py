@@ -0,0 +1,308 @@
+import asyncio
+import contextvars
+import os.path
+import threading
+
+import pytest
+
+from mockito import (
+    ArgumentError,
+    mock,
+    scope,
+    unstub,
+    verify,
+    verifyStubbedInvocationsAreUsed,
+    when,
+)
+from mockito.invocation import InvocationError
+from mockito.mock_registry import mock_registry
+from mockito.verification import VerificationError
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+class Dog:
+    def bark(self, sound='Wuff'):
+        return sound
+
+    @staticmethod
+    def sleep(hours):
+        return 'zzz %s' % hours
+
+    @classmethod
+    def create(cls):
+        return 'real'
+
+    @property
+    def age(self):
+        return 12
+
+
+ORIGINAL_BARK = Dog.__dict__['bark']
+
+
+def in_thread(fn):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(fn()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+class TestStubsInAScope:
+    def test_are_seen_within_the_scope(self):
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            assert Dog().bark() == 'Miau'
+
+    def test_are_not_seen_by_other_threads(self):
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            assert in_thread(lambda: Dog().bark()) == 'Wuff'
+
+    def test_are_seen_by_contexts_copied_from_the_scope(self):
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            context = contextvars.copy_context()
+            assert in_thread(
+                lambda: context.run(lambda: Dog().bark())
+            ) == 'Miau'
+
+    def test_are_gone_after_the_scope(self):
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+        assert Dog().bark() == 'Wuff'
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+    def test_do_not_see_calls_from_outside(self):
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            in_thread(lambda: Dog().bark())
+            verify(Dog, times=0).bark()
+
+    def test_work_for_static_and_class_methods(self):
+        with scope():
+            when(Dog).sleep(2).thenReturn('awake')
+            when(Dog).create().thenReturn('fake')
+            assert Dog.sleep(2) == 'awake'
+            assert Dog().create() == 'fake'
+            assert in_thread(lambda: Dog.sleep(2)) == 'zzz 2'
+            assert in_thread(lambda: Dog.create()) == 'real'
+
+    def test_work_for_properties(self):
+        with scope():
+            when(Dog).age.thenReturn(3)
+            assert Dog().age == 3
+            assert in_thread(lambda: Dog().age) == 12
+        assert Dog().age == 12
+
+    def test_work_for_module_functions(self):
+        with scope():
+            when(os.path).exists('/nowhere').thenReturn(True)
+            assert os.path.exists('/nowhere')
+            assert not in_thread(lambda: os.path.exists('/nowhere'))
+        assert not os.path.exists('/nowhere')
+
+    def test_keep_the_signature_checks(self):
+        with scope():
+            when(Dog).bark('Miau').thenReturn('Miau')
+            with pytest.raises(TypeError):
+                Dog().bark('Miau', 'Wuff')
+            with pytest.raises(TypeError):
+                when(Dog).bark('Miau', 'Wuff')
+
+    def test_can_call_the_original_implementation(self):
+        with scope():
+            when(Dog).bark('Miau').thenReturn('Miau')
+            with scope():
+                when(Dog).sleep(...).thenCallOriginalImplementation()
+                when(Dog).bark(...).thenCallOriginalImplementation()
+                assert Dog.sleep(1) == 'zzz 1'
+                assert Dog().bark('Tock') == 'Tock'
+
+
+class TestScopesRunConcurrently:
+    def test_threads_see_their_own_stubs(self):
+        threads = 8
+        barrier = threading.Barrier(threads)
+        results = {}
+
+        def run(n):
+            with scope():
+                when(Dog).bark().thenReturn(n)
+                barrier.wait()
+                results[n] = [Dog().bark() for _ in range(100)]
+                barrier.wait()
+                verify(Dog, times=100).bark()
+
+        workers = [
+            threading.Thread(target=run, args=(n,)) for n in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert results == {n: [n] * 100 for n in range(threads)}
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+    def test_tasks_see_their_own_stubs(self):
+        async def test(sound):
+            with scope():
+                when(Dog).bark().thenReturn(sound)
+                await asyncio.sleep(0.01)
+                assert Dog().bark() == sound
+                await asyncio.sleep(0.01)
+                verify(Dog).bark()
+
+        async def main():
+            await asyncio.gather(test('Miau'), test('Muh'), test('Mäh'))
+
+        asyncio.run(main())
+        assert Dog().bark() == 'Wuff'
+
+
+class TestNestedScopes:
+    def test_inner_scope_sees_the_outer_stubs(self):
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            with scope():
+                assert Dog().bark() == 'Miau'
+
+    def test_inner_stubs_win_until_the_inner_scope_ends(self):
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            with scope():
+                when(Dog).bark().thenReturn('Muh')
+                assert Dog().bark() == 'Muh'
+            assert Dog().bark() == 'Miau'
+
+
+class TestFallThrough:
+    def test_scope_sees_global_stubs_for_other_arguments(self):
+        when(Dog).bark('global').thenReturn('Wuff!')
+        with scope():
+            when(Dog).bark('scope').thenReturn('Miau')
+            assert Dog().bark('global') == 'Wuff!'
+            assert Dog().bark('scope') == 'Miau'
+        assert Dog().bark('global') == 'Wuff!'
+
+    def test_inner_scope_sees_all_outer_stubs_for_other_arguments(self):
+        when(Dog).bark('global').thenReturn('Wuff!')
+        with scope():
+            when(Dog).bark('outer').thenReturn('Miau')
+            with scope():
+                when(Dog).bark('inner').thenReturn('Muh')
+                assert Dog().bark('global') == 'Wuff!'
+                assert Dog().bark('outer') == 'Miau'
+                assert Dog().bark('inner') == 'Muh'
+
+    def test_the_nearest_stub_wins(self):
+        when(Dog).bark(...).thenReturn('global')
+        with scope():
+            when(Dog).bark(...).thenReturn('outer')
+            with scope():
+                when(Dog).bark('inner').thenReturn('inner')
+                assert Dog().bark('inner') == 'inner'
+                assert Dog().bark('other') == 'outer'
+
+    def test_unexpected_calls_list_the_stubs_of_all_levels(self):
+        when(Dog).bark('global').thenReturn('Wuff!')
+        with scope():
+            when(Dog).bark('scope').thenReturn('Miau')
+            with pytest.raises(InvocationError) as exc:
+                Dog().bark('other')
+        assert "bark('global')\n    bark('scope')" in str(exc.value)
+
+    def test_the_answering_mock_remembers_the_call(self):
+        when(Dog).bark('global').thenReturn('Wuff!')
+        with scope():
+            when(Dog).bark('scope').thenReturn('Miau')
+            Dog().bark('global')
+            verify(Dog).bark('global')
+        verify(Dog).bark('global')
+        verifyStubbedInvocationsAreUsed()
+
+
+class TestTeardown:
+    def test_only_unstubs_the_scope(self):
+        when(Dog).sleep(...).thenReturn('global')
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+        assert Dog.sleep(1) == 'global'
+
+    def test_unstub_within_a_scope_keeps_the_global_stubs(self):
+        when(Dog).sleep(...).thenReturn('global')
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            unstub()
+            assert Dog().bark() == 'Wuff'
+            assert Dog.sleep(1) == 'global'
+
+    def test_global_stubs_are_seen_within_scopes(self):
+        when(Dog).bark().thenReturn('global')
+        with scope():
+            assert Dog().bark() == 'global'
+            when(Dog).bark().thenReturn('Miau')
+            assert Dog().bark() == 'Miau'
+        assert Dog().bark() == 'global'
+        unstub()
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+    def test_unstubs_mocks_of_the_scope(self):
+        with scope():
+            cat = mock()
+            when(cat).meow().thenReturn('Miau')
+            assert mock_registry.mock_for(cat) is not None
+        assert mock_registry.mock_for(cat) is None
+
+    def test_checks_only_look_at_the_scope(self):
+        when(Dog).sleep(...).thenReturn('unused')
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            Dog().bark()
+            verifyStubbedInvocationsAreUsed()
+
+    def test_forgets_the_mocks_of_the_scope(self):
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            Dog().bark()
+        with pytest.raises(ArgumentError):
+            verify(Dog).bark()
+
+    def test_verify_sees_only_the_calls_of_the_scope(self):
+        when(Dog).bark().thenReturn('global')
+        Dog().bark()
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            Dog().bark()
+            Dog().bark()
+            verify(Dog, times=2).bark()
+        verify(Dog, times=1).bark()
+
+    def test_unused_scopes_raise_as_usual(self):
+        with pytest.raises(VerificationError):
+            with scope():
+                when(Dog).bark().thenReturn('Miau')
+                verify(Dog).bark()
+        assert Dog().bark() == 'Wuff'
+
+    def test_global_unstub_leaves_running_scopes_alone(self):
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            in_thread(unstub)
+            assert Dog().bark() == 'Miau'
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+    def test_global_stubs_may_come_and_go_while_scopes_run(self):
+        with scope():
+            when(Dog).bark().thenReturn('Miau')
+            in_thread(lambda: when(Dog).sleep(...).thenReturn('global'))
+            in_thread(lambda: when(Dog).bark('Wuff').thenReturn('global'))
+            assert Dog.sleep(1) == 'global'
+            in_thread(unstub)
+            assert Dog.sleep(1) == 'zzz 1'
+            assert Dog().bark() == 'Miau'
+            assert in_thread(lambda: Dog().bark()) == 'Wuff'
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
@@ -0,0 +1,209 @@
+import gc
+import os.path
+import threading
+import warnings
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+from mockito import (
+    MockitoSession,
+    expect,
+    mock,
+    patch_attr,
+    patch_dict,
+    scope,
+    unstub,
+    when,
+)
+from mockito import pytest_plugin
+from mockito.mock_registry import mock_registry
+from mockito.session import LeakWarning
+from mockito.verification import VerificationError
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+class Dog:
+    sound = 'Wuff'
+
+    def bark(self):
+        return 'Wuff'
+
+
+ORIGINAL_BARK = Dog.__dict__['bark']
+SETTINGS: dict = {}
+
+
+@pytest.fixture
+def no_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        yield
+
+
+@pytest.mark.usefixtures("no_warnings")
+class TestTeardown:
+    def test_unstubs_the_mocks_of_the_session(self):
+        with MockitoSession():
+            when(Dog).bark().thenReturn('Miau')
+            cat = mock()
+            when(cat).meow().thenReturn('Miau')
+            Dog().bark()
+            cat.meow()
+
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+        assert mock_registry.mock_for(Dog) is None
+        assert mock_registry.mock_for(cat) is None
+
+    def test_restores_the_patches_of_the_session(self):
+        with MockitoSession():
+            patch_attr(Dog, 'sound', 'Miau')
+            patch_dict(SETTINGS, debug=True)
+
+        assert Dog.sound == 'Wuff'
+        assert SETTINGS == {}
+
+    def test_unstubs_even_if_the_block_raises(self):
+        with pytest.raises(RuntimeError):
+            with MockitoSession():
+                when(Dog).bark().thenReturn('Miau')
+                raise RuntimeError()
+
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+    def test_records_mocks_made_in_other_threads(self):
+        with MockitoSession():
+            thread = threading.Thread(
+                target=lambda: when(os.path).exists('/foo').thenReturn(True)
+            )
+            thread.start()
+            thread.join()
+            assert os.path.exists('/foo')
+
+        assert not os.path.exists('/foo')
+
+    def test_copes_with_mocks_unstubbed_within_the_session(self):
+        with MockitoSession() as session:
+            when(Dog).bark().thenReturn('Miau')
+            unstub(Dog)
+            assert session.mocks == []
+            when(Dog).bark().thenReturn('Muh')
+            Dog().bark()
+
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+    def test_leaves_the_mocks_of_a_scope_to_the_scope(self):
+        with MockitoSession() as session:
+            with scope():
+                when(Dog).bark().thenReturn('Miau')
+                assert session.mocks == []
+            when(os.path).exists('/foo').thenReturn(True)
+            os.path.exists('/foo')
+            assert len(session.mocks) == 1
+
+    def test_can_be_started_and_finished_explicitly(self):
+        session = MockitoSession().start()
+        when(Dog).bark().thenReturn('Miau')
+        session.finish(check=False)
+        session.finish()
+
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+    def test_is_not_kept_alive_if_never_finished(self):
+        session = MockitoSession().start()
+        ref = weakref.ref(session)
+        del session
+        gc.collect()
+        assert ref() is None
+
+        when(Dog).bark().thenReturn('Miau')
+        patch_attr(Dog, 'sound', 'Miau')
+
+    def test_cannot_be_started_twice(self):
+        with MockitoSession() as session:
+            with pytest.raises(RuntimeError):
+                session.start()
+
+
+@pytest.mark.usefixtures("no_warnings")
+class TestChecks:
+    def test_fail_on_unused_stubs(self):
+        with pytest.raises(VerificationError):
+            with MockitoSession():
+                when(Dog).bark().thenReturn('Miau')
+
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+    def test_fail_on_unmet_expectations(self):
+        with pytest.raises(VerificationError):
+            with MockitoSession():
+                expect(Dog, times=2).bark().thenReturn('Miau')
+                Dog().bark()
+
+    def test_are_skipped_when_the_block_raises(self):
+        with pytest.raises(RuntimeError):
+            with MockitoSession():
+                when(Dog).bark().thenReturn('Miau')
+                raise RuntimeError()
+
+    def test_can_be_skipped(self):
+        session = MockitoSession().start()
+        when(Dog).bark().thenReturn('Miau')
+        session.finish(check=False)
+
+    def test_only_look_at_the_mocks_of_the_session(self):
+        when(os.path).exists('/foo').thenReturn(True)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', LeakWarning)
+            with MockitoSession():
+                when(Dog).bark().thenReturn('Miau')
+                Dog().bark()
+
+
+class TestLeaks:
+    def test_are_reported(self):
+        when(os.path).exists('/foo').thenReturn(True)
+        patch_attr(Dog, 'sound', 'Miau')
+
+        with pytest.warns(LeakWarning) as record:
+            with MockitoSession():
+                pass
+
+        message = str(record[0].message)
+        assert "1 mock(s) and patches" in message
+        assert "posixpath" in message or "ntpath" in message
+        assert ".sound" in message
+
+    def test_are_left_alone(self):
+        when(os.path).exists('/foo').thenReturn(True)
+        with pytest.warns(LeakWarning):
+            with MockitoSession():
+                pass
+        assert os.path.exists('/foo')
+
+    @pytest.mark.usefixtures("no_warnings")
+    def test_include_nothing_made_within_the_session(self):
+        with MockitoSession():
+            when(os.path).exists('/foo').thenReturn(True)
+            os.path.exists('/foo')
+
+
+class TestFixture:
+    def test_yields_an_active_session(self, mockito_session):
+        cat = mock()
+        when(cat).meow().thenReturn('Miau')
+        assert mockito_session.mocks == [mock_registry.mock_for(cat)]
+        cat.meow()
+
+    @pytest.mark.parametrize('when', ['setup', 'call'])
+    def test_remembers_failures(self, when):
+        item = SimpleNamespace(stash=pytest.Stash())
+        report = SimpleNamespace(when=when, failed=True)
+        hook = pytest_plugin.pytest_runtest_makereport(item, None)
+        next(hook)
+        with pytest.raises(StopIteration):
+            hook.send(SimpleNamespace(get_result=lambda: report))
+        assert item.stash[pytest_plugin._test_failed]
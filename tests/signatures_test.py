@@ -1,7 +1,9 @@
 
+import gc
+
 import pytest
 
-from mockito import when, args, kwargs, unstub
+from mockito import when, args, kwargs, signature, unstub
 
 from collections import namedtuple
 
@@ -457,3 +459,80 @@ class TestSignatures:
             finally:  # just to be sure
                 unstub()
 
+
+
+class TestSignatureCache:
+
+    def testInstancesOfTheSameClassShareSignatures(self):
+        signature.cache_clear()
+        try:
+            for _ in range(3):
+                when(SUT()).two_args(1, 2).thenReturn('stub')
+
+            info = signature.cache_info()
+            assert (info.hits, info.misses) == (2, 1)
+        finally:
+            unstub()
+
+    def testClassAndInstanceUseDistinctEntries(self):
+        signature.cache_clear()
+        try:
+            when(SUT).one_arg(1).thenReturn('stub')
+            when(SUT()).one_arg(1).thenReturn('stub')
+
+            assert signature.cache_info().misses == 2
+        finally:
+            unstub()
+
+    def testSignaturesOfCollectedClassesAreDropped(self):
+        signature.cache_clear()
+
+        class Ephemeral(object):
+            def method(self, a):
+                pass
+
+        assert signature.get_signature(Ephemeral(), 'method') is not None
+        assert signature.cache_info().currsize == 1
+
+        del Ephemeral
+        gc.collect()
+        assert signature.cache_info().currsize == 0
+
+
+class TestValidStubShapes:
+
+    def testValuesDoNotMatterForTheShape(self):
+        assert (
+            signature.stub_shape((1, 'a'), {'b': 2})
+            == signature.stub_shape((None, any), {'b': object()})
+        )
+
+    def testPlaceholdersMatterForTheShape(self):
+        shapes = {
+            signature.stub_shape((1, 2), {}),
+            signature.stub_shape((1, Ellipsis), {}),
+            signature.stub_shape((1, *args), {}),
+            signature.stub_shape((1,), {**kwargs}),
+            signature.stub_shape((1,), {'b': 2}),
+        }
+        assert len(shapes) == 5
+
+    def testValidShapesAreRemembered(self):
+        sig = signature.get_signature(SUT, 'two_args_wt_default')
+        binder = signature.binder_for(sig)
+        binder.valid_stub_shapes.clear()
+
+        signature.match_signature_allowing_placeholders(sig, (1,), {'b': 2})
+        signature.match_signature_allowing_placeholders(sig, (3,), {'b': 4})
+        assert binder.valid_stub_shapes == {((0,), ('b',))}
+
+    def testInvalidShapesRaiseEveryTime(self):
+        sig = signature.get_signature(SUT, 'one_arg')
+        for _ in range(2):
+            with pytest.raises(TypeError):
+                signature.match_signature_allowing_placeholders(
+                    sig, (1, 2), {})
+        assert (
+            signature.stub_shape((1, 2), {})
+            not in signature.binder_for(sig).valid_stub_shapes
+        )
@@ -0,0 +1,226 @@
+import asyncio
+import os.path
+
+import pytest
+
+from mockito import (
+    ArgumentError,
+    StubTemplate,
+    captor,
+    expect,
+    mock,
+    scope,
+    snapshot,
+    unstub,
+    verify,
+    verifyExpectedInteractions,
+    verifyStubbedInvocationsAreUsed,
+    when,
+)
+from mockito.invocation import InvocationError
+from mockito.mock_registry import mock_registry
+from mockito.verification import VerificationError
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+class Dog:
+    def bark(self, sound='Wuff'):
+        return sound
+
+    @staticmethod
+    def sleep(hours):
+        return 'zzz %s' % hours
+
+    @property
+    def age(self):
+        return 12
+
+    async def fetch(self, thing):
+        return thing
+
+
+ORIGINAL_BARK = Dog.__dict__['bark']
+
+
+def take(fn):
+    fn()
+    template = snapshot()
+    unstub()
+    return template
+
+
+class TestApply:
+    def test_stubs_again(self):
+        template = take(lambda: (
+            when(Dog).bark('Miau').thenReturn('Miau'),
+            when(os.path).exists('/foo').thenReturn(True),
+        ))
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+        template.apply()
+        assert Dog().bark('Miau') == 'Miau'
+        assert os.path.exists('/foo')
+
+    def test_can_be_applied_many_times(self):
+        template = take(lambda: when(Dog).bark().thenReturn('Miau', 'Muh'))
+
+        for _ in range(3):
+            template.apply()
+            assert Dog().bark() == 'Miau'
+            assert Dog().bark() == 'Muh'
+            unstub()
+
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+    def test_keeps_the_order_of_the_stubs(self):
+        template = take(lambda: (
+            when(Dog).bark(...).thenReturn('any'),
+            when(Dog).bark('Miau').thenReturn('Miau'),
+        ))
+
+        template.apply()
+        assert Dog().bark('Miau') == 'Miau'
+        assert Dog().bark('Muh') == 'any'
+
+    def test_adds_to_existing_stubs(self):
+        template = take(lambda: when(Dog).bark('Miau').thenReturn('Miau'))
+
+        when(Dog).bark('Muh').thenReturn('Muh')
+        template.apply()
+        assert Dog().bark('Miau') == 'Miau'
+        assert Dog().bark('Muh') == 'Muh'
+
+    def test_keeps_the_call_semantics(self):
+        template = take(lambda: (
+            when(Dog).sleep(2).thenReturn('awake'),
+            when(Dog).bark('Miau').thenRaise(ValueError),
+        ))
+
+        template.apply()
+        assert Dog.sleep(2) == 'awake'
+        with pytest.raises(ValueError):
+            Dog().bark('Miau')
+        with pytest.raises(TypeError):
+            Dog().bark('Miau', 'Muh')
+
+    def test_restores_properties(self):
+        template = take(
+            lambda: when(Dog).age.thenReturn(3).thenCallOriginalImplementation()
+        )
+
+        template.apply()
+        dog = Dog()
+        assert (dog.age, dog.age) == (3, 12)
+
+    def test_restores_coroutines(self):
+        template = take(lambda: when(Dog).fetch('ball').thenReturn('stick'))
+
+        template.apply()
+        assert asyncio.run(Dog().fetch('ball')) == 'stick'
+
+    def test_restores_chains(self):
+        template = take(lambda: (
+            when(Dog).bark('Miau').sleep(1).thenReturn('zzz'),
+            when(Dog).bark('Miau').age.thenReturn(3),
+        ))
+
+        template.apply()
+        assert Dog().bark('Miau').sleep(1) == 'zzz'
+        assert Dog().bark('Miau').age == 3
+        with pytest.raises(InvocationError):
+            when(Dog).bark('Miau').thenReturn('Miau')
+
+    def test_restores_dummies(self):
+        cat = mock({'name': 'Tom'})
+        template = take(lambda: when(cat).meow().thenReturn('Miau'))
+        assert mock_registry.mock_for(cat) is None
+
+        template.apply()
+        assert cat.meow() == 'Miau'
+        assert cat.name == 'Tom'
+        verify(cat).meow()
+
+    def test_restores_async_shorthands(self):
+        cat = mock({'async meow': lambda: 'Miau'})
+        template = take(lambda: None)
+
+        template.apply()
+        assert asyncio.run(cat.meow()) == 'Miau'
+
+    def test_starts_with_fresh_counts_and_calls(self):
+        when(Dog).bark().thenReturn('Miau')
+        template = snapshot(Dog)
+        Dog().bark()
+        unstub()
+
+        template.apply()
+        with pytest.raises(VerificationError):
+            verify(Dog).bark()
+        with pytest.raises(VerificationError):
+            verifyStubbedInvocationsAreUsed(Dog)
+
+    def test_keeps_expectations(self):
+        template = take(lambda: expect(Dog, times=2).bark().thenReturn('Miau'))
+
+        template.apply()
+        Dog().bark()
+        with pytest.raises(VerificationError):
+            verifyExpectedInteractions(Dog)
+        Dog().bark()
+        verifyExpectedInteractions(Dog)
+        with pytest.raises(InvocationError):
+            Dog().bark()
+
+    def test_keeps_captors(self):
+        arg = captor()
+        template = take(lambda: when(Dog).bark(arg).thenReturn('Miau'))
+
+        template.apply()
+        Dog().bark('Muh')
+        assert arg.value == 'Muh'
+
+    def test_within_a_scope(self):
+        template = take(lambda: when(Dog).bark().thenReturn('Miau'))
+
+        with scope():
+            template.apply()
+            assert Dog().bark() == 'Miau'
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+
+class TestSnapshot:
+    def test_is_immutable(self):
+        template = take(lambda: when(Dog).bark().thenReturn('Miau'))
+        assert isinstance(template, StubTemplate)
+        with pytest.raises(AttributeError):
+            template.mocks = ()  # type: ignore[misc]
+
+    def test_leaves_out_given_answers(self):
+        when(Dog).bark().thenReturn('Miau', 'Muh', 'Mäh')
+        Dog().bark()
+        template = snapshot(Dog)
+        unstub()
+
+        template.apply()
+        assert [Dog().bark() for _ in range(3)] == ['Muh', 'Mäh', 'Mäh']
+
+    def test_captures_only_the_given_objects(self):
+        when(Dog).bark().thenReturn('Miau')
+        when(os.path).exists('/foo').thenReturn(True)
+        template = snapshot('os.path')
+        unstub()
+
+        template.apply()
+        assert os.path.exists('/foo')
+        assert Dog.__dict__['bark'] is ORIGINAL_BARK
+
+    def test_rejects_unregistered_objects(self):
+        with pytest.raises(ArgumentError):
+            snapshot(Dog)
+
+    def test_captures_chains_with_their_stub(self):
+        when(Dog).bark().sleep(1).thenReturn('zzz')
+        template = snapshot()
+        assert len(template.mocks) == 1
@@ -19,7 +19,7 @@
 # THE SOFTWARE.
 
 import pytest
-from mockito import any, mock, times, verify, when
+from mockito import any, mock, times, unstub, verify, when
 
 from .test_base import TestBase
 
@@ -105,6 +105,91 @@ class TestStrictEmptyMocks:
         assert dummy[1] == 2
 
 
+class TestDummyClasses:
+    def testUnconfiguredDummiesShareTheirClass(self):
+        assert type(mock()) is type(mock())
+        assert type(mock(strict=True)) is type(mock(strict=True))
+        assert type(mock()) is not type(mock(strict=True))
+
+    def testStubbingGivesADummyItsOwnClass(self):
+        dummy, other = mock(), mock()
+        when(dummy).__getitem__(1).thenReturn(2)
+
+        assert type(dummy) is not type(other)
+        assert dummy[1] == 2
+        with pytest.raises(TypeError):
+            other[1]
+
+    def testConfigurationDoesNotLeakToOtherDummies(self):
+        dummy = mock({'foo': 'bar'}, strict=True)
+        other = mock(strict=True)
+
+        assert dummy.foo == 'bar'
+        with pytest.raises(AttributeError):
+            other.foo
+
+    def testSpeccedDummiesAreInstancesOfTheirSpec(self):
+        class Foo:
+            def foo(self):
+                pass
+
+        class Bar:
+            pass
+
+        foo, bar = mock(Foo), mock(Bar)
+        assert type(foo) is type(bar)
+        assert isinstance(foo, Foo)
+        assert not isinstance(foo, Bar)
+        assert isinstance(bar, Bar)
+        assert repr(bar) == "<DummyBar id=%s>" % id(bar)
+
+        when(foo).foo().thenReturn(1)
+        assert isinstance(foo, Foo)
+        assert foo.foo() == 1
+
+    def testUnstubbedDummiesKeepWorking(self):
+        dummy = mock()
+        when(dummy).foo().thenReturn(1)
+        unstub(dummy)
+
+        assert dummy.foo() is None
+
+
+class TestAdHocFunctions:
+    def testAreRememberedPerName(self):
+        dummy = mock()
+        assert dummy.foo is dummy.foo
+        assert dummy.foo is not dummy.bar
+
+        dummy.foo(1)
+        dummy.foo(1)
+        verify(dummy, times=2).foo(1)
+
+    def testDoNotShadowLaterStubs(self):
+        dummy = mock()
+        assert dummy.foo() is None
+
+        when(dummy).foo().thenReturn(1)
+        assert dummy.foo() == 1
+
+        unstub(dummy)
+        assert dummy.foo() is None
+
+    def testDoNotShadowLaterPropertyStubs(self):
+        dummy = mock()
+        dummy.foo
+
+        when(dummy).foo.thenReturn(1)
+        assert dummy.foo == 1
+
+    def testAssignedAttributesWinOverStubs(self):
+        dummy = mock()
+        dummy.foo = 'bar'
+
+        when(dummy).foo().thenReturn(1)
+        assert dummy.foo == 'bar'
+
+
 class StubbingTest(TestBase):
     def testStubsWithReturnValue(self):
         theMock = mock()
@@ -286,6 +371,71 @@ class StubbingTest(TestBase):
         self.assertEqual(2, theMock.foo("oh"))
         self.assertEqual(1, theMock.foo("xxx"))
 
+    def testStubsForOtherMethodsDoNotInterfere(self):
+        theMock = mock(strict=True)
+        when(theMock).foo(any()).thenReturn(1)
+        when(theMock).bar(any()).thenReturn(2)
+        when(theMock).foo("oh").thenReturn(3)
+
+        self.assertEqual(3, theMock.foo("oh"))
+        self.assertEqual(1, theMock.foo("xxx"))
+        self.assertEqual(2, theMock.bar("oh"))
+
+    def testUnstubbingOneMethodKeepsStubsOfOtherMethods(self):
+        theMock = mock(strict=True)
+        when(theMock).foo().thenReturn(1)
+        when(theMock).bar().thenReturn(2)
+
+        unstub(theMock.foo)
+        when(theMock).foo().thenReturn(3)
+
+        self.assertEqual(3, theMock.foo())
+        self.assertEqual(2, theMock.bar())
+
+    def testNewerMatcherStubWinsOverOlderLiteralStub(self):
+        theMock = mock()
+        when(theMock).get("a").thenReturn(1)
+        when(theMock).get(any()).thenReturn(2)
+
+        self.assertEqual(2, theMock.get("a"))
+
+    def testNewerLiteralStubWinsOverOlderMatcherStub(self):
+        theMock = mock()
+        when(theMock).get(any()).thenReturn(1)
+        when(theMock).get("a").thenReturn(2)
+        when(theMock).get("b", key=any()).thenReturn(3)
+
+        self.assertEqual(2, theMock.get("a"))
+        self.assertEqual(1, theMock.get("b"))
+
+    def testNewestOfManyLiteralStubsWins(self):
+        theMock = mock()
+        for i in range(100):
+            when(theMock).get("key:%d" % i, default=None).thenReturn(i)
+        when(theMock).get("key:42", default=None).thenReturn("new")
+
+        self.assertEqual("new", theMock.get("key:42", default=None))
+        self.assertEqual(43, theMock.get("key:43", default=None))
+        self.assertEqual(None, theMock.get("key:43"))
+        self.assertEqual(None, theMock.get("key:100", default=None))
+
+    def testEqualLiteralsOfDifferentTypesMatch(self):
+        theMock = mock()
+        when(theMock).get(1).thenReturn("one")
+        when(theMock).get((1, "a")).thenReturn("tuple")
+
+        self.assertEqual("one", theMock.get(1.0))
+        self.assertEqual("one", theMock.get(True))
+        self.assertEqual("tuple", theMock.get((1, "a")))
+
+    def testForgottenLiteralStubNoLongerAnswers(self):
+        theMock = mock()
+        when(theMock).get("a").thenReturn(1)
+        with when(theMock).get("a").thenReturn(2):
+            self.assertEqual(2, theMock.get("a"))
+
+        self.assertEqual(1, theMock.get("a"))
+
     def testDoesNotVerifyStubbedCalls(self):
         theMock = mock()
         when(theMock).foo().thenReturn(1)
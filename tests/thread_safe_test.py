@@ -0,0 +1,170 @@
+import threading
+
+import pytest
+
+from mockito import (
+    ArgumentError,
+    InOrder,
+    captor,
+    ensureNoUnverifiedInteractions,
+    expect,
+    forget_invocations,
+    mock,
+    set_recording,
+    set_thread_safe,
+    verify,
+    verifyExpectedInteractions,
+    when,
+)
+from mockito.mock_registry import mock_registry
+from mockito.recording import ThreadSafeRecorder
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+THREADS = 8
+CALLS = 500
+
+
+def hammer(fn, threads=THREADS):
+    barrier = threading.Barrier(threads)
+    results = [[] for _ in range(threads)]
+
+    def run(n):
+        barrier.wait()
+        for _ in range(CALLS):
+            results[n].append(fn(n))
+
+    workers = [
+        threading.Thread(target=run, args=(n,)) for n in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return [result for results_ in results for result in results_]
+
+
+class TestThreadSafe:
+    def test_counts_all_calls(self):
+        m = mock()
+        when(m).get(...).thenReturn('x')
+        set_thread_safe(m)
+
+        results = hammer(lambda n: m.get(n))
+
+        assert results == ['x'] * THREADS * CALLS
+        verify(m, times=THREADS * CALLS).get(...)
+        for n in range(THREADS):
+            verify(m, times=CALLS).get(n)
+        ensureNoUnverifiedInteractions(m)
+
+    def test_hands_out_each_answer_once(self):
+        m = mock()
+        total = THREADS * CALLS
+        when(m).next_id().thenReturn(*range(total))
+        set_thread_safe(m)
+
+        results = hammer(lambda n: m.next_id())
+
+        assert sorted(results) == list(range(total))
+
+    def test_expectations_count_exactly(self):
+        m = mock()
+        expect(m, times=THREADS * CALLS).get().thenReturn('x')
+        set_thread_safe(m)
+
+        hammer(lambda n: m.get())
+
+        verifyExpectedInteractions(m)
+
+    def test_keeps_the_order_of_the_calls(self):
+        m = mock()
+        set_thread_safe(m)
+        m.foo(1)
+        m.bar(2)
+
+        thread = threading.Thread(target=lambda: m.foo(3))
+        thread.start()
+        thread.join()
+
+        recorded = mock_registry.mock_for(m).invocations
+        assert [i.params for i in recorded] == [(1,), (2,), (3,)]
+
+    def test_works_with_in_order_verification(self):
+        m = mock()
+        set_thread_safe(m)
+        with InOrder(m) as in_order:
+            m.foo(1)
+            m.bar(2)
+
+            in_order.verify(m).foo(1)
+            in_order.verify(m).bar(2)
+
+    def test_answers_may_call_back_into_the_mock(self):
+        m = mock()
+        when(m).outer().thenAnswer(lambda: m.inner())
+        when(m).inner().thenReturn('inner')
+        set_thread_safe(m)
+
+        assert m.outer() == 'inner'
+
+    def test_captors_see_all_values(self):
+        m = mock()
+        arg = captor()
+        when(m).get(arg)
+        set_thread_safe(m)
+
+        hammer(lambda n: m.get(n))
+
+        assert sorted(arg.all_values) == sorted(
+            n for n in range(THREADS) for _ in range(CALLS)
+        )
+
+    def test_works_with_other_recording_policies(self):
+        m = mock()
+        when(m).get(...)
+        set_thread_safe(m)
+        set_recording(m, policy='counts')
+
+        hammer(lambda n: m.get(n))
+
+        recorder = mock_registry.mock_for(m).recorder
+        assert isinstance(recorder, ThreadSafeRecorder)
+        verify(m, times=THREADS * CALLS).get(...)
+        assert len(recorder.invocations) == THREADS
+
+    def test_drops_the_buffers_of_ended_threads(self):
+        m = mock()
+        set_thread_safe(m)
+        hammer(lambda n: m.foo(n))
+        recorder = mock_registry.mock_for(m).recorder
+
+        verify(m, times=THREADS * CALLS).foo(...)
+        assert recorder._buffers == []
+        m.foo(1)
+        assert len(recorder._buffers) == 1
+        verify(m, times=THREADS * CALLS + 1).foo(...)
+
+    def test_forget_invocations_drops_buffered_calls(self):
+        m = mock()
+        set_thread_safe(m)
+        m.foo(1)
+        forget_invocations(m)
+
+        verify(m, times=0).foo(1)
+
+    def test_can_be_switched_off(self):
+        m = mock()
+        set_thread_safe(m)
+        m.foo(1)
+        set_thread_safe(m, enabled=False)
+
+        theMock = mock_registry.mock_for(m)
+        assert theMock.lock is None
+        assert not isinstance(theMock.recorder, ThreadSafeRecorder)
+        verify(m).foo(1)
+
+    def test_requires_a_registered_obj(self):
+        with pytest.raises(ArgumentError):
+            set_thread_safe(object())
@@ -273,6 +273,16 @@ class InorderVerifyTest(VerificationTestBase):
         inorder.verify(self.mock).second()
         inorder.verify(self.mock).third()
 
+    def testContinuesAfterForgottenInvocations(self):
+        self.mock.first()
+        inorder.verify(self.mock).first()
+        forget_invocations(self.mock)
+
+        self.mock.second()
+        self.mock.third()
+        inorder.verify(self.mock).second()
+        inorder.verify(self.mock).third()
+
     def testFailsIfNoInteractions(self):
         self.assertRaises(VerificationError, inorder.verify(self.mock).first)
 
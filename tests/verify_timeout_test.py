@@ -0,0 +1,230 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mockito import (
+    ArgumentError,
+    captor,
+    ensureNoUnverifiedInteractions,
+    mock,
+    set_recording,
+    set_thread_safe,
+    verify,
+    verify_async,
+)
+from mockito import verification
+from mockito.mock_registry import mock_registry
+from mockito.verification import VerificationError
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+def later(fn, delay=0.05):
+    thread = threading.Timer(delay, fn)
+    thread.start()
+    return thread
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestVerifyWithTimeout:
+    def test_passes_right_away_if_already_called(self):
+        m = mock()
+        m.foo(1)
+
+        start = time.monotonic()
+        verify(m, timeout=5).foo(1)
+        assert time.monotonic() - start < 1
+
+    def test_waits_for_a_call_from_another_thread(self):
+        m = mock()
+        thread = later(lambda: m.foo(1))
+
+        start = time.monotonic()
+        verify(m, timeout=5).foo(1)
+        assert time.monotonic() - start < 1
+        thread.join()
+
+    def test_waits_until_called_often_enough(self):
+        m = mock()
+
+        def call_thrice():
+            for n in range(3):
+                time.sleep(0.01)
+                m.foo(n)
+
+        thread = later(call_thrice)
+        verify(m, times=3, timeout=5).foo(...)
+        thread.join()
+
+    def test_counts_calls_made_while_looking(self):
+        m = mock()
+        calls = 20_000
+
+        def run():
+            for n in range(calls):
+                m.foo(n)
+
+        thread = later(run, 0)
+        verify(m, times=calls, timeout=10).foo(...)
+        thread.join()
+
+    def test_ignores_other_calls(self):
+        m = mock()
+
+        def calls():
+            m.bar(1)
+            m.foo(2)
+            m.foo(1)
+
+        thread = later(calls)
+        verify(m, timeout=5).foo(1)
+        thread.join()
+
+    def test_fails_after_the_timeout(self):
+        m = mock()
+        m.foo(2)
+
+        start = time.monotonic()
+        with pytest.raises(VerificationError) as exc:
+            verify(m, timeout=0.1).foo(1)
+        assert time.monotonic() - start >= 0.1
+        assert "Wanted but not invoked" in str(exc.value)
+
+    def test_fails_on_too_many_calls(self):
+        m = mock()
+        m.foo(1)
+        m.foo(1)
+
+        with pytest.raises(VerificationError):
+            verify(m, times=1, timeout=0.05).foo(1)
+
+    def test_marks_the_calls_as_verified(self):
+        m = mock()
+        thread = later(lambda: m.foo(1))
+
+        verify(m, timeout=5).foo(1)
+        thread.join()
+        ensureNoUnverifiedInteractions(m)
+
+    def test_fills_captors(self):
+        m = mock()
+        arg = captor()
+        thread = later(lambda: m.foo(42))
+
+        verify(m, timeout=5).foo(arg)
+        thread.join()
+        assert arg.value == 42
+
+    def test_detaches_from_the_mock(self):
+        m = mock()
+        m.foo(1)
+
+        verify(m, timeout=5).foo(1)
+        assert mock_registry.mock_for(m)._observers == []
+
+    @pytest.mark.parametrize('policy', ['counts', 3])
+    def test_works_with_other_recording_policies(self, policy):
+        m = mock()
+        set_recording(m, policy=policy)
+        thread = later(lambda: (m.foo(1), m.foo(1)))
+
+        verify(m, times=2, timeout=5).foo(1)
+        thread.join()
+
+    def test_works_with_thread_safe_mocks(self):
+        m = mock()
+        set_thread_safe(m)
+        threads = [later(lambda: m.foo(1), 0.01) for _ in range(8)]
+
+        verify(m, times=8, timeout=5).foo(1)
+        for thread in threads:
+            thread.join()
+
+    @pytest.mark.parametrize('timeout', [-1, 'soon'])
+    def test_rejects_invalid_timeouts(self, timeout):
+        m = mock()
+        with pytest.raises((ArgumentError, TypeError)):
+            verify(m, timeout=timeout).foo()
+
+    def test_cannot_wait_in_order(self):
+        m = mock()
+        with pytest.raises(ArgumentError):
+            verify(m, inorder=True, timeout=1).foo()
+
+
+@pytest.mark.parametrize('mode, satisfied, unsatisfied', [
+    (verification.Times(2), [2], [0, 1, 3]),
+    (verification.AtLeast(2), [2, 3], [0, 1]),
+    (verification.AtLeast(0), [1], [0]),
+    (verification.AtMost(1), [0, 1], [2]),
+    (verification.Between(1, 2), [1, 2], [0, 3]),
+    (verification.InOrder(verification.Times(1)), [1], [0, 2]),
+])
+def test_modes_tell_if_counts_satisfy_them(mode, satisfied, unsatisfied):
+    assert all(mode.satisfied_by(n) for n in satisfied)
+    assert not any(mode.satisfied_by(n) for n in unsatisfied)
+
+
+class Twice(verification.VerificationMode):
+    def verify(self, invocation, actual_count):
+        if actual_count == 0:
+            raise VerificationError(
+                verification.error_message_for_unmatched_invocation(
+                    invocation
+                )
+            )
+        if actual_count != 2:
+            raise VerificationError("%s not twice" % invocation)
+
+
+def test_modes_which_only_verify_tell_it_by_verifying():
+    mode = Twice()
+    assert mode.satisfied_by(2)
+    assert not any(mode.satisfied_by(n) for n in [0, 1, 3])
+
+
+class TestVerifyAsync:
+    def test_waits_for_a_call_from_another_task(self):
+        m = mock()
+
+        async def main():
+            async def call():
+                await asyncio.sleep(0.05)
+                m.foo(1)
+
+            task = asyncio.ensure_future(call())
+            await verify_async(m, timeout=5).foo(1)
+            await task
+
+        run(main())
+
+    def test_waits_for_a_call_from_another_thread(self):
+        m = mock()
+
+        async def main():
+            thread = later(lambda: m.foo(1))
+            await verify_async(m, timeout=5).foo(1)
+            thread.join()
+
+        run(main())
+
+    def test_fails_after_the_timeout(self):
+        m = mock()
+
+        with pytest.raises(VerificationError):
+            run(verify_async(m, timeout=0.05).foo(1))
+        assert mock_registry.mock_for(m)._observers == []
+
+    def test_checks_right_away_without_timeout(self):
+        m = mock()
+        m.foo(1)
+
+        run(verify_async(m).foo(1))
+        with pytest.raises(VerificationError):
+            run(verify_async(m).bar())
@@ -0,0 +1,159 @@
+import pytest
+
+from mockito import (
+    ArgumentError,
+    VerificationError,
+    any as any_,
+    arg_that,
+    captor,
+    ensureNoUnverifiedInteractions,
+    mock,
+    verifying,
+    when,
+)
+
+
+pytestmark = pytest.mark.usefixtures("unstub")
+
+
+class Cat:
+    def meow(self):
+        pass
+
+    def purr(self, volume):
+        pass
+
+
+class TestVerifying:
+    def test_passes_if_all_wanted_calls_were_made(self):
+        cat = mock()
+        cat.meow()
+        cat.purr(1)
+        cat.purr(2)
+
+        with verifying(cat) as v:
+            v.meow()
+            v(times=2).purr(...)
+            v(atleast=1).purr(1)
+            v(atmost=1).purr(2)
+            v(between=(0, 1)).purr(3)
+            v(times=0).eat()
+
+    def test_defaults_to_times_one(self):
+        cat = mock()
+        cat.meow()
+        cat.meow()
+
+        with pytest.raises(VerificationError) as exc:
+            with verifying(cat) as v:
+                v.meow()
+
+        assert "Wanted times: 1, actual times: 2" in str(exc.value)
+
+    def test_reports_all_failures_together(self):
+        cat = mock()
+        cat.meow()
+        cat.purr(1)
+
+        with pytest.raises(VerificationError) as exc:
+            with verifying(cat) as v:
+                v.meow()
+                v(times=2).purr(...)
+                v.eat('fish')
+
+        message = str(exc.value)
+        assert "2 of 3 wanted calls failed verification" in message
+        assert "purr(...):\n    Wanted times: 2, actual times: 1" in message
+        assert "eat('fish'):\n    Wanted but not invoked" in message
+        assert "meow():" not in message
+
+    def test_checks_nothing_if_the_block_raises(self):
+        cat = mock()
+
+        with pytest.raises(ZeroDivisionError):
+            with verifying(cat) as v:
+                v.meow()
+                1 / 0
+
+    def test_marks_the_calls_as_verified(self):
+        cat = mock()
+        cat.meow()
+        cat.purr(1)
+
+        with verifying(cat) as v:
+            v.meow()
+            v.purr(1)
+
+        ensureNoUnverifiedInteractions(cat)
+
+    def test_works_on_stubbed_classes(self):
+        when(Cat).purr(...)
+        tom = Cat()
+        tom.purr(1)
+
+        with verifying(Cat) as v:
+            v.purr(1)
+
+        with pytest.raises(VerificationError):
+            with verifying(Cat) as v:
+                v.purr(2)
+
+    def test_requires_a_registered_obj(self):
+        with pytest.raises(ArgumentError):
+            verifying(object())
+
+    def test_rejects_bad_verification_arguments(self):
+        cat = mock()
+        with pytest.raises(ArgumentError):
+            verifying(cat)(times=-1)
+
+    @pytest.mark.parametrize("method_name", ["_mock", "_wanted"])
+    def test_verifies_methods_named_like_its_internals(self, method_name):
+        cat = mock()
+        getattr(cat, method_name)(1)
+
+        with verifying(cat) as v:
+            getattr(v, method_name)(1)
+
+        with pytest.raises(VerificationError):
+            with verifying(cat) as v:
+                getattr(v, method_name)(2)
+
+    def test_matches_calls_with_equal_arguments_only_once(self):
+        seen = []
+
+        def is_small(value):
+            seen.append(value)
+            return value < 10
+
+        cat = mock()
+        for volume in (1, 2, 1, 2, 1, 20):
+            cat.purr(volume)
+
+        with verifying(cat) as v:
+            v(times=5).purr(arg_that(is_small))
+            v(times=6).purr(...)
+
+        assert seen == [1, 2, 20]
+
+    def test_tells_apart_equal_arguments_of_other_types(self):
+        cat = mock()
+        cat.purr(1)
+        cat.purr(True)
+
+        with verifying(cat) as v:
+            v(times=1).purr(any_(bool))
+            v(times=2).purr(any_(int))
+
+    def test_captures_the_arguments_in_call_order(self):
+        cat = mock()
+        for volume in (1, 2, 1, 'loud'):
+            cat.purr(volume)
+
+        volumes = captor()
+        with verifying(cat) as v:
+            v(times=4).purr(volumes)
+            v(times=2).purr(1)
+            v(times=3).purr(any_(int))
+
+        assert volumes.all_values == [1, 2, 1, 'loud']
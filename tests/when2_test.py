@@ -132,6 +132,34 @@ class TestFancyObjResolver:
 
         verify(os.path).exists('/Foo')
 
+    def testResolvesTheSameCallSiteAgainstTheCurrentLocals(self):
+        class A(object):
+            @staticmethod
+            def f():
+                return 'A'
+
+        class B(object):
+            @staticmethod
+            def f():
+                return 'B'
+
+        for host in (A, B):
+            when2(host.f).thenReturn('stubbed')
+
+        assert A.f() == 'stubbed'
+        assert B.f() == 'stubbed'
+
+    def testParsesEachCallSiteOnce(self):
+        from mockito import utils
+
+        utils._call_sites.clear()
+        for _ in range(3):
+            when2(os.path.commonprefix, '/Foo').thenReturn(True)
+
+        assert list(utils._call_sites.values()).count(
+            ('os', 'path', 'commonprefix')
+        ) == 1
+
     class TestRejections:
         def testA(self):
             with pytest.raises(TypeError) as exc: